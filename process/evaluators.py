@@ -99,23 +99,86 @@ class Evaluators:
         the derivative of constraint j w.r.t. variable i
         :rtype: tuple
         """
-        xfor = np.zeros(n, dtype=np.float64, order="F")
-        xbac = np.zeros(n, dtype=np.float64, order="F")
-        cfor = np.zeros(m, dtype=np.float64, order="F")
-        cbac = np.zeros(m, dtype=np.float64, order="F")
+        fgrd, cnorm = self._finite_difference_gradients(n, m, xv, lcnorm)
+
+        # Additional evaluation call to ensure that final result is consistent
+        # with the correct iteration variable values.
+        # If this is not done, the value of the nth (i.e. final) iteration
+        # variable in the solution vector is inconsistent with its value
+        # shown elsewhere in the output file, which is a factor (1-epsfcn)
+        # smaller (i.e. its final xbac value).
+        self.caller.call_models(xv, m)
+
+        return fgrd, cnorm
+
+    def fcnvmc_fused(self, n, m, xv, lcnorm):
+        """Function and gradient evaluator for VMCON.
+
+        Evaluates the objective and constraint functions and their gradients at
+        the n-dimensional point of interest xv in a single pass. The gradients
+        are calculated first, so that the final evaluation at xv both provides
+        the objective and constraint values and leaves the models in a state
+        consistent with xv. This saves one full models evaluation compared to
+        calling fcnvmc1 and fcnvmc2 separately.
+
+        :param n: number of variables
+        :type n: int
+        :param m: number of constraints
+        :type m: int
+        :param xv: scaled variable values, length n
+        :type xv: numpy.array
+        :param lcnorm: number of columns in cnorm
+        :type lcnorm: int
+        :return: tuple containing: objf objective function, conf(m) constraint
+        functions, fgrd(n) gradient of the objective function, cnorm(lcnorm, m)
+        constraint gradients in column-major order
+        :rtype: tuple
+        """
+        evaluators = type(self)
+        if (
+            evaluators.fcnvmc1 is not Evaluators.fcnvmc1
+            or evaluators.fcnvmc2 is not Evaluators.fcnvmc2
+        ):
+            # Overridden evaluators: call them rather than fusing the function
+            # and gradient evaluations
+            objf, conf = self.fcnvmc1(n, m, xv, 0)
+            fgrd, cnorm = self.fcnvmc2(n, m, xv, lcnorm)
+            # Column-major, as from the finite differences below, so that the
+            # transposed constraint gradients are C-contiguous
+            return objf, conf, fgrd, np.asfortranarray(cnorm)
+
+        fgrd, cnorm = self._finite_difference_gradients(n, m, xv, lcnorm)
+        objf, conf = self.fcnvmc1(n, m, xv, 0)
+
+        return objf, conf, fgrd, cnorm
+
+    def _finite_difference_gradients(self, n, m, xv, lcnorm):
+        """Calculate gradients using central finite differences about xv.
+
+        N.B. this leaves the models evaluated at the final backward step, not
+        at xv.
+
+        :param n: number of variables
+        :type n: int
+        :param m: number of constraints
+        :type m: int
+        :param xv: scaled variable values, length n
+        :type xv: numpy.array
+        :param lcnorm: number of columns in cnorm
+        :type lcnorm: int
+        :return: fgrd (numpy.array (n)) gradient of the objective function
+        cnorm (numpy.array (lcnorm, m)) constraint gradients
+        :rtype: tuple
+        """
+        xfor = np.array(xv[:n], dtype=np.float64, order="F")
+        xbac = np.array(xv[:n], dtype=np.float64, order="F")
         fgrd = np.zeros(n, dtype=np.float64, order="F")
         cnorm = np.zeros((lcnorm, m), dtype=np.float64, order="F")
 
-        ffor = 0.0
-        fbac = 0.0
-
         for i in range(n):
-            for j in range(n):
-                xfor[j] = xv[j]
-                xbac[j] = xv[j]
-                if i == j:
-                    xfor[i] = xv[j] * (1.0 + numerics.epsfcn)
-                    xbac[i] = xv[j] * (1.0 - numerics.epsfcn)
+            # Perturb only the ith variable; all others stay at xv
+            xfor[i] = xv[i] * (1.0 + numerics.epsfcn)
+            xbac[i] = xv[i] * (1.0 - numerics.epsfcn)
 
             # Evaluate at (x+dx)
             ffor, cfor = self.caller.call_models(xfor, m)
@@ -124,17 +187,11 @@ class Evaluators:
             fbac, cbac = self.caller.call_models(xbac, m)
 
             # Calculate finite difference gradients
-            fgrd[i] = (ffor - fbac) / (xfor[i] - xbac[i])
+            dx = xfor[i] - xbac[i]
+            fgrd[i] = (ffor - fbac) / dx
+            cnorm[i, :] = (cfor - cbac) / dx
 
-            for j in range(m):
-                cnorm[i, j] = (cfor[j] - cbac[j]) / (xfor[i] - xbac[i])
-
-        # Additional evaluation call to ensure that final result is consistent
-        # with the correct iteration variable values.
-        # If this is not done, the value of the nth (i.e. final) iteration
-        # variable in the solution vector is inconsistent with its value
-        # shown elsewhere in the output file, which is a factor (1-epsfcn)
-        # smaller (i.e. its xbac value above).
-        self.caller.call_models(xv, m)
+            xfor[i] = xv[i]
+            xbac[i] = xv[i]
 
         return fgrd, cnorm
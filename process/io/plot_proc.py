@@ -3628,9 +3628,7 @@ def plot_magnetics_info(axis, mfile_data, scan):
         i_tf_sc_mat = 0
 
     if i_tf_sc_mat > 0:
-        tftype = SUPERCONDUCTING_TF_TYPES[
-            int(mfile_data.data["i_tf_sc_mat"].get_scan(scan))
-        ]
+        tftype = SUPERCONDUCTING_TF_TYPES[i_tf_sc_mat]
     else:
         tftype = "Resistive Copper"
 
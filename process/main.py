@@ -170,7 +170,10 @@ class Process:
             default="vmcon",
             metavar="solver_name",
             type=str,
-            help="Specify which solver to use: only 'vmcon' at the moment",
+            help=(
+                "Specify which solver to use: 'vmcon' (default), 'vmcon_bounded', "
+                "'vmcon_portfolio' or 'fsolve'"
+            ),
         )
         parser.add_argument(
             "-v",
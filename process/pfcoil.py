@@ -3246,17 +3246,14 @@ class PFCoil:
                 arguments = (isumat, jsc, bmax, strain, bc20m, tc0m)
 
             another_estimate = 2 * thelium
-            t_zero_margin, root_result = optimize.newton(
+            t_zero_margin = optimize.newton(
                 superconductors.current_density_margin,
                 thelium,
-                fprime=None,
                 args=arguments,
                 tol=1.0e-06,
                 maxiter=50,
-                fprime2=None,
                 x1=another_estimate,
                 rtol=1.0e-6,
-                full_output=True,
                 disp=False,
             )
             tmarg = t_zero_margin - thelium
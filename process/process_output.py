@@ -37,6 +37,18 @@ def ovarre(file, descr: str, varnam: str, value, output_flag: str = ""):
         ovarre(constants.mfile, descr, varnam, value, output_flag)
 
 
+def ovarre_rows(file, rows):
+    """Write a table of real variables, one ovarre line per row.
+
+    :param file: output unit
+    :type file: int
+    :param rows: (descr, varnam, value[, output_flag]) for each variable
+    :type rows: Iterable[tuple]
+    """
+    for row in rows:
+        ovarre(file, *row)
+
+
 def ocosts(file, varnam: str, descr: str, value):
     ovarre(file, descr, varnam, value)
 
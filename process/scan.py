@@ -27,6 +27,7 @@ from process.fortran import (
     scan_module,
     tfcoil_variables,
 )
+from process.solver import VMCON_SOLVERS
 from process.solver_handler import SolverHandler
 from process.utilities.f2py_string_patch import (
     f2py_compatible_to_string,
@@ -226,7 +227,7 @@ class Scan:
             error_handling.report_error(132)
 
             # Error code handler for VMCON
-            if self.solver == "vmcon":
+            if self.solver in VMCON_SOLVERS:
                 self.verror(ifail)
             process_output.oblnkl(constants.nout)
             process_output.oblnkl(constants.iotty)
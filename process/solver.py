@@ -2,7 +2,11 @@
 
 import importlib
 import logging
+import multiprocessing
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from pyvmcon import (
@@ -14,6 +18,7 @@ from pyvmcon import (
     solve,
 )
 from scipy.optimize import fsolve
+from scipy.stats import qmc
 
 from process.evaluators import Evaluators
 from process.exceptions import ProcessValueError
@@ -22,6 +27,14 @@ from process.utilities.f2py_string_patch import f2py_compatible_to_string
 
 logger = logging.getLogger(__name__)
 
+# Solver error codes for VMCON convergence failures; any other
+# VMCONConvergenceException is reported as 2
+_INFO_MAP = {LineSearchConvergenceException: 3, QSPSolverException: 5}
+
+# Solver names that run VMCON, so get its epsfcn and Hessian retries and its
+# error code diagnostics
+VMCON_SOLVERS = frozenset({"vmcon", "vmcon_portfolio"})
+
 
 class _Solver(ABC):
     """Base class for different solver implementations.
@@ -51,7 +64,7 @@ class _Solver(ABC):
         :param x_0: optimisation parameters vector
         :type x_0: np.ndarray
         """
-        self.x_0 = x_0
+        self.x_0 = np.ascontiguousarray(x_0, dtype=np.float64)
 
     def set_bounds(
         self,
@@ -67,25 +80,41 @@ class _Solver(ABC):
         :param bndu: upper bounds for the optimisation parameters
         :type bndu: np.ndarray
         :param ilower: array of 0s and 1s to activate lower bounds on
-        optimsation parameters in x
+        optimsation parameters in x, defaults to finite bounds being active
         :type ilower: np.ndarray, optional
         :param iupper: array of 0s and 1s to activate upper bounds on
-        optimsation parameters in x
+        optimsation parameters in x, defaults to finite bounds being active
         :type iupper: np.ndarray, optional
         """
-        self.bndl = bndl
-        self.bndu = bndu
+        self.bndl = np.ascontiguousarray(bndl, dtype=np.float64)
+        self.bndu = np.ascontiguousarray(bndu, dtype=np.float64)
+
+        # The built-in solvers take bndl/bndu directly; the switches are only
+        # derived if something asks for them
+        self._ilower = ilower
+        self._iupper = iupper
+
+    @property
+    def ilower(self) -> np.ndarray:
+        """Lower bound switches: 1 where a lower bound is active.
+
+        :return: lower bound switches
+        :rtype: np.ndarray
+        """
+        if self._ilower is None:
+            return np.isfinite(self.bndl).astype(int)
+        return self._ilower
 
-        # TODO Remove ilower/iupper and use finite vs. infinite values in bndl/bndu
-        # instead to determine defined vs. undefined bounds
-        # If lower and upper bounds switch arrays aren't specified, set all bounds
-        # to defined
-        if ilower is None and iupper is None:
-            ilower = np.ones(bndl.shape[0], dtype=int)
-            iupper = np.ones(bndu.shape[0], dtype=int)
+    @property
+    def iupper(self) -> np.ndarray:
+        """Upper bound switches: 1 where an upper bound is active.
 
-        self.ilower = ilower
-        self.iupper = iupper
+        :return: upper bound switches
+        :rtype: np.ndarray
+        """
+        if self._iupper is None:
+            return np.isfinite(self.bndu).astype(int)
+        return self._iupper
 
     def set_constraints(self, m: int, meq: int) -> None:
         """Set the total number of constraints and equality constraints.
@@ -124,24 +153,57 @@ class _Solver(ABC):
 
 
 class VmconProblem(AbstractProblem):
+    """Adapt the PROCESS evaluators to the pyvmcon problem interface.
+
+    Evaluations are cached on the exact bytes of ``x``: the line search
+    evaluates ``x + delta`` and, when the full step is accepted, the next
+    iteration asks for the same point again. The cache is small because VMCON
+    never revisits older points.
+    """
+
+    cache_size = 8
+
     def __init__(self, evaluator, nequality, ninequality) -> None:
         self._evaluator = evaluator
         self._nequality = nequality
         self._ninequality = ninequality
+        # Fixed for the whole solve, so computed once rather than per call
+        self._m = nequality + ninequality
+        self._cache: OrderedDict[bytes, Result] = OrderedDict()
+
+    def invalidate(self) -> None:
+        """Discard cached evaluations, e.g. when the model inputs change."""
+        self._cache.clear()
 
     def __call__(self, x: np.ndarray) -> Result:
-        n = x.shape[0]
-        objf, conf = self._evaluator.fcnvmc1(n, self.total_constraints, x, 0)
-        fgrd, cnorm = self._evaluator.fcnvmc2(n, self.total_constraints, x, n)
+        key = x.tobytes()
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            return result
 
-        return Result(
+        n = x.shape[0]
+        neq = self._nequality
+        objf, conf, fgrd, cnorm = self._evaluator.fcnvmc_fused(n, self._m, x, n)
+
+        # The slices are views of the evaluator's arrays, so no copies are
+        # made; cnorm is column-major, so its transposed slices are the
+        # C-contiguous (constraints, variables) Jacobians pyvmcon expects.
+        # Each call must return fresh arrays: pyvmcon holds on to the
+        # previous Result for the BFGS update, and results are also cached.
+        result = Result(
             objf,
             fgrd,
-            conf[: self.num_equality],
-            cnorm[:, : self.num_equality].T,
-            conf[self.num_equality :],
-            cnorm[:, self.num_equality :].T,
+            conf[:neq],
+            cnorm[:, :neq].T,
+            conf[neq:],
+            cnorm[:, neq:].T,
         )
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return result
 
     @property
     def num_equality(self) -> int:
@@ -155,10 +217,22 @@ class VmconProblem(AbstractProblem):
 class Vmcon(_Solver):
     """New VMCON implementation.
 
+    If stall_rtol is positive, a feasible point is also accepted once the
+    relative change in the objective has stayed below stall_rtol for
+    stall_iterations consecutive iterations. Feasible means the inequality
+    constraints are satisfied and the equality constraint residues are below
+    stall_residual.
+
     :param _Solver: Solver base class
     :type _Solver: _Solver
     """
 
+    stall_rtol = 0.0
+    stall_iterations = 5
+    stall_residual = 1.0e-8
+    # Print the convergence parameter on the terminal at each iteration
+    print_progress = True
+
     def solve(self) -> int:
         """Optimise using new VMCON.
 
@@ -167,30 +241,42 @@ class Vmcon(_Solver):
         """
         problem = VmconProblem(self.evaluators, self.meq, self.m - self.meq)
 
+        # pyvmcon seeds B with the identity when none is given, so only
+        # materialise B for a non-unit scaling
         bb = None
-        if self.b is not None:
-            bb = np.identity(numerics.nvar) * self.b
+        if self.b is not None and self.b != 1.0:
+            bb = np.zeros((numerics.nvar, numerics.nvar))
+            np.fill_diagonal(bb, self.b)
+
+        convergence_param_j = np.inf
+        objf_prev = None
+        n_stalled = 0
 
         def _solver_callback(i: int, _result, _x, convergence_param: float):
+            nonlocal convergence_param_j
+            convergence_param_j = convergence_param
+
             numerics.nviter = i + 1
             global_variables.convergence_parameter = convergence_param
-            print(
-                f"{i + 1} | Convergence Parameter: {convergence_param:.3E}",
-                end="\r",
-                flush=True,
-            )
-
-        def _ineq_cons_satisfied(
+            if self.print_progress:
+                print(
+                    f"{i + 1} | Convergence Parameter: {convergence_param:.3E}",
+                    end="\r",
+                    flush=True,
+                )
+
+        def _converged(
             result: Result,
             _x: np.ndarray,
             _delta: np.ndarray,
             _lambda_eq: np.ndarray,
             _lambda_in: np.ndarray,
         ) -> bool:
-            """Check that inequality constraints are satisfied.
+            """Check whether the solution has converged.
 
-            This additional convergence criterion ensures that solutions have
-            satisfied inequality constraints.
+            This replaces pyvmcon's convergence criterion so that solutions are
+            only accepted once they satisfy the inequality constraints, and so
+            that feasible solutions with a stalled objective can be accepted.
 
             :param result: evaluation of current optimisation parameter vector
             :type result: Result
@@ -202,11 +288,35 @@ class Vmcon(_Solver):
             :type _lambda_eq: np.ndarray
             :param _lambda_in: inequality Lagrange multipliers
             :type _lambda_in: np.ndarray
-            :return: True if inequality constraints satisfied
+            :return: True if converged
             :rtype: bool
             """
+            nonlocal objf_prev, n_stalled
+
             # Check all ineqs positive, i.e. satisfied
-            return bool(np.all(result.ie >= 0.0))
+            ineqs_satisfied = bool(np.all(result.ie >= 0.0))
+
+            if self.stall_rtol > 0.0:
+                feasible = (
+                    ineqs_satisfied
+                    and np.sqrt(np.sum(result.eq**2)) < self.stall_residual
+                )
+                if (
+                    feasible
+                    and objf_prev is not None
+                    and abs(result.f - objf_prev)
+                    <= self.stall_rtol * max(1.0, abs(objf_prev))
+                ):
+                    n_stalled += 1
+                else:
+                    n_stalled = 0
+                objf_prev = result.f
+
+                if n_stalled >= self.stall_iterations:
+                    logger.info("Objective function has stalled at a feasible point")
+                    return True
+
+            return ineqs_satisfied and convergence_param_j < self.tolerance
 
         try:
             x, _, _, res = solve(
@@ -219,15 +329,13 @@ class Vmcon(_Solver):
                 qsp_options={"eps_rel": 1e-1, "adaptive_rho_interval": 25},
                 initial_B=bb,
                 callback=_solver_callback,
-                additional_convergence=_ineq_cons_satisfied,
+                additional_convergence=_converged,
+                overwrite_convergence_criteria=True,
             )
         except VMCONConvergenceException as e:
-            if isinstance(e, LineSearchConvergenceException):
-                self.info = 3
-            elif isinstance(e, QSPSolverException):
-                self.info = 5
-            else:
-                self.info = 2
+            self.info = next(
+                (info for cls, info in _INFO_MAP.items() if isinstance(e, cls)), 2
+            )
 
             logger.warning(str(e))
 
@@ -248,11 +356,12 @@ class Vmcon(_Solver):
 
         # print a blank line because of the carridge return
         # in the callback
-        print()
+        if self.print_progress:
+            print()
 
         self.x = x
         self.objf = res.f
-        self.conf = np.hstack((res.eq, res.ie))
+        self.conf = np.concatenate((res.eq, res.ie))
 
         return self.info
 
@@ -273,6 +382,156 @@ class VmconBounded(Vmcon):
         self.x_0 = x_0
 
 
+# Solver run by a VmconPortfolio worker process, set by the executor's
+# initializer. Workers are only ever forked, so the solver (with its evaluators
+# and the Fortran module state) is inherited rather than pickled.
+_portfolio_solver: "VmconPortfolio | None" = None
+
+
+def _init_portfolio_worker(solver: "VmconPortfolio") -> None:
+    """Hand the portfolio to a forked worker process.
+
+    The worker's progress output is silenced, as it would interleave with the
+    other workers' on the terminal.
+
+    :param solver: portfolio whose starts the worker runs
+    :type solver: VmconPortfolio
+    """
+    global _portfolio_solver
+    _portfolio_solver = solver
+    _portfolio_solver.print_progress = False
+
+
+def _portfolio_worker(x_0: np.ndarray) -> tuple:
+    """Run a single start of the worker's portfolio.
+
+    :param x_0: initial optimisation parameter vector for this start
+    :type x_0: np.ndarray
+    :return: solver error code, solution, objective, constraints, iterations
+        and convergence parameter
+    :rtype: tuple
+    """
+    return _portfolio_solver.run_start(x_0)
+
+
+class VmconPortfolio(Vmcon):
+    """Run VMCON from several perturbed initial points.
+
+    The first start is always the unperturbed x_0; the remainder are Latin
+    hypercube samples within a relative perturbation of x_0, clipped to the
+    bounds. The feasible solution with the lowest objective is kept; if no
+    start converges, the result of the unperturbed start is returned so error
+    reporting is unchanged.
+
+    The starts run in parallel in forked worker processes. Where fork is
+    unavailable, or other threads are running that a fork could deadlock,
+    they run one after another instead. Either way, the models are evaluated
+    at the kept solution afterwards, so that their state is that of the kept
+    start rather than of whichever start ran last.
+
+    :param Vmcon: VMCON solver
+    :type Vmcon: Vmcon
+    """
+
+    perturbation = 0.1
+    seed = 1
+
+    def __init__(self, starts: int = 4) -> None:
+        """Initialise the portfolio.
+
+        :param starts: number of starts to run, defaults to 4
+        :type starts: int, optional
+        """
+        super().__init__()
+        self.starts = starts
+
+    def initial_points(self) -> np.ndarray:
+        """Generate the initial points of each start.
+
+        :return: initial points, one per row
+        :rtype: np.ndarray
+        """
+        x_0 = np.asarray(self.x_0, dtype=float)
+        points = np.tile(x_0, (self.starts, 1))
+
+        if self.starts > 1:
+            sampler = qmc.LatinHypercube(d=x_0.shape[0], seed=self.seed)
+            u = sampler.random(self.starts - 1)
+            points[1:] *= 1.0 + self.perturbation * (2.0 * u - 1.0)
+            np.clip(points[1:], self.bndl, self.bndu, out=points[1:])
+
+        return points
+
+    def run_start(self, x_0: np.ndarray) -> tuple:
+        """Run VMCON from a single initial point.
+
+        :param x_0: initial optimisation parameter vector for this start
+        :type x_0: np.ndarray
+        :return: solver error code, solution, objective, constraints, iterations
+            and convergence parameter
+        :rtype: tuple
+        """
+        self.x_0 = x_0
+        info = Vmcon.solve(self)
+
+        return (
+            info,
+            self.x,
+            self.objf,
+            self.conf,
+            int(numerics.nviter),
+            float(global_variables.convergence_parameter),
+        )
+
+    def solve(self) -> int:
+        """Optimise from each initial point and keep the best solution.
+
+        :return: solver error code
+        :rtype: int
+        """
+        if self.starts == 1:
+            return super().solve()
+
+        x_0 = self.x_0
+        points = self.initial_points()
+        try:
+            if (
+                "fork" in multiprocessing.get_all_start_methods()
+                and threading.active_count() == 1
+            ):
+                with ProcessPoolExecutor(
+                    max_workers=self.starts,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_portfolio_worker,
+                    initargs=(self,),
+                ) as executor:
+                    results = list(executor.map(_portfolio_worker, points))
+            else:
+                results = [self.run_start(point) for point in points]
+        finally:
+            self.x_0 = x_0
+
+        for i, (info, _, objf, *_) in enumerate(results):
+            print(f"Start {i + 1} of {self.starts}: error code {info}, objf = {objf}")
+
+        feasible = [r for r in results if r[0] == 1]
+        best = min(feasible, key=lambda r: r[2]) if feasible else results[0]
+
+        (
+            self.info,
+            self.x,
+            self.objf,
+            self.conf,
+            numerics.nviter,
+            global_variables.convergence_parameter,
+        ) = best
+
+        # Leave the models evaluated at the kept solution
+        self.evaluators.fcnvmc1(self.x.shape[0], self.m, self.x, 0)
+
+        return self.info
+
+
 class FSolve(_Solver):
     """Solve equality constraints to ensure model consistency.
 
@@ -331,6 +590,8 @@ def get_solver(solver_name: str = "vmcon") -> _Solver:
         solver = Vmcon()
     elif solver_name == "vmcon_bounded":
         solver = VmconBounded()
+    elif solver_name == "vmcon_portfolio":
+        solver = VmconPortfolio()
     elif solver_name == "fsolve":
         solver = FSolve()
     else:
@@ -1,7 +1,7 @@
 from process.evaluators import Evaluators
 from process.fortran import numerics
 from process.iteration_variables import load_iteration_variables, load_scaled_bounds
-from process.solver import get_solver
+from process.solver import VMCON_SOLVERS, get_solver
 
 
 class SolverHandler:
@@ -50,7 +50,7 @@ class SolverHandler:
         ifail = self.solver.solve()
 
         # If VMCON optimisation has failed then try altering value of epsfcn
-        if self.solver_name == "vmcon":
+        if self.solver_name in VMCON_SOLVERS:
             if ifail != 1:
                 print("Trying again with new epsfcn")
                 # epsfcn is only used in evaluators.Evaluators()
@@ -1,8 +1,9 @@
-import copy
 import logging
+import math
+import sys
 
+import numba
 import numpy as np
-from scipy import optimize
 
 import process.superconductors as superconductors
 from process import process_output as po
@@ -38,7 +39,63 @@ SUPERCONDUCTING_TF_TYPES = {
 
 
 RMU0 = constants.rmu0
-EPS = np.finfo(1.0).eps
+EPS = sys.float_info.epsilon
+# Area of a circle per squared diameter
+_PI_OVER_FOUR = math.pi / 4.0e0
+# Square minus inscribed circle area per squared corner radius
+_FOUR_MINUS_PI = 4.0e0 - math.pi
+# CroCo cable space area per squared strand diameter (a circle 3 diameters across)
+_NINE_PI_OVER_FOUR = 2.25 * math.pi
+# Vacuum permeability over pi, the prefactor of the surrogate self-inductances
+_MU0_OVER_PI = float(constants.rmu0) / math.pi
+
+# Output description of each supercon conductor type (i_tf_sc_mat)
+_SUPERCON_DESCRIPTIONS = {
+    1: ("Superconductor used: Nb3Sn", "  (ITER Jcrit model, standard parameters)"),
+    2: ("Superconductor used: Bi-2212 HTS",),
+    3: ("Superconductor used: NbTi",),
+    4: ("Superconductor used: Nb3Sn", "  (ITER Jcrit model, user-defined parameters)"),
+    5: ("Superconductor used: Nb3Sn", " (WST Nb3Sn critical surface model)"),
+    7: (
+        "Superconductor used: Nb-Ti",
+        " (Durham Ginzburg-Landau critical surface model)",
+    ),
+    8: (
+        "Superconductor used: REBCO",
+        " (Durham Ginzburg-Landau critical surface model)",
+    ),
+    9: (
+        "Superconductor used: REBCO",
+        " (Hazelton experimental data + Zhai conceptual model)",
+    ),
+}
+
+# Upper critical field (T) and critical temperature (K) at zero strain for the
+# supercon conductor types with fixed critical surface parameters (i_tf_sc_mat)
+_SUPERCON_CRITICAL_SURFACE = {
+    1: (32.97e0, 16.06e0),
+    3: (15.0e0, 9.3e0),
+    5: (32.97e0, 16.06e0),
+    8: (430, 185),
+    9: (138, 92),
+}
+
+# peak_tf_with_ripple fitting coefficients for 16, 18 and 20 TF coils
+_RIPPLE_FIT_COEFFICIENTS = {
+    16: (0.28101e0, 1.8481e0, -0.88159e0, 0.93834e0),
+    18: (0.29153e0, 1.81600e0, -0.84178e0, 0.90426e0),
+    20: (0.29853e0, 1.82130e0, -0.85031e0, 0.89808e0),
+}
+
+# protect integration coefficients p1, p2, p3 at tav = 1, 2, ..., 11
+_PROTECT_COEFFICIENTS = np.array([
+    [0.0, 0.8, 1.75, 2.4, 2.7, 2.95, 3.1, 3.2, 3.3, 3.4, 3.5],
+    [0.0, 0.05, 0.5, 1.4, 2.6, 3.7, 4.6, 5.3, 5.95, 6.55, 7.1],
+    [0.0, 0.05, 0.5, 1.4, 2.6, 3.7, 4.6, 5.4, 6.05, 6.8, 7.2],
+])
+
+# sctfcoil_module variable holding the dump time constant for each quench model
+_QUENCH_TIME_CONSTANTS = {"linear": "time2", "exponential": "tau2"}
 
 
 class SuperconductingTFCoil(TFCoil):
@@ -50,6 +107,22 @@ class SuperconductingTFCoil(TFCoil):
         Routine to call the superconductor module for the TF coils
         """
         self.iprint = 0
+
+        # Inputs used several times below, read from Fortran once
+        n_tf_coils = tfcoil_variables.n_tf_coils
+        tinstf = tfcoil_variables.tinstf
+        tfinsgap = tfcoil_variables.tfinsgap
+        i_tf_shape = tfcoil_variables.i_tf_shape
+        i_tf_case_geom = tfcoil_variables.i_tf_case_geom
+        itart = physics_variables.itart
+        rmajor = physics_variables.rmajor
+        r_tf_inboard_out = build_variables.r_tf_inboard_out
+        r_tf_inboard_mid = build_variables.r_tf_inboard_mid
+        r_tf_outboard_mid = build_variables.r_tf_outboard_mid
+        dr_tf_inboard = build_variables.dr_tf_inboard
+        dr_tf_outboard = build_variables.dr_tf_outboard
+        z_tf_inside_half = build_variables.z_tf_inside_half
+
         (
             sctfcoil_module.rad_tf_coil_toroidal,
             sctfcoil_module.tan_theta_coil,
@@ -61,30 +134,28 @@ class SuperconductingTFCoil(TFCoil):
             tfcoil_variables.dr_tf_plasma_case,
             tfcoil_variables.dx_tf_side_case,
         ) = super().tf_global_geometry(
-            i_tf_case_geom=tfcoil_variables.i_tf_case_geom,
+            i_tf_case_geom=i_tf_case_geom,
             i_f_dr_tf_plasma_case=tfcoil_variables.i_f_dr_tf_plasma_case,
             f_dr_tf_plasma_case=tfcoil_variables.f_dr_tf_plasma_case,
             tfc_sidewall_is_fraction=tfcoil_variables.tfc_sidewall_is_fraction,
             casths_fraction=tfcoil_variables.casths_fraction,
-            n_tf_coils=tfcoil_variables.n_tf_coils,
-            dr_tf_inboard=build_variables.dr_tf_inboard,
+            n_tf_coils=n_tf_coils,
+            dr_tf_inboard=dr_tf_inboard,
             dr_tf_nose_case=tfcoil_variables.dr_tf_nose_case,
-            r_tf_inboard_out=build_variables.r_tf_inboard_out,
+            r_tf_inboard_out=r_tf_inboard_out,
             r_tf_inboard_in=build_variables.r_tf_inboard_in,
-            r_tf_outboard_mid=build_variables.r_tf_outboard_mid,
-            dr_tf_outboard=build_variables.dr_tf_outboard,
+            r_tf_outboard_mid=r_tf_outboard_mid,
+            dr_tf_outboard=dr_tf_outboard,
         )
 
         # Radial position of peak toroidal field [m]
         # SC : conservative assumption as the radius is calculated with the
         # WP radial distances defined at the TF middle (cos)
 
+        # Plasma side case, ground insulation and insertion gap thickness [m]
+        ins_sum = tfcoil_variables.dr_tf_plasma_case + tinstf + tfinsgap
         tfcoil_variables.r_b_tf_inboard_peak = (
-            build_variables.r_tf_inboard_out
-            * np.cos(sctfcoil_module.rad_tf_coil_toroidal)
-            - tfcoil_variables.dr_tf_plasma_case
-            - tfcoil_variables.tinstf
-            - tfcoil_variables.tfinsgap
+            r_tf_inboard_out * math.cos(sctfcoil_module.rad_tf_coil_toroidal) - ins_sum
         )
 
         (
@@ -93,9 +164,9 @@ class SuperconductingTFCoil(TFCoil):
             sctfcoil_module.c_tf_coil,
             tfcoil_variables.oacdcp,
         ) = super().tf_current(
-            n_tf_coils=tfcoil_variables.n_tf_coils,
+            n_tf_coils=n_tf_coils,
             bt=physics_variables.bt,
-            rmajor=physics_variables.rmajor,
+            rmajor=rmajor,
             r_b_tf_inboard_peak=tfcoil_variables.r_b_tf_inboard_peak,
             a_tf_coil_inboard=tfcoil_variables.a_tf_coil_inboard,
         )
@@ -107,38 +178,38 @@ class SuperconductingTFCoil(TFCoil):
             tfcoil_variables.r_tf_arc,
             tfcoil_variables.z_tf_arc,
         ) = super().tf_coil_shape_inner(
-            i_tf_shape=tfcoil_variables.i_tf_shape,
-            itart=physics_variables.itart,
+            i_tf_shape=i_tf_shape,
+            itart=itart,
             i_single_null=physics_variables.i_single_null,
-            r_tf_inboard_out=build_variables.r_tf_inboard_out,
+            r_tf_inboard_out=r_tf_inboard_out,
             r_cp_top=build_variables.r_cp_top,
-            rmajor=physics_variables.rmajor,
+            rmajor=rmajor,
             rminor=physics_variables.rminor,
             r_tf_outboard_in=sctfcoil_module.r_tf_outboard_in,
-            z_tf_inside_half=build_variables.z_tf_inside_half,
+            z_tf_inside_half=z_tf_inside_half,
             z_tf_top=build_variables.z_tf_top,
-            dr_tf_inboard=build_variables.dr_tf_inboard,
-            dr_tf_outboard=build_variables.dr_tf_outboard,
-            r_tf_outboard_mid=build_variables.r_tf_outboard_mid,
-            r_tf_inboard_mid=build_variables.r_tf_inboard_mid,
+            dr_tf_inboard=dr_tf_inboard,
+            dr_tf_outboard=dr_tf_outboard,
+            r_tf_outboard_mid=r_tf_outboard_mid,
+            r_tf_inboard_mid=r_tf_inboard_mid,
         )
 
         self.sc_tf_internal_geom(
             tfcoil_variables.i_tf_wp_geom,
-            tfcoil_variables.i_tf_case_geom,
+            i_tf_case_geom,
             tfcoil_variables.i_tf_turns_integer,
         )
 
         tfcoil_variables.ind_tf_coil = super().tf_coil_self_inductance(
-            dr_tf_inboard=build_variables.dr_tf_inboard,
+            dr_tf_inboard=dr_tf_inboard,
             r_tf_arc=tfcoil_variables.r_tf_arc,
             z_tf_arc=tfcoil_variables.z_tf_arc,
-            itart=physics_variables.itart,
-            i_tf_shape=tfcoil_variables.i_tf_shape,
-            z_tf_inside_half=build_variables.z_tf_inside_half,
-            dr_tf_outboard=build_variables.dr_tf_outboard,
-            r_tf_outboard_mid=build_variables.r_tf_outboard_mid,
-            r_tf_inboard_mid=build_variables.r_tf_inboard_mid,
+            itart=itart,
+            i_tf_shape=i_tf_shape,
+            z_tf_inside_half=z_tf_inside_half,
+            dr_tf_outboard=dr_tf_outboard,
+            r_tf_outboard_mid=r_tf_outboard_mid,
+            r_tf_inboard_mid=r_tf_inboard_mid,
         )
 
         # Total TF coil stored magnetic energy [J]
@@ -158,196 +229,49 @@ class SuperconductingTFCoil(TFCoil):
         if output:
             tfcoil_variables.n_rad_per_layer = 500
 
-        try:
-            (
-                sig_tf_r_max,
-                sig_tf_t_max,
-                sig_tf_z_max,
-                sig_tf_vmises_max,
-                s_shear_tf_peak,
-                deflect,
-                eyoung_axial,
-                eyoung_trans,
-                eyoung_wp_axial,
-                eyoung_wp_trans,
-                poisson_wp_trans,
-                radial_array,
-                s_shear_cea_tf_cond,
-                poisson_wp_axial,
-                sig_tf_r,
-                sig_tf_smeared_r,
-                sig_tf_smeared_t,
-                sig_tf_smeared_z,
-                sig_tf_t,
-                s_shear_tf,
-                sig_tf_vmises,
-                sig_tf_z,
-                str_tf_r,
-                str_tf_t,
-                str_tf_z,
-                n_radial_array,
-                n_tf_bucking,
-                tfcoil_variables.sig_tf_wp,
-                sig_tf_case,
-                sig_tf_cs_bucked,
-                str_wp,
-                casestr,
-                insstrain,
-                sig_tf_wp_av_z,
-            ) = self.stresscl(
-                int(tfcoil_variables.n_tf_stress_layers),
-                int(tfcoil_variables.n_rad_per_layer),
-                int(tfcoil_variables.n_tf_wp_layers),
-                int(tfcoil_variables.i_tf_bucking),
-                float(build_variables.r_tf_inboard_in),
-                build_variables.dr_bore,
-                build_variables.z_tf_inside_half,
-                pfcoil_variables.f_z_cs_tf_internal,
-                build_variables.dr_cs,
-                build_variables.i_tf_inside_cs,
-                build_variables.dr_tf_inboard,
-                build_variables.dr_cs_tf_gap,
-                pfcoil_variables.i_pf_conductor,
-                pfcoil_variables.j_cs_flat_top_end,
-                pfcoil_variables.j_cs_pulse_start,
-                pfcoil_variables.c_pf_coil_turn_peak_input,
-                pfcoil_variables.n_pf_coils_in_group,
-                pfcoil_variables.ld_ratio_cst,
-                pfcoil_variables.r_out_cst,
-                pfcoil_variables.f_a_cs_steel,
-                tfcoil_variables.eyoung_steel,
-                tfcoil_variables.poisson_steel,
-                tfcoil_variables.eyoung_cond_axial,
-                tfcoil_variables.poisson_cond_axial,
-                tfcoil_variables.eyoung_cond_trans,
-                tfcoil_variables.poisson_cond_trans,
-                tfcoil_variables.eyoung_ins,
-                tfcoil_variables.poisson_ins,
-                tfcoil_variables.dx_tf_turn_insulation,
-                tfcoil_variables.eyoung_copper,
-                tfcoil_variables.poisson_copper,
-                tfcoil_variables.i_tf_sup,
-                tfcoil_variables.eyoung_res_tf_buck,
-                sctfcoil_module.r_wp_inner,
-                sctfcoil_module.tan_theta_coil,
-                sctfcoil_module.rad_tf_coil_toroidal,
-                sctfcoil_module.r_wp_outer,
-                sctfcoil_module.a_tf_steel,
-                sctfcoil_module.a_case_front,
-                sctfcoil_module.a_case_nose,
-                tfcoil_variables.tfinsgap,
-                tfcoil_variables.tinstf,
-                tfcoil_variables.n_tf_coil_turns,
-                int(tfcoil_variables.i_tf_turns_integer),
-                sctfcoil_module.t_cable,
-                sctfcoil_module.dr_tf_turn_cable_space,
-                tfcoil_variables.dia_tf_turn_coolant_channel,
-                tfcoil_variables.fcutfsu,
-                tfcoil_variables.dx_tf_turn_steel,
-                sctfcoil_module.t_lat_case_av,
-                sctfcoil_module.t_wp_toroidal_av,
-                sctfcoil_module.a_tf_ins,
-                tfcoil_variables.aswp,
-                tfcoil_variables.acond,
-                sctfcoil_module.awpc,
-                tfcoil_variables.eyoung_al,
-                tfcoil_variables.poisson_al,
-                tfcoil_variables.fcoolcp,
-                tfcoil_variables.n_tf_graded_layers,
-                tfcoil_variables.c_tf_total,
-                tfcoil_variables.dr_tf_plasma_case,
-                tfcoil_variables.i_tf_stress_model,
-                sctfcoil_module.vforce_inboard_tot,
-                tfcoil_variables.i_tf_tresca,
-                tfcoil_variables.acasetf,
-                tfcoil_variables.vforce,
-                tfcoil_variables.a_tf_turn_steel,
-            )
-
-            tfcoil_variables.sig_tf_case = (
-                tfcoil_variables.sig_tf_case
-                if tfcoil_variables.sig_tf_case is None
-                else sig_tf_case
-            )
-
-            tfcoil_variables.sig_tf_cs_bucked = (
-                tfcoil_variables.sig_tf_cs_bucked
-                if tfcoil_variables.sig_tf_cs_bucked is None
-                else sig_tf_cs_bucked
-            )
-
-            tfcoil_variables.str_wp = (
-                tfcoil_variables.str_wp if tfcoil_variables.str_wp is None else str_wp
-            )
-
-            tfcoil_variables.casestr = (
-                tfcoil_variables.casestr
-                if tfcoil_variables.casestr is None
-                else casestr
+        stress = self.stresscl(
+            **self._build_stress_args(
+                z_tf_inside_half=z_tf_inside_half,
+                dr_tf_inboard=dr_tf_inboard,
+                tinstf=tinstf,
+                tfinsgap=tfinsgap,
             )
+        )
 
-            tfcoil_variables.insstrain = (
-                tfcoil_variables.insstrain
-                if tfcoil_variables.insstrain is None
-                else insstrain
-            )
+        if stress is None:
+            error_handling.report_error(245)
+            tfcoil_variables.sig_tf_case = 0.0e0
+            tfcoil_variables.sig_tf_wp = 0.0e0
+        else:
+            tfcoil_variables.sig_tf_wp = stress.sig_tf_wp
+            tfcoil_variables.sig_tf_case = stress.sig_tf_case
+            tfcoil_variables.sig_tf_cs_bucked = stress.sig_tf_cs_bucked
+            tfcoil_variables.str_wp = stress.str_wp
+            tfcoil_variables.casestr = stress.casestr
+            tfcoil_variables.insstrain = stress.insstrain
 
             if output:
-                self.out_stress(
-                    sig_tf_r_max,
-                    sig_tf_t_max,
-                    sig_tf_z_max,
-                    sig_tf_vmises_max,
-                    s_shear_tf_peak,
-                    deflect,
-                    eyoung_axial,
-                    eyoung_trans,
-                    eyoung_wp_axial,
-                    eyoung_wp_trans,
-                    poisson_wp_trans,
-                    radial_array,
-                    s_shear_cea_tf_cond,
-                    poisson_wp_axial,
-                    sig_tf_r,
-                    sig_tf_smeared_r,
-                    sig_tf_smeared_t,
-                    sig_tf_smeared_z,
-                    sig_tf_t,
-                    s_shear_tf,
-                    sig_tf_vmises,
-                    sig_tf_z,
-                    str_tf_r,
-                    str_tf_t,
-                    str_tf_z,
-                    n_radial_array,
-                    n_tf_bucking,
-                    sig_tf_wp_av_z,
-                )
-        except ValueError as e:
-            if e.args[1] == 245 and e.args[2] == 0:
-                error_handling.report_error(245)
-                tfcoil_variables.sig_tf_case = 0.0e0
-                tfcoil_variables.sig_tf_wp = 0.0e0
+                self.out_stress(stress)
         peaktfflag = 0
         self.vv_stress_on_quench()
 
         # Peak field including ripple
         # Rem : as resistive magnets are axisymmetric, no inboard ripple is present
         tfcoil_variables.bmaxtfrp, peaktfflag = self.peak_tf_with_ripple(
-            tfcoil_variables.n_tf_coils,
+            n_tf_coils,
             tfcoil_variables.wwp1,
-            tfcoil_variables.dr_tf_wp
-            - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap),
+            tfcoil_variables.dr_tf_wp - 2.0e0 * (tinstf + tfinsgap),
             sctfcoil_module.r_wp_centre,
             tfcoil_variables.b_tf_inboard_peak,
         )
 
-        tfes = sctfcoil_module.e_tf_magnetic_stored_total / tfcoil_variables.n_tf_coils
-        # Cross-sectional area per turn
-        aturn = tfcoil_variables.c_tf_total / (
-            tfcoil_variables.j_tf_wp
-            * tfcoil_variables.n_tf_coils
-            * tfcoil_variables.n_tf_coil_turns
+        # Energy stored per coil and cross-sectional area per turn
+        tfes, aturn = _coil_energy_and_turn_area(
+            float(sctfcoil_module.e_tf_magnetic_stored_total),
+            float(n_tf_coils),
+            float(tfcoil_variables.c_tf_total),
+            float(tfcoil_variables.j_tf_wp),
+            float(tfcoil_variables.n_tf_coil_turns),
         )
 
         if tfcoil_variables.i_tf_sc_mat == 6:
@@ -394,33 +318,105 @@ class SuperconductingTFCoil(TFCoil):
             if output:
                 self.outtf(peaktfflag)
 
+    def _build_stress_args(self, z_tf_inside_half, dr_tf_inboard, tinstf, tfinsgap):
+        """Collect the keyword arguments of stresscl from the Fortran modules
+
+        :param z_tf_inside_half: maximum inboard edge height (m)
+        :type z_tf_inside_half: float
+        :param dr_tf_inboard: inboard TF coil thickness (m)
+        :type dr_tf_inboard: float
+        :param tinstf: ground insulation thickness (m)
+        :type tinstf: float
+        :param tfinsgap: TF coil WP insertion gap (m)
+        :type tfinsgap: float
+        :return: stresscl arguments keyed by parameter name
+        :rtype: dict
+        """
+        return {
+            "n_tf_layer": int(tfcoil_variables.n_tf_stress_layers),
+            "n_radial_array": int(tfcoil_variables.n_rad_per_layer),
+            "n_tf_wp_layers": int(tfcoil_variables.n_tf_wp_layers),
+            "i_tf_bucking": int(tfcoil_variables.i_tf_bucking),
+            "r_tf_inboard_in": float(build_variables.r_tf_inboard_in),
+            "dr_bore": build_variables.dr_bore,
+            "z_tf_inside_half": z_tf_inside_half,
+            "f_z_cs_tf_internal": pfcoil_variables.f_z_cs_tf_internal,
+            "dr_cs": build_variables.dr_cs,
+            "i_tf_inside_cs": build_variables.i_tf_inside_cs,
+            "dr_tf_inboard": dr_tf_inboard,
+            "dr_cs_tf_gap": build_variables.dr_cs_tf_gap,
+            "i_pf_conductor": pfcoil_variables.i_pf_conductor,
+            "j_cs_flat_top_end": pfcoil_variables.j_cs_flat_top_end,
+            "j_cs_pulse_start": pfcoil_variables.j_cs_pulse_start,
+            "c_pf_coil_turn_peak_input": pfcoil_variables.c_pf_coil_turn_peak_input,
+            "n_pf_coils_in_group": pfcoil_variables.n_pf_coils_in_group,
+            "ld_ratio_cst": pfcoil_variables.ld_ratio_cst,
+            "r_out_cst": pfcoil_variables.r_out_cst,
+            "f_a_cs_steel": pfcoil_variables.f_a_cs_steel,
+            "eyoung_steel": tfcoil_variables.eyoung_steel,
+            "poisson_steel": tfcoil_variables.poisson_steel,
+            "eyoung_cond_axial": tfcoil_variables.eyoung_cond_axial,
+            "poisson_cond_axial": tfcoil_variables.poisson_cond_axial,
+            "eyoung_cond_trans": tfcoil_variables.eyoung_cond_trans,
+            "poisson_cond_trans": tfcoil_variables.poisson_cond_trans,
+            "eyoung_ins": tfcoil_variables.eyoung_ins,
+            "poisson_ins": tfcoil_variables.poisson_ins,
+            "dx_tf_turn_insulation": tfcoil_variables.dx_tf_turn_insulation,
+            "eyoung_copper": tfcoil_variables.eyoung_copper,
+            "poisson_copper": tfcoil_variables.poisson_copper,
+            "i_tf_sup": tfcoil_variables.i_tf_sup,
+            "eyoung_res_tf_buck": tfcoil_variables.eyoung_res_tf_buck,
+            "r_wp_inner": sctfcoil_module.r_wp_inner,
+            "tan_theta_coil": sctfcoil_module.tan_theta_coil,
+            "rad_tf_coil_toroidal": sctfcoil_module.rad_tf_coil_toroidal,
+            "r_wp_outer": sctfcoil_module.r_wp_outer,
+            "a_tf_steel": sctfcoil_module.a_tf_steel,
+            "a_case_front": sctfcoil_module.a_case_front,
+            "a_case_nose": sctfcoil_module.a_case_nose,
+            "tfinsgap": tfinsgap,
+            "tinstf": tinstf,
+            "n_tf_coil_turns": tfcoil_variables.n_tf_coil_turns,
+            "i_tf_turns_integer": int(tfcoil_variables.i_tf_turns_integer),
+            "t_cable": sctfcoil_module.t_cable,
+            "dr_tf_turn_cable_space": sctfcoil_module.dr_tf_turn_cable_space,
+            "dia_tf_turn_coolant_channel": tfcoil_variables.dia_tf_turn_coolant_channel,
+            "fcutfsu": tfcoil_variables.fcutfsu,
+            "dx_tf_turn_steel": tfcoil_variables.dx_tf_turn_steel,
+            "t_lat_case_av": sctfcoil_module.t_lat_case_av,
+            "t_wp_toroidal_av": sctfcoil_module.t_wp_toroidal_av,
+            "a_tf_ins": sctfcoil_module.a_tf_ins,
+            "aswp": tfcoil_variables.aswp,
+            "acond": tfcoil_variables.acond,
+            "awpc": sctfcoil_module.awpc,
+            "eyoung_al": tfcoil_variables.eyoung_al,
+            "poisson_al": tfcoil_variables.poisson_al,
+            "fcoolcp": tfcoil_variables.fcoolcp,
+            "n_tf_graded_layers": tfcoil_variables.n_tf_graded_layers,
+            "c_tf_total": tfcoil_variables.c_tf_total,
+            "dr_tf_plasma_case": tfcoil_variables.dr_tf_plasma_case,
+            "i_tf_stress_model": tfcoil_variables.i_tf_stress_model,
+            "vforce_inboard_tot": sctfcoil_module.vforce_inboard_tot,
+            "i_tf_tresca": tfcoil_variables.i_tf_tresca,
+            "acasetf": tfcoil_variables.acasetf,
+            "vforce": tfcoil_variables.vforce,
+            "a_tf_turn_steel": tfcoil_variables.a_tf_turn_steel,
+        }
+
     def croco_voltage(self) -> float:
-        if f2py_compatible_to_string(tfcoil_variables.quench_model) == "linear":
-            sctfcoil_module.time2 = tfcoil_variables.tdmptf
-            croco_voltage = (
-                2.0e0
-                / sctfcoil_module.time2
-                * (
-                    sctfcoil_module.e_tf_magnetic_stored_total
-                    / tfcoil_variables.n_tf_coils
-                )
-                / tfcoil_variables.c_tf_turn
-            )
-        elif f2py_compatible_to_string(tfcoil_variables.quench_model) == "exponential":
-            sctfcoil_module.tau2 = tfcoil_variables.tdmptf
-            croco_voltage = (
-                2.0e0
-                / sctfcoil_module.tau2
-                * (
-                    sctfcoil_module.e_tf_magnetic_stored_total
-                    / tfcoil_variables.n_tf_coils
-                )
-                / tfcoil_variables.c_tf_turn
-            )
-        else:
+        quench_model = f2py_compatible_to_string(tfcoil_variables.quench_model)
+        time_constant = _QUENCH_TIME_CONSTANTS.get(quench_model)
+        if time_constant is None:
             return 0.0
 
-        return croco_voltage
+        # Record the dump time as the quench model's time constant
+        setattr(sctfcoil_module, time_constant, tfcoil_variables.tdmptf)
+
+        return (
+            2.0e0
+            / tfcoil_variables.tdmptf
+            * (sctfcoil_module.e_tf_magnetic_stored_total / tfcoil_variables.n_tf_coils)
+            / tfcoil_variables.c_tf_turn
+        )
 
     def supercon_croco(self, aturn, bmax, iop, thelium, output: bool):
         """TF superconducting CroCo conductor using REBCO tape
@@ -437,29 +433,21 @@ class SuperconductingTFCoil(TFCoil):
         j_crit_sc: float = 0.0
         #  Find critical current density in superconducting cable, j_crit_cable
         j_crit_sc, _ = superconductors.jcrit_rebco(thelium, bmax)
+        # Conductor geometry, including the new rebco_variables.croco_od
         # tfcoil_variables.a_tf_turn_cable_space : Cable space - inside area (m2)
-        # Set new rebco_variables.croco_od
-        # allowing for scaling of rebco_variables.croco_od
-        rebco_variables.croco_od = (
-            tfcoil_variables.t_conductor / 3.0e0
-            - tfcoil_variables.dx_tf_turn_steel * (2.0e0 / 3.0e0)
-        )
-        sctfcoil_module.conductor_acs = (
-            9.0e0 / 4.0e0 * np.pi * rebco_variables.croco_od**2
+        (
+            rebco_variables.croco_od,
+            sctfcoil_module.conductor_acs,
+            sctfcoil_module.conductor_area,
+            sctfcoil_module.conductor_jacket_area,
+            sctfcoil_module.conductor_jacket_fraction,
+        ) = croco_conductor_geometry(
+            float(tfcoil_variables.t_conductor),
+            float(tfcoil_variables.dx_tf_turn_steel),
         )
         tfcoil_variables.a_tf_turn_cable_space = sctfcoil_module.conductor_acs
-        sctfcoil_module.conductor_area = (
-            tfcoil_variables.t_conductor**2
-        )  # does this not assume it's a sqaure???
-
-        sctfcoil_module.conductor_jacket_area = (
-            sctfcoil_module.conductor_area - sctfcoil_module.conductor_acs
-        )
         tfcoil_variables.a_tf_turn_steel = sctfcoil_module.conductor_jacket_area
 
-        sctfcoil_module.conductor_jacket_fraction = (
-            sctfcoil_module.conductor_jacket_area / sctfcoil_module.conductor_area
-        )
         (
             sctfcoil_module.croco_strand_area,
             sctfcoil_module.croco_strand_critical_current,
@@ -490,18 +478,12 @@ class SuperconductingTFCoil(TFCoil):
             / sctfcoil_module.croco_strand_area
         )
 
-        # Critical current density in winding pack
-        # aturn : Area per turn (i.e. entire jacketed conductor with insulation) (m2)
-        j_tf_wp_critical = icrit / aturn
-        #  Ratio of operating / critical current
-        iooic = iop / icrit
-        #  Operating current density
-        jwdgop = iop / aturn
-        #  Actual current density in superconductor,
-        # which should be equal to jcrit(thelium+tmarg)
-
-        #  when we have found the desired value of tmarg
-        jsc = iooic * j_crit_sc
+        # Critical current density in winding pack, ratio of operating / critical
+        # current, operating current density and actual current density in
+        # superconductor (which should be equal to jcrit(thelium+tmarg))
+        j_tf_wp_critical, iooic, jwdgop, jsc = _conductor_operating_point(
+            float(iop), float(aturn), float(icrit), float(j_crit_sc)
+        )
 
         # Temperature margin
         current_sharing_t = superconductors.current_sharing_rebco(bmax, jsc)
@@ -510,361 +492,386 @@ class SuperconductingTFCoil(TFCoil):
             tmarg  # Only used in the availabilty routine - see comment to Issue #526
         )
 
-        if output:  # Output ----------------------------------
-            total = (
-                sctfcoil_module.conductor_copper_area
-                + sctfcoil_module.conductor_hastelloy_area
-                + sctfcoil_module.conductor_solder_area
-                + sctfcoil_module.conductor_jacket_area
-                + sctfcoil_module.conductor_helium_area
-                + sctfcoil_module.conductor_rebco_area
+        if output:
+            self.output_supercon_croco(
+                bmax=bmax,
+                thelium=thelium,
+                j_crit_sc=j_crit_sc,
+                j_crit_cable=j_crit_cable,
+                j_tf_wp_critical=j_tf_wp_critical,
+                jwdgop=jwdgop,
+                icrit=icrit,
+                iooic=iooic,
+                current_sharing_t=current_sharing_t,
+                tmarg=tmarg,
             )
 
-            if tfcoil_variables.temp_margin <= 0.0e0:
-                logger.warning(
-                    f"""Negative TFC temperature margin
-                temp_margin: {tfcoil_variables.temp_margin}
-                bmax: {bmax}"""
-                )
-
-            po.oheadr(self.outfile, "Superconducting TF Coils")
-            po.ovarin(self.outfile, "Superconductor switch", "(isumat)", 6)
-            po.ocmmnt(
-                self.outfile, "Superconductor used: REBCO HTS tape in CroCo strand"
-            )
+        return j_tf_wp_critical, tmarg
 
-            po.ovarre(
-                self.outfile,
-                "Thickness of REBCO layer in tape (m)",
-                "(rebco_thickness)",
-                rebco_variables.rebco_thickness,
-            )
-            po.ovarre(
-                self.outfile,
-                "Thickness of copper layer in tape (m)",
-                "(copper_thick  )",
-                rebco_variables.copper_thick,
-            )
-            po.ovarre(
-                self.outfile,
-                "Thickness of Hastelloy layer in tape (m) ",
-                "(hastelloy_thickness)",
-                rebco_variables.hastelloy_thickness,
-            )
+    def output_supercon_croco(
+        self,
+        bmax,
+        thelium,
+        j_crit_sc,
+        j_crit_cable,
+        j_tf_wp_critical,
+        jwdgop,
+        icrit,
+        iooic,
+        current_sharing_t,
+        tmarg,
+    ):
+        """Write the CroCo conductor output from supercon_croco.
+
+        :param bmax: peak field at conductor (T)
+        :type bmax: float
+        :param thelium: He temperature at peak field point (K)
+        :type thelium: float
+        :param j_crit_sc: critical current density in superconductor (A/m2)
+        :type j_crit_sc: float
+        :param j_crit_cable: critical current density in cable (A/m2)
+        :type j_crit_cable: float
+        :param j_tf_wp_critical: critical winding pack current density (A/m2)
+        :type j_tf_wp_critical: float
+        :param jwdgop: operating winding pack current density (A/m2)
+        :type jwdgop: float
+        :param icrit: critical current (A)
+        :type icrit: float
+        :param iooic: ratio of operating to critical current
+        :type iooic: float
+        :param current_sharing_t: current sharing temperature (K)
+        :type current_sharing_t: float
+        :param tmarg: temperature margin (K)
+        :type tmarg: float
+        """
+        total = sum((
+            sctfcoil_module.conductor_copper_area,
+            sctfcoil_module.conductor_hastelloy_area,
+            sctfcoil_module.conductor_solder_area,
+            sctfcoil_module.conductor_jacket_area,
+            sctfcoil_module.conductor_helium_area,
+            sctfcoil_module.conductor_rebco_area,
+        ))
 
-            po.ovarre(
-                self.outfile,
-                "Mean width of tape (m)",
-                "(tape_width)",
-                rebco_variables.tape_width,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Outer diameter of CroCo copper tube (m) ",
-                "(croco_od)",
-                rebco_variables.croco_od,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Inner diameter of CroCo copper tube (m) ",
-                "(croco_id)",
-                rebco_variables.croco_id,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Thickness of CroCo copper tube (m) ",
-                "(croco_thick)",
-                rebco_variables.croco_thick,
-            )
+        if tmarg <= 0.0e0:
+            logger.warning(
+                f"""Negative TFC temperature margin
+            temp_margin: {tmarg}
+            bmax: {bmax}"""
+            )
+
+        po.oheadr(self.outfile, "Superconducting TF Coils")
+        po.ovarin(self.outfile, "Superconductor switch", "(isumat)", 6)
+        po.ocmmnt(self.outfile, "Superconductor used: REBCO HTS tape in CroCo strand")
+
+        po.ovarre_rows(
+            self.outfile,
+            [
+                (
+                    "Thickness of REBCO layer in tape (m)",
+                    "(rebco_thickness)",
+                    rebco_variables.rebco_thickness,
+                ),
+                (
+                    "Thickness of copper layer in tape (m)",
+                    "(copper_thick  )",
+                    rebco_variables.copper_thick,
+                ),
+                (
+                    "Thickness of Hastelloy layer in tape (m) ",
+                    "(hastelloy_thickness)",
+                    rebco_variables.hastelloy_thickness,
+                ),
+                (
+                    "Mean width of tape (m)",
+                    "(tape_width)",
+                    rebco_variables.tape_width,
+                    "OP ",
+                ),
+                (
+                    "Outer diameter of CroCo copper tube (m) ",
+                    "(croco_od)",
+                    rebco_variables.croco_od,
+                    "OP ",
+                ),
+                (
+                    "Inner diameter of CroCo copper tube (m) ",
+                    "(croco_id)",
+                    rebco_variables.croco_id,
+                    "OP ",
+                ),
+                (
+                    "Thickness of CroCo copper tube (m) ",
+                    "(croco_thick)",
+                    rebco_variables.croco_thick,
+                ),
+                (
+                    "Thickness of each HTS tape ",
+                    "(tape_thickness)",
+                    rebco_variables.tape_thickness,
+                    "OP ",
+                ),
+                (
+                    "Thickness of stack of rebco_variables.tapes (m) ",
+                    "(stack_thickness)",
+                    rebco_variables.stack_thickness,
+                    "OP ",
+                ),
+                (
+                    "Number of rebco_variables.tapes in strand",
+                    "(tapes)",
+                    rebco_variables.tapes,
+                    "OP ",
+                ),
+            ],
+        )
+        po.oblnkl(self.outfile)
+        po.ovarre_rows(
+            self.outfile,
+            [
+                (
+                    "Area of REBCO in strand (m2)",
+                    "(rebco_area)",
+                    rebco_variables.rebco_area,
+                    "OP ",
+                ),
+                (
+                    "Area of copper in strand (m2)",
+                    "(copper_area)",
+                    rebco_variables.copper_area,
+                    "OP ",
+                ),
+                (
+                    "Area of hastelloy substrate in strand (m2) ",
+                    "(hastelloy_area)",
+                    rebco_variables.hastelloy_area,
+                    "OP ",
+                ),
+                (
+                    "Area of solder in strand (m2)  ",
+                    "(solder_area)",
+                    rebco_variables.solder_area,
+                    "OP ",
+                ),
+                (
+                    "Total: area of CroCo strand (m2)  ",
+                    "(croco_strand_area)",
+                    sctfcoil_module.croco_strand_area,
+                    "OP ",
+                ),
+            ],
+        )
+        strand_total = sum((
+            rebco_variables.rebco_area,
+            rebco_variables.copper_area,
+            rebco_variables.hastelloy_area,
+            rebco_variables.solder_area,
+        ))
+        # Written so that NaN areas are flagged too
+        if not abs(sctfcoil_module.croco_strand_area - strand_total) <= 1e-6:
+            po.ocmmnt(self.outfile, "ERROR: Areas in CroCo strand do not add up")
+            logger.warning("Areas in CroCo strand do not add up - see OUT.DAT")
+
+        po.oblnkl(self.outfile)
+        po.ocmmnt(self.outfile, "Cable information")
+        po.ovarin(
+            self.outfile,
+            "Number of CroCo strands in the cable (fixed) ",
+            "",
+            6,
+            "OP ",
+        )
+        po.ovarre(
+            self.outfile,
+            "Total area of cable space (m2)",
+            "(a_tf_turn_cable_space)",
+            tfcoil_variables.a_tf_turn_cable_space,
+            "OP ",
+        )
 
+        po.oblnkl(self.outfile)
+        po.ocmmnt(
+            self.outfile,
+            "Conductor information (includes jacket, not including insulation)",
+        )
+        po.ovarre_rows(
+            self.outfile,
+            [
+                (
+                    "Width of square conductor (cable + steel jacket) (m)",
+                    "(t_conductor)",
+                    tfcoil_variables.t_conductor,
+                    "OP ",
+                ),
+                (
+                    "Area of conductor (m2)",
+                    "(area)",
+                    sctfcoil_module.conductor_area,
+                    "OP ",
+                ),
+                (
+                    "REBCO area of conductor (mm2)",
+                    "(rebco_area)",
+                    sctfcoil_module.conductor_rebco_area,
+                    "OP ",
+                ),
+                (
+                    "Area of central copper bar (mm2)",
+                    "(copper_bar_area)",
+                    sctfcoil_module.conductor_copper_bar_area,
+                    "OP ",
+                ),
+                (
+                    "Total copper area of conductor, total (mm2)",
+                    "(copper_area)",
+                    sctfcoil_module.conductor_copper_area,
+                    "OP ",
+                ),
+                (
+                    "Hastelloy area of conductor (mm2)",
+                    "(hastelloy_area)",
+                    sctfcoil_module.conductor_hastelloy_area,
+                    "OP ",
+                ),
+                (
+                    "Solder area of conductor (mm2)",
+                    "(solder_area)",
+                    sctfcoil_module.conductor_solder_area,
+                    "OP ",
+                ),
+                (
+                    "Jacket area of conductor (mm2)",
+                    "(jacket_area)",
+                    sctfcoil_module.conductor_jacket_area,
+                    "OP ",
+                ),
+                (
+                    "Helium area of conductor (mm2)",
+                    "(helium_area)",
+                    sctfcoil_module.conductor_helium_area,
+                    "OP ",
+                ),
+            ],
+        )
+        if not abs(total - sctfcoil_module.conductor_area) <= 1e-8:
             po.ovarre(
                 self.outfile,
-                "Thickness of each HTS tape ",
-                "(tape_thickness)",
-                rebco_variables.tape_thickness,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Thickness of stack of rebco_variables.tapes (m) ",
-                "(stack_thickness)",
-                rebco_variables.stack_thickness,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Number of rebco_variables.tapes in strand",
-                "(tapes)",
-                rebco_variables.tapes,
-                "OP ",
-            )
-            po.oblnkl(self.outfile)
-            po.ovarre(
-                self.outfile,
-                "Area of REBCO in strand (m2)",
-                "(rebco_area)",
-                rebco_variables.rebco_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Area of copper in strand (m2)",
-                "(copper_area)",
-                rebco_variables.copper_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Area of hastelloy substrate in strand (m2) ",
-                "(hastelloy_area)",
-                rebco_variables.hastelloy_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Area of solder in strand (m2)  ",
-                "(solder_area)",
-                rebco_variables.solder_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Total: area of CroCo strand (m2)  ",
-                "(croco_strand_area)",
-                sctfcoil_module.croco_strand_area,
+                "ERROR: conductor areas do not add up:",
+                "(total)",
+                total,
                 "OP ",
             )
-            if (
-                abs(
-                    sctfcoil_module.croco_strand_area
-                    - (
-                        rebco_variables.rebco_area
-                        + rebco_variables.copper_area
-                        + rebco_variables.hastelloy_area
-                        + rebco_variables.solder_area
-                    )
-                )
-                > 1e-6
-            ):
-                po.ocmmnt(self.outfile, "ERROR: Areas in CroCo strand do not add up")
-                logger.warning("Areas in CroCo strand do not add up - see OUT.DAT")
+            logger.warning(f"conductor areas do not add up. total: {total}")
 
-            po.oblnkl(self.outfile)
-            po.ocmmnt(self.outfile, "Cable information")
-            po.ovarin(
-                self.outfile,
-                "Number of CroCo strands in the cable (fixed) ",
-                "",
-                6,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Total area of cable space (m2)",
-                "(a_tf_turn_cable_space)",
-                tfcoil_variables.a_tf_turn_cable_space,
-                "OP ",
-            )
+        po.ovarre_rows(
+            self.outfile,
+            [
+                (
+                    "Critical current of CroCo strand (A)",
+                    "(croco_strand_critical_current)",
+                    sctfcoil_module.croco_strand_critical_current,
+                    "OP ",
+                ),
+                (
+                    "Critical current of conductor (A) ",
+                    "(conductor_critical_current)",
+                    sctfcoil_module.conductor_critical_current,
+                    "OP ",
+                ),
+            ],
+        )
 
+        if global_variables.run_tests == 1:
             po.oblnkl(self.outfile)
             po.ocmmnt(
                 self.outfile,
-                "Conductor information (includes jacket, not including insulation)",
+                "PROCESS TF Coil peak field fit. Values for t, z and y:",
             )
-            po.ovarre(
-                self.outfile,
-                "Width of square conductor (cable + steel jacket) (m)",
-                "(t_conductor)",
-                tfcoil_variables.t_conductor,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Area of conductor (m2)",
-                "(area)",
-                sctfcoil_module.conductor_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "REBCO area of conductor (mm2)",
-                "(rebco_area)",
-                sctfcoil_module.conductor_rebco_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Area of central copper bar (mm2)",
-                "(copper_bar_area)",
-                sctfcoil_module.conductor_copper_bar_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Total copper area of conductor, total (mm2)",
-                "(copper_area)",
-                sctfcoil_module.conductor_copper_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Hastelloy area of conductor (mm2)",
-                "(hastelloy_area)",
-                sctfcoil_module.conductor_hastelloy_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Solder area of conductor (mm2)",
-                "(solder_area)",
-                sctfcoil_module.conductor_solder_area,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Jacket area of conductor (mm2)",
-                "(jacket_area)",
-                sctfcoil_module.conductor_jacket_area,
-                "OP ",
-            )
-            po.ovarre(
+            po.oblnkl(self.outfile)
+            po.ovarre_rows(
                 self.outfile,
-                "Helium area of conductor (mm2)",
-                "(helium_area)",
-                sctfcoil_module.conductor_helium_area,
-                "OP ",
-            )
-            if abs(total - sctfcoil_module.conductor_area) > 1e-8:
-                po.ovarre(
-                    self.outfile,
-                    "ERROR: conductor areas do not add up:",
-                    "(total)",
-                    total,
+                [
+                    (
+                        "Dimensionless winding pack width",
+                        "(tf_fit_t)",
+                        sctfcoil_module.tf_fit_t,
+                        "OP ",
+                    ),
+                    (
+                        "Dimensionless winding pack radial thickness",
+                        "(tf_fit_z)",
+                        sctfcoil_module.tf_fit_z,
+                        "OP ",
+                    ),
+                    (
+                        "Ratio of actual peak field to nominal axisymmetric peak field",
+                        "(tf_fit_y)",
+                        sctfcoil_module.tf_fit_y,
+                        "OP ",
+                    ),
+                ],
+            )
+
+        po.oblnkl(self.outfile)
+        po.ovarre_rows(
+            self.outfile,
+            [
+                (
+                    "Helium temperature at peak field (= superconductor temperature) (K)",
+                    "(thelium)",
+                    thelium,
+                ),
+                (
+                    "Critical current density in superconductor (A/m2)",
+                    "(j_crit_sc)",
+                    j_crit_sc,
                     "OP ",
-                )
-                logger.warning(f"conductor areas do not add up. total: {total}")
-
-            po.ovarre(
-                self.outfile,
-                "Critical current of CroCo strand (A)",
-                "(croco_strand_critical_current)",
-                sctfcoil_module.croco_strand_critical_current,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current of conductor (A) ",
-                "(conductor_critical_current)",
-                sctfcoil_module.conductor_critical_current,
-                "OP ",
-            )
-
-            if global_variables.run_tests == 1:
-                po.oblnkl(self.outfile)
-                po.ocmmnt(
-                    self.outfile,
-                    "PROCESS TF Coil peak field fit. Values for t, z and y:",
-                )
-                po.oblnkl(self.outfile)
-                po.ovarre(
-                    self.outfile,
-                    "Dimensionless winding pack width",
-                    "(tf_fit_t)",
-                    sctfcoil_module.tf_fit_t,
+                ),
+                (
+                    "Critical current density in cable (A/m2)",
+                    "(j_crit_cable)",
+                    j_crit_cable,
                     "OP ",
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Dimensionless winding pack radial thickness",
-                    "(tf_fit_z)",
-                    sctfcoil_module.tf_fit_z,
+                ),
+                (
+                    "Critical current density in winding pack (A/m2)",
+                    "(j_tf_wp_critical)",
+                    j_tf_wp_critical,
                     "OP ",
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Ratio of actual peak field to nominal axisymmetric peak field",
-                    "(tf_fit_y)",
-                    sctfcoil_module.tf_fit_y,
+                ),
+                (
+                    "Actual current density in winding pack (A/m2)",
+                    "(jwdgop)",
+                    jwdgop,
                     "OP ",
-                )
-
-            po.oblnkl(self.outfile)
-            po.ovarre(
-                self.outfile,
-                "Helium temperature at peak field (= superconductor temperature) (K)",
-                "(thelium)",
-                thelium,
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in superconductor (A/m2)",
-                "(j_crit_sc)",
-                j_crit_sc,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in cable (A/m2)",
-                "(j_crit_cable)",
-                j_crit_cable,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in winding pack (A/m2)",
-                "(j_tf_wp_critical)",
-                j_tf_wp_critical,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Actual current density in winding pack (A/m2)",
-                "(jwdgop)",
-                jwdgop,
-                "OP ",
-            )
-
-            po.ovarre(
-                self.outfile,
-                "Minimum allowed temperature margin in superconductor (K)",
-                "(tmargmin_tf)",
-                tfcoil_variables.tmargmin_tf,
-            )
-
-            po.ovarre(
-                self.outfile,
-                "Actual temperature margin in superconductor (K)",
-                "(tmarg)",
-                tmarg,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Current sharing temperature (K)",
-                "(current_sharing_t)",
-                current_sharing_t,
-                "OP ",
-            )
-            po.ovarre(self.outfile, "Critical current (A)", "(icrit)", icrit, "OP ")
-            po.ovarre(
-                self.outfile,
-                "Actual current (A)",
-                "(c_tf_turn)",
-                tfcoil_variables.c_tf_turn,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Actual current / critical current",
-                "(iooic)",
-                iooic,
-                "OP ",
-            )
-
-        return j_tf_wp_critical, tmarg
+                ),
+                (
+                    "Minimum allowed temperature margin in superconductor (K)",
+                    "(tmargmin_tf)",
+                    tfcoil_variables.tmargmin_tf,
+                ),
+                (
+                    "Actual temperature margin in superconductor (K)",
+                    "(tmarg)",
+                    tmarg,
+                    "OP ",
+                ),
+                (
+                    "Current sharing temperature (K)",
+                    "(current_sharing_t)",
+                    current_sharing_t,
+                    "OP ",
+                ),
+                ("Critical current (A)", "(icrit)", icrit, "OP "),
+                (
+                    "Actual current (A)",
+                    "(c_tf_turn)",
+                    tfcoil_variables.c_tf_turn,
+                    "OP ",
+                ),
+                ("Actual current / critical current", "(iooic)", iooic, "OP "),
+            ],
+        )
 
     def supercon(
         self,
@@ -940,50 +947,46 @@ class SuperconductingTFCoil(TFCoil):
         tdump = tdmptf
 
         # Helium channel
-        fhetot = (
-            fhe
-            + (np.pi / 4.0e0)
-            * tfcoil_variables.dia_tf_turn_coolant_channel
-            * tfcoil_variables.dia_tf_turn_coolant_channel
-            / acs
-        )
+        dia_coolant = tfcoil_variables.dia_tf_turn_coolant_channel
+        fhetot = fhe + _PI_OVER_FOUR * dia_coolant * dia_coolant / acs
 
         # Guard against negative conductor fraction fcond
         # Kludge to allow solver to continue and hopefully be constrained away
         # from this point
-        if fhetot > 0.99:
-            fhetot = 0.99
+        fhetot = min(fhetot, 0.99)
 
         #  Conductor fraction (including central helium channel)
         fcond = 1.0e0 - fhetot
+        #  Non-copper fraction of conductor
+        one_minus_fcu = 1.0e0 - fcu
 
         if tfcoil_variables.i_str_wp == 0:
             strain = tfcoil_variables.str_tf_con_res
         else:
             strain = tfcoil_variables.str_wp
 
+        # Upper critical field (T) and critical temperature (K) of the critical
+        # surface; user-defined for isumat = 4 and 7, unused for isumat = 2
+        if isumat == 4:
+            bc20m, tc0m = bcritsc, tcritsc
+        elif isumat == 7:
+            bc20m = tfcoil_variables.b_crit_upper_nbti
+            tc0m = tfcoil_variables.t_crit_nbti
+        else:
+            bc20m, tc0m = _SUPERCON_CRITICAL_SURFACE.get(int(isumat), (None, None))
+
         # Find critical current density in the superconducter (j_crit_sc)
         # and the superconducting cable (j_crit_cable)
         if isumat == 1:  # ITER Nb3Sn critical surface parameterization
-            bc20m = 32.97e0
-            tc0m = 16.06e0
             # If strain limit achieved, throw a warning and use the lower strain
-            if abs(strain) > 0.5e-2:
-                error_handling.fdiags[0] = strain
-                error_handling.report_error(261)
-                strain = np.sign(strain) * 0.5e-2
+            strain = clamp_strain(strain, 0.5e-2)
 
             #  j_crit_sc returned by superconductors.itersc is the critical current density in the
             #  superconductor - not the whole strand, which contains copper
             j_crit_sc, _, _ = superconductors.itersc(thelium, bmax, strain, bc20m, tc0m)
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calculation for costing in $/kAm
-            # = Superconducting filaments jc * (1 - strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         elif isumat == 2:  # Bi-2212 high temperature superconductor parameterization
             #  Current density in a strand of Bi-2212 conductor
@@ -995,7 +998,7 @@ class SuperconductingTFCoil(TFCoil):
             jstrand = jwp * aturn / (acs * fcond)
 
             j_crit_cable, tmarg = superconductors.bi2212(bmax, jstrand, thelium, fhts)
-            j_crit_sc = j_crit_cable / (1.0e0 - fcu)
+            j_crit_sc = j_crit_cable / one_minus_fcu
             #  Critical current in cable
             icrit = j_crit_cable * acs * fcond
 
@@ -1004,60 +1007,33 @@ class SuperconductingTFCoil(TFCoil):
             tfcoil_variables.j_crit_str_tf = j_crit_sc
 
         elif isumat == 3:  # NbTi data
-            bc20m = 15.0e0
-            tc0m = 9.3e0
             c0 = 1.0e10
             j_crit_sc, _ = superconductors.jcrit_nbti(thelium, bmax, c0, bc20m, tc0m)
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # = superconducting filaments jc * (1 -strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         elif isumat == 4:  # ITER Nb3Sn parameterization, but user-defined parameters
-            bc20m = bcritsc
-            tc0m = tcritsc
             # If strain limit achieved, throw a warning and use the lower strain
-            if abs(strain) > 0.5e-2:
-                error_handling.fdiags[0] = strain
-                error_handling.report_error(261)
-                strain = np.sign(strain) * 0.5e-2
+            strain = clamp_strain(strain, 0.5e-2)
 
-            j_crit_sc, _, _ = superconductors.itersc(thelium, bmax, strain, bc20m, tc0m)
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # = superconducting filaments jc * (1 -strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_sc, _, _ = superconductors.itersc(thelium, bmax, strain, bc20m, tc0m)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         elif isumat == 5:  # WST Nb3Sn parameterisation
-            bc20m = 32.97e0
-            tc0m = 16.06e0
             # If strain limit achieved, throw a warning and use the lower strain
-            if abs(strain) > 0.5e-2:
-                error_handling.fdiags[0] = strain
-                error_handling.report_error(261)
-                strain = np.sign(strain) * 0.5e-2
+            strain = clamp_strain(strain, 0.5e-2)
 
             #  j_crit_sc returned by superconductors.itersc is the critical current density in the
             #  superconductor - not the whole strand, which contains copper
             j_crit_sc, _, _ = superconductors.western_superconducting_nb3sn(
                 thelium, bmax, strain, bc20m, tc0m
             )
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # = superconducting filaments jc * (1 -strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         elif isumat == 6:  # "REBCO" 2nd generation HTS superconductor in CrCo strand
             raise ProcessValueError(
@@ -1065,52 +1041,34 @@ class SuperconductingTFCoil(TFCoil):
             )
 
         elif isumat == 7:  # Durham Ginzburg-Landau Nb-Ti parameterisation
-            bc20m = tfcoil_variables.b_crit_upper_nbti
-            tc0m = tfcoil_variables.t_crit_nbti
             j_crit_sc, _, _ = superconductors.gl_nbti(
                 thelium, bmax, strain, bc20m, tc0m
             )
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # = superconducting filaments jc * (1 -strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         elif isumat == 8:  # Durham Ginzburg-Landau critical surface model for REBCO
-            bc20m = 430
-            tc0m = 185
             # If strain limit achieved, throw a warning and use the lower strain
-            if abs(strain) > 0.7e-2:
-                error_handling.fdiags[0] = strain
-                error_handling.report_error(261)
-                strain = np.sign(strain) * 0.7e-2
+            strain = clamp_strain(strain, 0.7e-2)
 
             j_crit_sc, _, _ = superconductors.gl_rebco(
                 thelium, bmax, strain, bc20m, tc0m
             )
             # A0 calculated for tape cross section already
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable (copper added at this stage in HTS cables)
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # Already includes buffer and support layers so no need to include fcu here
-            tfcoil_variables.j_crit_str_tf = j_crit_sc
+            # Strand critical current for costing already includes buffer and
+            # support layers so no need to include fcu here
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(
+                    j_crit_sc, one_minus_fcu, fcond, acs, strand_copper=False
+                )
+            )
 
         elif (
             isumat == 9
         ):  # Hazelton experimental data + Zhai conceptual model for REBCO
-            bc20m = 138
-            tc0m = 92
             # If strain limit achieved, throw a warning and use the lower strain
-            if abs(strain) > 0.7e-2:
-                error_handling.fdiags[0] = strain
-                error_handling.report_error(261)
-                strain = np.sign(strain) * 0.7e-2
+            strain = clamp_strain(strain, 0.7e-2)
 
             # 'high current density' as per parameterisation described in Wolf,
             #  and based on Hazelton experimental data and Zhai conceptual model;
@@ -1124,28 +1082,20 @@ class SuperconductingTFCoil(TFCoil):
                 rebco_variables.rebco_thickness,
                 rebco_variables.tape_thickness,
             )
-            # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
-            j_crit_cable = j_crit_sc * (1.0e0 - fcu) * fcond
-            #  Critical current in cable (copper added at this stage in HTS cables)
-            icrit = j_crit_cable * acs
-
-            # Strand critical current calulation for costing in $ / kAm
-            # = superconducting filaments jc * (1 -strand copper fraction)
-            tfcoil_variables.j_crit_str_tf = j_crit_sc * (1.0e0 - fcu)
+            j_crit_cable, icrit, tfcoil_variables.j_crit_str_tf = (
+                _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs)
+            )
 
         else:
             raise ProcessValueError("Illegal value for i_tf_sc_mat", isumat=isumat)
 
-        # Critical current density in winding pack
+        # Critical and operating winding pack current densities, ratio of operating /
+        # critical current and actual current density in superconductor, which should
+        # be equal to jcrit(thelium+tmarg) when we have found the desired value of tmarg
         # aturn : Area per turn (i.e. entire jacketed conductor with insulation) (m2)
-        j_tf_wp_critical = icrit / aturn
-        #  Ratio of operating / critical current
-        iooic = iop / icrit
-        #  Operating current density
-        jwdgop = iop / aturn
-        #  Actual current density in superconductor, which should be equal to jcrit(thelium+tmarg)
-        #  when we have found the desired value of tmarg
-        jsc = iooic * j_crit_sc
+        j_tf_wp_critical, iooic, jwdgop, jsc = _conductor_operating_point(
+            float(iop), float(aturn), float(icrit), float(j_crit_sc)
+        )
 
         if iooic <= 0e0:
             logger.warning(
@@ -1180,22 +1130,23 @@ class SuperconductingTFCoil(TFCoil):
             else:
                 arguments = (isumat, jsc, bmax, strain, bc20m, tc0m)
 
-            another_estimate = 2 * thelium
-            t_zero_margin, root_result = optimize.newton(
+            # Start the secant iteration around the minimum allowed margin, where
+            # a constrained design's current sharing temperature usually lies
+            tmargmin = tfcoil_variables.tmargmin_tf
+            if tmargmin > 0.0e0:
+                t_guess, t_guess_next = thelium + tmargmin, thelium + 2.0e0 * tmargmin
+            else:
+                t_guess, t_guess_next = thelium, 2 * thelium
+
+            t_zero_margin = secant_root(
                 superconductors.current_density_margin,
-                thelium,
-                fprime=None,
-                args=arguments,
-                # args=(isumat, jsc, bmax, strain, bc20m, tc0m,),
+                t_guess,
+                t_guess_next,
+                arguments,
                 tol=1.0e-06,
-                maxiter=50,
-                fprime2=None,
-                x1=another_estimate,
                 rtol=1.0e-6,
-                full_output=True,
-                disp=True,
+                maxiter=50,
             )
-            # print(root_result)  # Diagnostic for newton method
             tmarg = t_zero_margin - thelium
             tfcoil_variables.temp_margin = tmarg
 
@@ -1221,118 +1172,24 @@ class SuperconductingTFCoil(TFCoil):
             po.oheadr(self.outfile, "Superconducting TF Coils")
             po.ovarin(self.outfile, "Superconductor switch", "(isumat)", isumat)
 
-            if isumat == 1:
-                po.ocmmnt(self.outfile, "Superconductor used: Nb3Sn")
-                po.ocmmnt(self.outfile, "  (ITER Jcrit model, standard parameters)")
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 2:
-                po.ocmmnt(self.outfile, "Superconductor used: Bi-2212 HTS")
-            if isumat == 3:
-                po.ocmmnt(self.outfile, "Superconductor used: NbTi")
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 4:
-                po.ocmmnt(self.outfile, "Superconductor used: Nb3Sn")
-                po.ocmmnt(self.outfile, "  (ITER Jcrit model, user-defined parameters)")
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 5:
-                po.ocmmnt(self.outfile, "Superconductor used: Nb3Sn")
-                po.ocmmnt(self.outfile, " (WST Nb3Sn critical surface model)")
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 7:
-                po.ocmmnt(self.outfile, "Superconductor used: Nb-Ti")
-                po.ocmmnt(
-                    self.outfile, " (Durham Ginzburg-Landau critical surface model)"
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 8:
-                po.ocmmnt(self.outfile, "Superconductor used: REBCO")
-                po.ocmmnt(
-                    self.outfile, " (Durham Ginzburg-Landau critical surface model)"
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
-                )
-            if isumat == 9:
-                po.ocmmnt(self.outfile, "Superconductor used: REBCO")
-                po.ocmmnt(
+            for comment in _SUPERCON_DESCRIPTIONS[int(isumat)]:
+                po.ocmmnt(self.outfile, comment)
+            # Bi-2212 has no critical surface parameters
+            if isumat != 2:
+                po.ovarre_rows(
                     self.outfile,
-                    " (Hazelton experimental data + Zhai conceptual model)",
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical field at zero temperature and strain (T)",
-                    "(bc20m)",
-                    bc20m,
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Critical temperature at zero field and strain (K)",
-                    "(tc0m)",
-                    tc0m,
+                    [
+                        (
+                            "Critical field at zero temperature and strain (T)",
+                            "(bc20m)",
+                            bc20m,
+                        ),
+                        (
+                            "Critical temperature at zero field and strain (K)",
+                            "(tc0m)",
+                            tc0m,
+                        ),
+                    ],
                 )
 
             if global_variables.run_tests == 1:
@@ -1342,111 +1199,100 @@ class SuperconductingTFCoil(TFCoil):
                     "PROCESS TF Coil peak field fit. Values for t, z and y:",
                 )
                 po.oblnkl(self.outfile)
-                po.ovarre(
-                    self.outfile,
-                    "Dimensionless winding pack width",
-                    "(tf_fit_t)",
-                    sctfcoil_module.tf_fit_t,
-                    "OP ",
-                )
-                po.ovarre(
-                    self.outfile,
-                    "Dimensionless winding pack radial thickness",
-                    "(tf_fit_z)",
-                    sctfcoil_module.tf_fit_z,
-                    "OP ",
-                )
-                po.ovarre(
+                po.ovarre_rows(
                     self.outfile,
-                    "Ratio of peak field with ripple to nominal axisymmetric peak field",
-                    "(tf_fit_y)",
-                    sctfcoil_module.tf_fit_y,
-                    "OP ",
+                    [
+                        (
+                            "Dimensionless winding pack width",
+                            "(tf_fit_t)",
+                            sctfcoil_module.tf_fit_t,
+                            "OP ",
+                        ),
+                        (
+                            "Dimensionless winding pack radial thickness",
+                            "(tf_fit_z)",
+                            sctfcoil_module.tf_fit_z,
+                            "OP ",
+                        ),
+                        (
+                            "Ratio of peak field with ripple to nominal axisymmetric peak field",
+                            "(tf_fit_y)",
+                            sctfcoil_module.tf_fit_y,
+                            "OP ",
+                        ),
+                    ],
                 )
 
             po.oblnkl(self.outfile)
-            po.ovarre(
-                self.outfile,
-                "Helium temperature at peak field (= superconductor temperature) (K)",
-                "(thelium)",
-                thelium,
-            )
-            po.ovarre(
-                self.outfile,
-                "Total helium fraction inside cable space",
-                "(fhetot)",
-                fhetot,
-                "OP ",
-            )
-            po.ovarre(self.outfile, "Copper fraction of conductor", "(fcutfsu)", fcu)
-            po.ovarre(
-                self.outfile,
-                "Residual manufacturing strain on superconductor",
-                "(str_tf_con_res)",
-                tfcoil_variables.str_tf_con_res,
-            )
-            po.ovarre(
-                self.outfile,
-                "Self-consistent strain on superconductor",
-                "(str_wp)",
-                tfcoil_variables.str_wp,
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in superconductor (A/m2)",
-                "(j_crit_sc)",
-                j_crit_sc,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in cable (A/m2)",
-                "(j_crit_cable)",
-                j_crit_cable,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Critical current density in winding pack (A/m2)",
-                "(j_tf_wp_critical)",
-                j_tf_wp_critical,
-                "OP ",
-            )
-            po.ovarre(
-                self.outfile,
-                "Actual current density in winding pack (A/m2)",
-                "(jwdgop)",
-                jwdgop,
-                "OP ",
-            )
-
-            po.ovarre(
-                self.outfile,
-                "Minimum allowed temperature margin in superconductor (K)",
-                "(tmargmin_tf)",
-                tfcoil_variables.tmargmin_tf,
-            )
-            po.ovarre(
-                self.outfile,
-                "Actual temperature margin in superconductor (K)",
-                "(tmarg)",
-                tmarg,
-                "OP ",
-            )
-            po.ovarre(self.outfile, "Critical current (A)", "(icrit)", icrit, "OP ")
-            po.ovarre(
-                self.outfile,
-                "Actual current (A)",
-                "(c_tf_turn)",
-                tfcoil_variables.c_tf_turn,
-                "OP ",
-            )
-            po.ovarre(
+            po.ovarre_rows(
                 self.outfile,
-                "Actual current / critical current",
-                "(iooic)",
-                iooic,
-                "OP ",
+                [
+                    (
+                        "Helium temperature at peak field (= superconductor temperature) (K)",
+                        "(thelium)",
+                        thelium,
+                    ),
+                    (
+                        "Total helium fraction inside cable space",
+                        "(fhetot)",
+                        fhetot,
+                        "OP ",
+                    ),
+                    ("Copper fraction of conductor", "(fcutfsu)", fcu),
+                    (
+                        "Residual manufacturing strain on superconductor",
+                        "(str_tf_con_res)",
+                        tfcoil_variables.str_tf_con_res,
+                    ),
+                    (
+                        "Self-consistent strain on superconductor",
+                        "(str_wp)",
+                        tfcoil_variables.str_wp,
+                    ),
+                    (
+                        "Critical current density in superconductor (A/m2)",
+                        "(j_crit_sc)",
+                        j_crit_sc,
+                        "OP ",
+                    ),
+                    (
+                        "Critical current density in cable (A/m2)",
+                        "(j_crit_cable)",
+                        j_crit_cable,
+                        "OP ",
+                    ),
+                    (
+                        "Critical current density in winding pack (A/m2)",
+                        "(j_tf_wp_critical)",
+                        j_tf_wp_critical,
+                        "OP ",
+                    ),
+                    (
+                        "Actual current density in winding pack (A/m2)",
+                        "(jwdgop)",
+                        jwdgop,
+                        "OP ",
+                    ),
+                    (
+                        "Minimum allowed temperature margin in superconductor (K)",
+                        "(tmargmin_tf)",
+                        tfcoil_variables.tmargmin_tf,
+                    ),
+                    (
+                        "Actual temperature margin in superconductor (K)",
+                        "(tmarg)",
+                        tmarg,
+                        "OP ",
+                    ),
+                    ("Critical current (A)", "(icrit)", icrit, "OP "),
+                    (
+                        "Actual current (A)",
+                        "(c_tf_turn)",
+                        tfcoil_variables.c_tf_turn,
+                        "OP ",
+                    ),
+                    ("Actual current / critical current", "(iooic)", iooic, "OP "),
+                ],
             )
 
         return j_tf_wp_critical, vd, tmarg
@@ -1472,70 +1318,17 @@ class SuperconductingTFCoil(TFCoil):
         It also finds the dump voltage.
         <P>These calculations are based on Miller's formulations.
         """
-        # Integration coefficients p1,p2,p3
-        p1 = (
-            0.0e0,
-            0.8e0,
-            1.75e0,
-            2.4e0,
-            2.7e0,
-            2.95e0,
-            3.1e0,
-            3.2e0,
-            3.3e0,
-            3.4e0,
-            3.5e0,
+        return _protect(
+            float(aio),
+            float(tfes),
+            float(acs),
+            float(aturn),
+            float(tdump),
+            float(fcond),
+            float(fcu),
+            float(tba),
+            float(tmax),
         )
-        p2 = (
-            0.0e0,
-            0.05e0,
-            0.5e0,
-            1.4e0,
-            2.6e0,
-            3.7e0,
-            4.6e0,
-            5.3e0,
-            5.95e0,
-            6.55e0,
-            7.1e0,
-        )
-        p3 = (
-            0.0e0,
-            0.05e0,
-            0.5e0,
-            1.4e0,
-            2.6e0,
-            3.7e0,
-            4.6e0,
-            5.4e0,
-            6.05e0,
-            6.8e0,
-            7.2e0,
-        )
-
-        #  Dump voltage
-
-        vd = 2.0e0 * tfes / (tdump * aio)
-
-        #  Current density limited by temperature rise during quench
-
-        tav = 1.0e0 + (tmax - tba) / 20.0e0
-        n_o = int(tav)
-        n_p = n_o + 1
-        n_p = min(n_p, 11)
-
-        ai1 = 1.0e16 * (p1[n_o - 1] + (p1[n_p - 1] - p1[n_o - 1]) * (tav - n_o))
-        ai2 = 1.0e16 * (p2[n_o - 1] + (p2[n_p - 1] - p2[n_o - 1]) * (tav - n_o))
-        ai3 = 1.0e16 * (p3[n_o - 1] + (p3[n_p - 1] - p3[n_o - 1]) * (tav - n_o))
-
-        aa = vd * aio / tfes
-        bb = (1.0e0 - fcond) * fcond * fcu * ai1
-        cc = (fcu * fcond) ** 2 * ai2
-        dd = (1.0e0 - fcu) * fcu * fcond**2 * ai3
-        ajcp = np.sqrt(aa * (bb + cc + dd))
-        ajwpro = ajcp * (acs / aturn)
-
-        return ajwpro, vd
 
         # ---
 
@@ -1551,12 +1344,20 @@ class SuperconductingTFCoil(TFCoil):
         We assume vertical symmetry which is only true for double null
         machines.
         """
+        # Inputs used several times below, read from Fortran once
+        r_tf_inboard_out = build_variables.r_tf_inboard_out
+        r_tf_outboard_mid = build_variables.r_tf_outboard_mid
+        r_vv_inboard_out = build_variables.r_vv_inboard_out
+        dr_vv_outboard = build_variables.dr_vv_outboard
+        tfa_inboard = tfcoil_variables.tfa[0]
+        n_tf_coil_turns = tfcoil_variables.n_tf_coil_turns
+
         H_coil = build_variables.z_tf_inside_half + (build_variables.dr_tf_inboard / 2)
         ri_coil = build_variables.r_tf_inboard_mid
-        ro_coil = build_variables.r_tf_outboard_mid
+        ro_coil = r_tf_outboard_mid
         # NOTE: rm is measured from the outside edge of the coil because thats where
         # the radius of the first ellipse is measured from
-        rm_coil = build_variables.r_tf_inboard_out + tfcoil_variables.tfa[0]
+        rm_coil = r_tf_inboard_out + tfa_inboard
 
         H_vv = (
             build_variables.z_plasma_xpoint_upper
@@ -1568,22 +1369,20 @@ class SuperconductingTFCoil(TFCoil):
         # ri and ro for VV dont consider the shield widths
         # because it is assumed the shield is on the plasma side
         # of the VV
-        ri_vv = build_variables.r_vv_inboard_out - (build_variables.dr_vv_outboard / 2)
+        ri_vv = r_vv_inboard_out - (dr_vv_outboard / 2)
         ro_vv = (
-            build_variables.r_tf_outboard_mid
+            r_tf_outboard_mid
             - (build_variables.dr_tf_outboard / 2)
             - build_variables.dr_tf_shld_gap
             - build_variables.dr_shld_thermal_outboard
             - build_variables.dr_shld_vv_gap_outboard
-            - (build_variables.dr_vv_outboard / 2)
+            - (dr_vv_outboard / 2)
         )
 
         # Assume the radius of the first ellipse of the VV is in the same proportion to
         # that of the plasma facing radii of the two structures
-        tf_vv_frac = build_variables.r_tf_inboard_out / build_variables.r_vv_inboard_out
-        rm_vv = build_variables.r_vv_inboard_out + (
-            tfcoil_variables.tfa[0] * tf_vv_frac
-        )
+        tf_vv_frac = r_tf_inboard_out / r_vv_inboard_out
+        rm_vv = r_vv_inboard_out + (tfa_inboard * tf_vv_frac)
 
         sctfcoil_module.vv_stress_quench = vv_stress_on_quench(
             # TF shape
@@ -1601,16 +1400,16 @@ class SuperconductingTFCoil(TFCoil):
             theta1_vv=tfcoil_variables.theta1_vv,
             # TF properties
             n_tf_coils=tfcoil_variables.n_tf_coils,
-            n_tf_coil_turns=tfcoil_variables.n_tf_coil_turns,
+            n_tf_coil_turns=n_tf_coil_turns,
             # Area of the radial plate taken to be the area of steel in the WP
             # TODO: value clipped due to #1883
-            s_rp=np.clip(sctfcoil_module.a_tf_steel, 0, None),
+            s_rp=max(sctfcoil_module.a_tf_steel, 0.0),
             s_cc=sctfcoil_module.a_case_front
             + sctfcoil_module.a_case_nose
             + 2.0 * sctfcoil_module.t_lat_case_av,
             taud=tfcoil_variables.tdmptf,
             # TODO: is this the correct current?
-            i_op=sctfcoil_module.c_tf_coil / tfcoil_variables.n_tf_coil_turns,
+            i_op=sctfcoil_module.c_tf_coil / n_tf_coil_turns,
             # VV properties
             d_vv=build_variables.dr_vv_shells,
         )
@@ -1647,62 +1446,46 @@ class SuperconductingTFCoil(TFCoil):
         :rtype: Tuple[float, int]
 
         """
-        a = np.zeros((4,))
-        flag = 0
-
-        #  Set fitting coefficients for different numbers of TF coils
-
-        int_n_tf = np.round(n_tf_coils)
-
-        if int_n_tf == 16:
-            a[0] = 0.28101e0
-            a[1] = 1.8481e0
-            a[2] = -0.88159e0
-            a[3] = 0.93834e0
-        elif int_n_tf == 18:
-            a[0] = 0.29153e0
-            a[1] = 1.81600e0
-            a[2] = -0.84178e0
-            a[3] = 0.90426e0
-        elif int_n_tf == 20:
-            a[0] = 0.29853e0
-            a[1] = 1.82130e0
-            a[2] = -0.85031e0
-            a[3] = 0.89808e0
-
-        else:
+        #  Fitting coefficients for different numbers of TF coils
+        coefficients = _RIPPLE_FIT_COEFFICIENTS.get(round(float(n_tf_coils)))
+        if coefficients is None:
             bmaxtfrp = 1.09e0 * b_tf_inboard_peak
-            return bmaxtfrp, flag
+            return bmaxtfrp, 0
+        a0, a1, a2, a3 = coefficients
 
         #  Maximum winding pack width before adjacent packs touch
         #  (ignoring the external case and ground wall thicknesses)
 
-        wmax = (2.0e0 * tfin + dr_tf_wp) * np.tan(np.pi / n_tf_coils)
+        wmax = (2.0e0 * tfin + dr_tf_wp) * math.tan(math.pi / n_tf_coils)
 
         #  Dimensionless winding pack width
 
-        sctfcoil_module.tf_fit_t = wwp1 / wmax
-        if (sctfcoil_module.tf_fit_t < 0.3e0) or (sctfcoil_module.tf_fit_t > 1.1e0):
-            # write(*,*) 'PEAK_TF_WITH_RIPPLE: fitting problem; t = ',t
-            flag = 1
+        tf_fit_t = wwp1 / wmax
 
         #  Dimensionless winding pack radial thickness
 
-        sctfcoil_module.tf_fit_z = dr_tf_wp / wmax
-        if (sctfcoil_module.tf_fit_z < 0.26e0) or (sctfcoil_module.tf_fit_z > 0.7e0):
-            # write(*,*) 'PEAK_TF_WITH_RIPPLE: fitting problem; z = ',z
-            flag = 2
+        tf_fit_z = dr_tf_wp / wmax
+
+        #  Flag a fit outside its range of validity: 1 for the width t, 2 for
+        #  the radial thickness z, which takes priority when both are out
+
+        flag = (
+            2
+            if (tf_fit_z < 0.26e0) or (tf_fit_z > 0.7e0)
+            else (1 if (tf_fit_t < 0.3e0) or (tf_fit_t > 1.1e0) else 0)
+        )
 
         #  Ratio of peak field with ripple to nominal axisymmetric peak field
 
-        sctfcoil_module.tf_fit_y = (
-            a[0]
-            + a[1] * np.exp(-sctfcoil_module.tf_fit_t)
-            + a[2] * sctfcoil_module.tf_fit_z
-            + a[3] * sctfcoil_module.tf_fit_z * sctfcoil_module.tf_fit_t
+        tf_fit_y = (
+            a0 + a1 * math.exp(-tf_fit_t) + a2 * tf_fit_z + a3 * tf_fit_z * tf_fit_t
         )
 
-        bmaxtfrp = sctfcoil_module.tf_fit_y * b_tf_inboard_peak
+        sctfcoil_module.tf_fit_t = tf_fit_t
+        sctfcoil_module.tf_fit_z = tf_fit_z
+        sctfcoil_module.tf_fit_y = tf_fit_y
+
+        bmaxtfrp = tf_fit_y * b_tf_inboard_peak
 
         return bmaxtfrp, flag
 
@@ -1753,81 +1536,81 @@ class SuperconductingTFCoil(TFCoil):
 
         # Areas and fractions
         # -------------------
+        n_tf_coil_turns = tfcoil_variables.n_tf_coil_turns
+        a_tf_turn_cable_space = tfcoil_variables.a_tf_turn_cable_space
+        vftf = tfcoil_variables.vftf
+        n_tf_coils = tfcoil_variables.n_tf_coils
+        a_tf_coil_inboard = tfcoil_variables.a_tf_coil_inboard
+
         # Central helium channel down the conductor core [m2]
-        tfcoil_variables.a_tf_wp_coolant_channels = (
+        a_tf_wp_coolant_channels = (
             0.25e0
-            * tfcoil_variables.n_tf_coil_turns
-            * np.pi
+            * n_tf_coil_turns
+            * math.pi
             * tfcoil_variables.dia_tf_turn_coolant_channel**2
         )
 
         # Total conductor cross-sectional area, taking account of void area
         # and central helium channel [m2]
-        tfcoil_variables.acond = (
-            tfcoil_variables.a_tf_turn_cable_space
-            * tfcoil_variables.n_tf_coil_turns
-            * (1.0e0 - tfcoil_variables.vftf)
-            - tfcoil_variables.a_tf_wp_coolant_channels
+        acond = (
+            a_tf_turn_cable_space * n_tf_coil_turns * (1.0e0 - vftf)
+            - a_tf_wp_coolant_channels
         )
 
         # Void area in conductor for He, not including central channel [m2]
-        tfcoil_variables.avwp = (
-            tfcoil_variables.a_tf_turn_cable_space
-            * tfcoil_variables.n_tf_coil_turns
-            * tfcoil_variables.vftf
-        )
+        avwp = a_tf_turn_cable_space * n_tf_coil_turns * vftf
 
         # Area of inter-turn insulation: total [m2]
-        tfcoil_variables.a_tf_coil_wp_turn_insulation = (
-            tfcoil_variables.n_tf_coil_turns * tfcoil_variables.a_tf_turn_insulation
+        a_tf_coil_wp_turn_insulation = (
+            n_tf_coil_turns * tfcoil_variables.a_tf_turn_insulation
         )
 
         # Area of steel structure in winding pack [m2]
-        tfcoil_variables.aswp = (
-            tfcoil_variables.n_tf_coil_turns * tfcoil_variables.a_tf_turn_steel
-        )
+        aswp = n_tf_coil_turns * tfcoil_variables.a_tf_turn_steel
 
         # Inboard coil steel area [m2]
-        sctfcoil_module.a_tf_steel = tfcoil_variables.acasetf + tfcoil_variables.aswp
+        a_tf_steel = tfcoil_variables.acasetf + aswp
 
         # Inboard coil steel fraction [-]
-        sctfcoil_module.f_tf_steel = (
-            tfcoil_variables.n_tf_coils
-            * sctfcoil_module.a_tf_steel
-            / tfcoil_variables.a_tf_coil_inboard
-        )
+        f_tf_steel = n_tf_coils * a_tf_steel / a_tf_coil_inboard
 
         # Inboard coil insulation cross-section [m2]
-        sctfcoil_module.a_tf_ins = (
-            tfcoil_variables.a_tf_coil_wp_turn_insulation + sctfcoil_module.a_ground_ins
-        )
+        a_tf_ins = a_tf_coil_wp_turn_insulation + sctfcoil_module.a_ground_ins
 
         #  Inboard coil insulation fraction [-]
-        sctfcoil_module.f_tf_ins = (
-            tfcoil_variables.n_tf_coils
-            * sctfcoil_module.a_tf_ins
-            / tfcoil_variables.a_tf_coil_inboard
-        )
+        f_tf_ins = n_tf_coils * a_tf_ins / a_tf_coil_inboard
+
+        tfcoil_variables.a_tf_wp_coolant_channels = a_tf_wp_coolant_channels
+        tfcoil_variables.acond = acond
+        tfcoil_variables.avwp = avwp
+        tfcoil_variables.a_tf_coil_wp_turn_insulation = a_tf_coil_wp_turn_insulation
+        tfcoil_variables.aswp = aswp
+        sctfcoil_module.a_tf_steel = a_tf_steel
+        sctfcoil_module.f_tf_steel = f_tf_steel
+        sctfcoil_module.a_tf_ins = a_tf_ins
+        sctfcoil_module.f_tf_ins = f_tf_ins
 
         # Negative areas or fractions error reporting
         if (
-            tfcoil_variables.acond <= 0.0e0
-            or tfcoil_variables.avwp <= 0.0e0
-            or tfcoil_variables.a_tf_coil_wp_turn_insulation <= 0.0e0
-            or tfcoil_variables.aswp <= 0.0e0
-            or sctfcoil_module.a_tf_steel <= 0.0e0
-            or sctfcoil_module.f_tf_steel <= 0.0e0
-            or sctfcoil_module.a_tf_ins <= 0.0e0
-            or sctfcoil_module.f_tf_ins <= 0.0e0
+            acond <= 0.0e0
+            or avwp <= 0.0e0
+            or a_tf_coil_wp_turn_insulation <= 0.0e0
+            or aswp <= 0.0e0
+            or a_tf_steel <= 0.0e0
+            or f_tf_steel <= 0.0e0
+            or a_tf_ins <= 0.0e0
+            or f_tf_ins <= 0.0e0
         ):
-            error_handling.fdiags[0] = tfcoil_variables.acond
-            error_handling.fdiags[1] = tfcoil_variables.avwp
-            error_handling.fdiags[2] = tfcoil_variables.a_tf_coil_wp_turn_insulation
-            error_handling.fdiags[3] = tfcoil_variables.aswp
-            error_handling.fdiags[4] = sctfcoil_module.a_tf_steel
-            error_handling.fdiags[5] = sctfcoil_module.f_tf_steel
-            error_handling.fdiags[6] = sctfcoil_module.a_tf_ins
-            error_handling.fdiags[7] = sctfcoil_module.f_tf_ins
+            error_handling.fdiags[:8] = (
+                acond,
+                avwp,
+                a_tf_coil_wp_turn_insulation,
+                aswp,
+                a_tf_steel,
+                f_tf_steel,
+                a_tf_ins,
+                f_tf_ins,
+            )
             error_handling.report_error(276)
 
     def tf_wp_geom(self, i_tf_wp_geom):
@@ -1835,158 +1618,112 @@ class SuperconductingTFCoil(TFCoil):
          Author : S. Kahn, CCFE
         Seting the WP geometry and area for SC magnets
         """
-        sctfcoil_module.r_wp_inner = (
-            build_variables.r_tf_inboard_in + tfcoil_variables.dr_tf_nose_case
-        )
+        dr_tf_wp = tfcoil_variables.dr_tf_wp
+        dx_tf_side_case = tfcoil_variables.dx_tf_side_case
+        tan_theta_coil = sctfcoil_module.tan_theta_coil
+        tfinsgap = tfcoil_variables.tfinsgap
+        # Ground insulation plus insertion gap thickness [m]
+        t_ins = tfcoil_variables.tinstf + tfinsgap
+
+        r_wp_inner = build_variables.r_tf_inboard_in + tfcoil_variables.dr_tf_nose_case
 
         # Radial position of outer edge of winding pack [m]
-        sctfcoil_module.r_wp_outer = (
-            sctfcoil_module.r_wp_inner + tfcoil_variables.dr_tf_wp
-        )
+        r_wp_outer = r_wp_inner + dr_tf_wp
 
         # Radius of geometrical centre of winding pack [m]
-        sctfcoil_module.r_wp_centre = 0.5e0 * (
-            sctfcoil_module.r_wp_inner + sctfcoil_module.r_wp_outer
-        )
+        r_wp_centre = 0.5e0 * (r_wp_inner + r_wp_outer)
 
         # TF toroidal thickness at the WP inner radius [m]
-        t_tf_at_wp = 2.0e0 * sctfcoil_module.r_wp_inner * sctfcoil_module.tan_theta_coil
+        t_tf_at_wp = 2.0e0 * r_wp_inner * tan_theta_coil
 
         # Minimal toroidal thickness of winding pack [m]
-        sctfcoil_module.t_wp_toroidal = (
-            t_tf_at_wp - 2.0e0 * tfcoil_variables.dx_tf_side_case
-        )
+        t_wp_toroidal = t_tf_at_wp - 2.0e0 * dx_tf_side_case
 
         # Rectangular WP
         # --------------
         if i_tf_wp_geom == 0:
             # Outer WP layer toroidal thickness [m]
-            tfcoil_variables.wwp1 = sctfcoil_module.t_wp_toroidal
+            wwp1 = t_wp_toroidal
 
             # Averaged toroidal thickness of of winding pack [m]
-            sctfcoil_module.t_wp_toroidal_av = sctfcoil_module.t_wp_toroidal
+            t_wp_toroidal_av = t_wp_toroidal
 
             # Total cross-sectional area of winding pack [m2]
-            sctfcoil_module.awpc = (
-                tfcoil_variables.dr_tf_wp * sctfcoil_module.t_wp_toroidal
-            )
+            awpc = dr_tf_wp * t_wp_toroidal
 
             # WP cross-section without insertion gap and ground insulation [m2]
-            sctfcoil_module.awptf = (
-                tfcoil_variables.dr_tf_wp
-                - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-            ) * (
-                sctfcoil_module.t_wp_toroidal
-                - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-            )
+            awptf = (dr_tf_wp - 2.0e0 * t_ins) * (t_wp_toroidal - 2.0e0 * t_ins)
 
             # Cross-section area of the WP ground insulation [m2]
-            sctfcoil_module.a_ground_ins = (
-                tfcoil_variables.dr_tf_wp - 2.0e0 * tfcoil_variables.tfinsgap
-            ) * (
-                sctfcoil_module.t_wp_toroidal - 2.0e0 * tfcoil_variables.tfinsgap
-            ) - sctfcoil_module.awptf
+            a_ground_ins = (dr_tf_wp - 2.0e0 * tfinsgap) * (
+                t_wp_toroidal - 2.0e0 * tfinsgap
+            ) - awptf
 
         # Double rectangular WP
         # ---------------------
         elif i_tf_wp_geom == 1:
-            # Thickness of winding pack section at R > sctfcoil_module.r_wp_centre [m]
-            tfcoil_variables.wwp1 = 2.0e0 * (
-                sctfcoil_module.r_wp_centre * sctfcoil_module.tan_theta_coil
-                - tfcoil_variables.dx_tf_side_case
-            )
+            # Thickness of winding pack section at R > r_wp_centre [m]
+            wwp1 = 2.0e0 * (r_wp_centre * tan_theta_coil - dx_tf_side_case)
 
-            # Thickness of winding pack section at R < sctfcoil_module.r_wp_centre [m]
-            tfcoil_variables.wwp2 = 2.0e0 * (
-                sctfcoil_module.r_wp_inner * sctfcoil_module.tan_theta_coil
-                - tfcoil_variables.dx_tf_side_case
-            )
+            # Thickness of winding pack section at R < r_wp_centre [m]
+            wwp2 = 2.0e0 * (r_wp_inner * tan_theta_coil - dx_tf_side_case)
+            tfcoil_variables.wwp2 = wwp2
 
             # Averaged toroidal thickness of of winding pack [m]
-            sctfcoil_module.t_wp_toroidal_av = 0.5e0 * (
-                tfcoil_variables.wwp1 + tfcoil_variables.wwp2
-            )
+            t_wp_toroidal_av = 0.5e0 * (wwp1 + wwp2)
 
             # Total cross-sectional area of winding pack [m2]
             # Including ground insulation and insertion gap
-            sctfcoil_module.awpc = (
-                tfcoil_variables.dr_tf_wp * sctfcoil_module.t_wp_toroidal_av
-            )
+            awpc = dr_tf_wp * t_wp_toroidal_av
 
             # WP cross-section without insertion gap and ground insulation [m2]
-            sctfcoil_module.awptf = (
-                0.5e0
-                * (
-                    tfcoil_variables.dr_tf_wp
-                    - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-                )
-                * (
-                    tfcoil_variables.wwp1
-                    + tfcoil_variables.wwp2
-                    - 4.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-                )
-            )
+            awptf = 0.5e0 * (dr_tf_wp - 2.0e0 * t_ins) * (wwp1 + wwp2 - 4.0e0 * t_ins)
 
             # Cross-section area of the WP ground insulation [m2]
-            sctfcoil_module.a_ground_ins = (
-                0.5e0
-                * (tfcoil_variables.dr_tf_wp - 2.0e0 * tfcoil_variables.tfinsgap)
-                * (
-                    tfcoil_variables.wwp1
-                    + tfcoil_variables.wwp2
-                    - 4.0e0 * tfcoil_variables.tfinsgap
-                )
-                - sctfcoil_module.awptf
+            a_ground_ins = (
+                0.5e0 * (dr_tf_wp - 2.0e0 * tfinsgap) * (wwp1 + wwp2 - 4.0e0 * tfinsgap)
+                - awptf
             )
 
         # Trapezoidal WP
         # --------------
         else:
-            # Thickness of winding pack section at sctfcoil_module.r_wp_outer [m]
-            tfcoil_variables.wwp1 = 2.0e0 * (
-                sctfcoil_module.r_wp_outer * sctfcoil_module.tan_theta_coil
-                - tfcoil_variables.dx_tf_side_case
-            )
+            # Thickness of winding pack section at r_wp_outer [m]
+            wwp1 = 2.0e0 * (r_wp_outer * tan_theta_coil - dx_tf_side_case)
 
-            # Thickness of winding pack section at sctfcoil_module.r_wp_inner [m]
-            tfcoil_variables.wwp2 = 2.0e0 * (
-                sctfcoil_module.r_wp_inner * sctfcoil_module.tan_theta_coil
-                - tfcoil_variables.dx_tf_side_case
-            )
+            # Thickness of winding pack section at r_wp_inner [m]
+            wwp2 = 2.0e0 * (r_wp_inner * tan_theta_coil - dx_tf_side_case)
+            tfcoil_variables.wwp2 = wwp2
 
             # Averaged toroidal thickness of of winding pack [m]
-            sctfcoil_module.t_wp_toroidal_av = 0.5e0 * (
-                tfcoil_variables.wwp1 + tfcoil_variables.wwp2
-            )
+            t_wp_toroidal_av = 0.5e0 * (wwp1 + wwp2)
 
             # Total cross-sectional area of winding pack [m2]
             # Including ground insulation and insertion gap
-            sctfcoil_module.awpc = tfcoil_variables.dr_tf_wp * (
-                tfcoil_variables.wwp2
-                + 0.5e0 * (tfcoil_variables.wwp1 - tfcoil_variables.wwp2)
-            )
+            awpc = dr_tf_wp * (wwp2 + 0.5e0 * (wwp1 - wwp2))
 
             # WP cross-section without insertion gap and ground insulation [m2]
-            sctfcoil_module.awptf = (
-                tfcoil_variables.dr_tf_wp
-                - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-            ) * (
-                tfcoil_variables.wwp2
-                - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-                + 0.5e0 * (tfcoil_variables.wwp1 - tfcoil_variables.wwp2)
+            awptf = (dr_tf_wp - 2.0e0 * t_ins) * (
+                wwp2 - 2.0e0 * t_ins + 0.5e0 * (wwp1 - wwp2)
             )
 
             # Cross-section area of the WP ground insulation [m2]
-            sctfcoil_module.a_ground_ins = (
-                tfcoil_variables.dr_tf_wp - 2.0e0 * tfcoil_variables.tfinsgap
-            ) * (
-                tfcoil_variables.wwp2
-                - 2.0e0 * tfcoil_variables.tfinsgap
-                + 0.5e0 * (tfcoil_variables.wwp1 - tfcoil_variables.wwp2)
-            ) - sctfcoil_module.awptf
+            a_ground_ins = (dr_tf_wp - 2.0e0 * tfinsgap) * (
+                wwp2 - 2.0e0 * tfinsgap + 0.5e0 * (wwp1 - wwp2)
+            ) - awptf
 
         # --------------
 
+        sctfcoil_module.r_wp_inner = r_wp_inner
+        sctfcoil_module.r_wp_outer = r_wp_outer
+        sctfcoil_module.r_wp_centre = r_wp_centre
+        sctfcoil_module.t_wp_toroidal = t_wp_toroidal
+        sctfcoil_module.t_wp_toroidal_av = t_wp_toroidal_av
+        sctfcoil_module.awpc = awpc
+        sctfcoil_module.awptf = awptf
+        sctfcoil_module.a_ground_ins = a_ground_ins
+        tfcoil_variables.wwp1 = wwp1
+
         # Negative WP area error reporting
         if sctfcoil_module.awptf <= 0.0e0 or sctfcoil_module.awpc <= 0.0e0:
             error_handling.fdiags[0] = sctfcoil_module.awptf
@@ -1998,40 +1735,46 @@ class SuperconductingTFCoil(TFCoil):
         Author : S. Kahn, CCFE
         Setting the case geometry and area for SC magnets
         """
-        tfcoil_variables.acasetf = (
+        awpc = sctfcoil_module.awpc
+        tan_theta_coil = sctfcoil_module.tan_theta_coil
+        rad_tf_coil_toroidal = sctfcoil_module.rad_tf_coil_toroidal
+        r_wp_outer = sctfcoil_module.r_wp_outer
+        r_wp_inner = sctfcoil_module.r_wp_inner
+        dx_tf_side_case = tfcoil_variables.dx_tf_side_case
+
+        acasetf = (
             tfcoil_variables.a_tf_coil_inboard / tfcoil_variables.n_tf_coils
-        ) - sctfcoil_module.awpc
+        ) - awpc
+        tfcoil_variables.acasetf = acasetf
 
         # Outboard leg cross-sectional area of surrounding case [m2]
-        tfcoil_variables.acasetfo = (
-            tfcoil_variables.a_tf_leg_outboard - sctfcoil_module.awpc
-        )
+        acasetfo = tfcoil_variables.a_tf_leg_outboard - awpc
+        tfcoil_variables.acasetfo = acasetfo
 
         # Front casing area [m2]
         if i_tf_case_geom == 0:
             # Circular front case
-            sctfcoil_module.a_case_front = (
-                sctfcoil_module.rad_tf_coil_toroidal
-                * build_variables.r_tf_inboard_out**2
-                - sctfcoil_module.tan_theta_coil * sctfcoil_module.r_wp_outer**2
-            )
+            r_tf_inboard_out = build_variables.r_tf_inboard_out
+            sctfcoil_module.a_case_front = rad_tf_coil_toroidal * (
+                r_tf_inboard_out * r_tf_inboard_out
+            ) - tan_theta_coil * (r_wp_outer * r_wp_outer)
         else:
             # Straight front case
+            r_case_front = r_wp_outer + tfcoil_variables.dr_tf_plasma_case
             sctfcoil_module.a_case_front = (
-                (sctfcoil_module.r_wp_outer + tfcoil_variables.dr_tf_plasma_case) ** 2
-                - sctfcoil_module.r_wp_outer**2
-            ) * sctfcoil_module.tan_theta_coil
+                r_case_front * r_case_front - r_wp_outer * r_wp_outer
+            ) * tan_theta_coil
 
         # Nose casing area [m2]
-        sctfcoil_module.a_case_nose = (
-            sctfcoil_module.tan_theta_coil * sctfcoil_module.r_wp_inner**2
-            - sctfcoil_module.rad_tf_coil_toroidal * build_variables.r_tf_inboard_in**2
-        )
+        r_tf_inboard_in = build_variables.r_tf_inboard_in
+        sctfcoil_module.a_case_nose = tan_theta_coil * (
+            r_wp_inner * r_wp_inner
+        ) - rad_tf_coil_toroidal * (r_tf_inboard_in * r_tf_inboard_in)
 
         # Report error if the casing area is negative
-        if tfcoil_variables.acasetf <= 0.0e0 or tfcoil_variables.acasetfo <= 0.0e0:
-            error_handling.fdiags[0] = tfcoil_variables.acasetf
-            error_handling.fdiags[1] = tfcoil_variables.acasetfo
+        if acasetf <= 0.0e0 or acasetfo <= 0.0e0:
+            error_handling.fdiags[0] = acasetf
+            error_handling.fdiags[1] = acasetfo
             error_handling.report_error(99)
 
         # Average lateral casing thickness
@@ -2039,20 +1782,18 @@ class SuperconductingTFCoil(TFCoil):
         # Rectangular casing
         if i_tf_wp_geom == 0:
             sctfcoil_module.t_lat_case_av = (
-                tfcoil_variables.dx_tf_side_case
-                + 0.5e0 * sctfcoil_module.tan_theta_coil * tfcoil_variables.dr_tf_wp
+                dx_tf_side_case + 0.5e0 * tan_theta_coil * tfcoil_variables.dr_tf_wp
             )
 
         # Double rectangular WP
         elif i_tf_wp_geom == 1:
             sctfcoil_module.t_lat_case_av = (
-                tfcoil_variables.dx_tf_side_case
-                + 0.25e0 * sctfcoil_module.tan_theta_coil * tfcoil_variables.dr_tf_wp
+                dx_tf_side_case + 0.25e0 * tan_theta_coil * tfcoil_variables.dr_tf_wp
             )
 
         # Trapezoidal WP
         else:
-            sctfcoil_module.t_lat_case_av = tfcoil_variables.dx_tf_side_case
+            sctfcoil_module.t_lat_case_av = dx_tf_side_case
 
         # --------------
 
@@ -2071,73 +1812,51 @@ class SuperconductingTFCoil(TFCoil):
         """
         sctfcoil_module.rbcndut = dx_tf_turn_steel * 0.75e0
 
-        # Radial turn dimension [m]
-        sctfcoil_module.dr_tf_turn = (
-            tfcoil_variables.dr_tf_wp
-            - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-        ) / n_layer
+        (
+            sctfcoil_module.dr_tf_turn,
+            sctfcoil_module.dx_tf_turn,
+            tfcoil_variables.t_turn_tf,
+            n_tf_coil_turns,
+            c_tf_turn,
+            sctfcoil_module.t_conductor_radial,
+            sctfcoil_module.t_conductor_toroidal,
+            tfcoil_variables.t_conductor,
+            sctfcoil_module.dr_tf_turn_cable_space,
+            sctfcoil_module.dx_tf_turn_cable_space,
+            sctfcoil_module.t_cable,
+        ) = _integer_turn_dimensions(
+            float(tfcoil_variables.dr_tf_wp),
+            float(sctfcoil_module.t_wp_toroidal),
+            float(tfcoil_variables.tinstf),
+            float(tfcoil_variables.tfinsgap),
+            int(n_layer),
+            int(n_pancake),
+            float(sctfcoil_module.c_tf_coil),
+            float(dx_tf_turn_steel),
+            float(dx_tf_turn_insulation),
+        )
 
-        if sctfcoil_module.dr_tf_turn <= (
-            2.0e0 * dx_tf_turn_insulation + 2.0e0 * dx_tf_turn_steel
-        ):
+        # Smallest turn that leaves room for the insulation and conduit [m]
+        t_turn_min = 2.0e0 * dx_tf_turn_insulation + 2.0e0 * dx_tf_turn_steel
+
+        if sctfcoil_module.dr_tf_turn <= t_turn_min:
             error_handling.fdiags[0] = sctfcoil_module.dr_tf_turn
             error_handling.fdiags[1] = dx_tf_turn_insulation
             error_handling.fdiags[2] = dx_tf_turn_steel
             error_handling.report_error(100)
 
-        # Toroidal turn dimension [m]
-        sctfcoil_module.dx_tf_turn = (
-            sctfcoil_module.t_wp_toroidal
-            - 2.0e0 * (tfcoil_variables.tinstf + tfcoil_variables.tfinsgap)
-        ) / n_pancake
-
-        if sctfcoil_module.dx_tf_turn <= (
-            2.0e0 * dx_tf_turn_insulation + 2.0e0 * dx_tf_turn_steel
-        ):
+        if sctfcoil_module.dx_tf_turn <= t_turn_min:
             error_handling.fdiags[0] = sctfcoil_module.dx_tf_turn
             error_handling.fdiags[1] = dx_tf_turn_insulation
             error_handling.fdiags[2] = dx_tf_turn_steel
             error_handling.report_error(100)
 
-        tfcoil_variables.t_turn_tf = np.sqrt(
-            sctfcoil_module.dr_tf_turn * sctfcoil_module.dx_tf_turn
-        )
-
-        # Number of TF turns
-        n_tf_coil_turns = np.double(n_layer * n_pancake)
-
-        # Current per turn [A/turn]
-        c_tf_turn = sctfcoil_module.c_tf_coil / n_tf_coil_turns
-
-        # Radial and toroidal dimension of conductor [m]
-        sctfcoil_module.t_conductor_radial = (
-            sctfcoil_module.dr_tf_turn - 2.0e0 * dx_tf_turn_insulation
-        )
-        sctfcoil_module.t_conductor_toroidal = (
-            sctfcoil_module.dx_tf_turn - 2.0e0 * dx_tf_turn_insulation
-        )
-        tfcoil_variables.t_conductor = np.sqrt(
-            sctfcoil_module.t_conductor_radial * sctfcoil_module.t_conductor_toroidal
-        )
-
-        # Dimension of square cable space inside conduit [m]
-        sctfcoil_module.dr_tf_turn_cable_space = (
-            sctfcoil_module.t_conductor_radial - 2.0e0 * dx_tf_turn_steel
-        )
-        sctfcoil_module.dx_tf_turn_cable_space = (
-            sctfcoil_module.t_conductor_toroidal - 2.0e0 * dx_tf_turn_steel
-        )
-        sctfcoil_module.t_cable = np.sqrt(
-            sctfcoil_module.dr_tf_turn_cable_space
-            * sctfcoil_module.dx_tf_turn_cable_space
-        )
-
         # Cross-sectional area of cable space per turn
         # taking account of rounded inside corners [m2]
         a_tf_turn_cable_space = (
             sctfcoil_module.dr_tf_turn_cable_space
             * sctfcoil_module.dx_tf_turn_cable_space
-        ) - (4.0e0 - np.pi) * sctfcoil_module.rbcndut**2
+        ) - _FOUR_MINUS_PI * sctfcoil_module.rbcndut**2
 
         if a_tf_turn_cable_space <= 0.0e0:
             if (sctfcoil_module.dr_tf_turn_cable_space < 0.0e0) or (
@@ -2234,45 +1953,40 @@ class SuperconductingTFCoil(TFCoil):
             a_turn = tfcoil_variables.c_tf_turn / j_tf_wp
 
             # Dimension of square cross-section of each turn including inter-turn insulation [m]
-            tfcoil_variables.t_turn_tf = np.sqrt(a_turn)
+            tfcoil_variables.t_turn_tf = math.sqrt(a_turn)
 
         # Square turn assumption
         sctfcoil_module.dr_tf_turn = tfcoil_variables.t_turn_tf
         sctfcoil_module.dx_tf_turn = tfcoil_variables.t_turn_tf
 
-        # See derivation in the following document
-        # k:\power plant physics and technology\process\hts\hts coil module for process.docx
-        tfcoil_variables.t_conductor = (
-            -tfcoil_variables.layer_ins
-            + np.sqrt(tfcoil_variables.layer_ins**2 + 4.0e00 * a_turn)
-        ) / 2 - 2.0e0 * dx_tf_turn_insulation
-
-        # Total number of turns per TF coil (not required to be an integer)
-        n_tf_coil_turns = sctfcoil_module.awptf / a_turn
-
-        # Area of inter-turn insulation: single turn [m2]
-        a_tf_turn_insulation = a_turn - tfcoil_variables.t_conductor**2
+        (
+            tfcoil_variables.t_conductor,
+            n_tf_coil_turns,
+            a_tf_turn_insulation,
+            sctfcoil_module.t_cable,
+        ) = _averaged_turn_dimensions(
+            float(a_turn),
+            float(tfcoil_variables.layer_ins),
+            float(sctfcoil_module.awptf),
+            float(dx_tf_turn_steel),
+            float(dx_tf_turn_insulation),
+        )
 
         # NOTE: Fortran has a_tf_turn_cable_space as an intent(out) variable that was outputting
         # into tfcoil_variables.a_tf_turn_cable_space. The local variable, however, appears to
         # initially hold the value of tfcoil_variables.a_tf_turn_cable_space despite not being
         # intent(in). I have replicated this behaviour in Python for now.
-        a_tf_turn_cable_space = copy.copy(tfcoil_variables.a_tf_turn_cable_space)
+        a_tf_turn_cable_space = float(tfcoil_variables.a_tf_turn_cable_space)
 
         # ITER like turn structure
         if i_tf_sc_mat != 6:
             # Radius of rounded corners of cable space inside conduit [m]
             rbcndut = dx_tf_turn_steel * 0.75e0
 
-            # Dimension of square cable space inside conduit [m]
-            sctfcoil_module.t_cable = (
-                tfcoil_variables.t_conductor - 2.0e0 * dx_tf_turn_steel
-            )
-
             # Cross-sectional area of cable space per turn
             # taking account of rounded inside corners [m2]
             a_tf_turn_cable_space = (
-                sctfcoil_module.t_cable**2 - (4.0e0 - np.pi) * rbcndut**2
+                sctfcoil_module.t_cable**2 - _FOUR_MINUS_PI * rbcndut**2
             )
 
             if a_tf_turn_cable_space <= 0.0e0:
@@ -2287,18 +2001,9 @@ class SuperconductingTFCoil(TFCoil):
                     rbcndut = 0.0e0
                     a_tf_turn_cable_space = sctfcoil_module.t_cable**2
 
-            # Cross-sectional area of conduit jacket per turn [m2]
-            a_tf_turn_steel = tfcoil_variables.t_conductor**2 - a_tf_turn_cable_space
-
-        # REBCO turn structure
-        elif i_tf_sc_mat == 6:
-            # Diameter of circular cable space inside conduit [m]
-            sctfcoil_module.t_cable = (
-                tfcoil_variables.t_conductor - 2.0e0 * dx_tf_turn_steel
-            )
-
-            # Cross-sectional area of conduit jacket per turn [m2]
-            a_tf_turn_steel = tfcoil_variables.t_conductor**2 - a_tf_turn_cable_space
+        # Cross-sectional area of conduit jacket per turn [m2]
+        # (the REBCO turn keeps the cable space area held in tfcoil_variables)
+        a_tf_turn_steel = tfcoil_variables.t_conductor**2 - a_tf_turn_cable_space
 
         return (
             a_tf_turn_cable_space,
@@ -2308,7 +2013,322 @@ class SuperconductingTFCoil(TFCoil):
         )
 
 
-@staticmethod
+@numba.njit(cache=True, error_model="numpy")
+def _integer_turn_dimensions(
+    dr_tf_wp,
+    t_wp_toroidal,
+    tinstf,
+    tfinsgap,
+    n_layer,
+    n_pancake,
+    c_tf_coil,
+    dx_tf_turn_steel,
+    dx_tf_turn_insulation,
+):
+    """Turn, conductor and cable space dimensions of a winding pack with an
+    integer number of turns.
+
+    See SuperconductingTFCoil.tf_integer_turn_geom for the arguments.
+
+    :return: radial and toroidal turn dimensions (m), turn size (m), number of
+        turns, current per turn (A), radial and toroidal conductor dimensions (m),
+        conductor size (m), radial and toroidal cable space dimensions (m) and
+        cable space size (m)
+    :rtype: tuple[float, ...]
+    """
+    # Ground insulation plus insertion gap on both sides of the WP [m]
+    t_ins_total = 2.0e0 * (tinstf + tfinsgap)
+
+    # Radial turn dimension [m]
+    dr_tf_turn = (dr_tf_wp - t_ins_total) / n_layer
+
+    # Toroidal turn dimension [m]
+    dx_tf_turn = (t_wp_toroidal - t_ins_total) / n_pancake
+
+    t_turn_tf = np.sqrt(dr_tf_turn * dx_tf_turn)
+
+    # Number of TF turns
+    n_tf_coil_turns = float(n_layer * n_pancake)
+
+    # Current per turn [A/turn]
+    c_tf_turn = c_tf_coil / n_tf_coil_turns
+
+    # Radial and toroidal dimension of conductor [m]
+    t_turn_ins_total = 2.0e0 * dx_tf_turn_insulation
+    t_conductor_radial = dr_tf_turn - t_turn_ins_total
+    t_conductor_toroidal = dx_tf_turn - t_turn_ins_total
+    t_conductor = np.sqrt(t_conductor_radial * t_conductor_toroidal)
+
+    # Dimension of square cable space inside conduit [m]
+    t_steel_total = 2.0e0 * dx_tf_turn_steel
+    dr_tf_turn_cable_space = t_conductor_radial - t_steel_total
+    dx_tf_turn_cable_space = t_conductor_toroidal - t_steel_total
+    t_cable = np.sqrt(dr_tf_turn_cable_space * dx_tf_turn_cable_space)
+
+    return (
+        dr_tf_turn,
+        dx_tf_turn,
+        t_turn_tf,
+        n_tf_coil_turns,
+        c_tf_turn,
+        t_conductor_radial,
+        t_conductor_toroidal,
+        t_conductor,
+        dr_tf_turn_cable_space,
+        dx_tf_turn_cable_space,
+        t_cable,
+    )
+
+
+@numba.njit(cache=True, error_model="numpy")
+def _averaged_turn_dimensions(
+    a_turn, layer_ins, awptf, dx_tf_turn_steel, dx_tf_turn_insulation
+):
+    """Conductor and cable space dimensions of a square turn, for a winding pack
+    with a (not necessarily integer) number of turns set by the turn area.
+
+    :param a_turn: turn area, including inter-turn insulation (m2)
+    :type a_turn: float
+    :param layer_ins: additional insulation thickness between layers (m)
+    :type layer_ins: float
+    :param awptf: winding pack area without insertion gap and ground insulation (m2)
+    :type awptf: float
+    :param dx_tf_turn_steel: conduit thickness (m)
+    :type dx_tf_turn_steel: float
+    :param dx_tf_turn_insulation: inter-turn insulation thickness (m)
+    :type dx_tf_turn_insulation: float
+    :return: conductor size (m), number of turns, inter-turn insulation area of a
+        single turn (m2) and cable space size (m)
+    :rtype: tuple[float, float, float, float]
+    """
+    # See derivation in the following document
+    # k:\power plant physics and technology\process\hts\hts coil module for process.docx
+    t_conductor = (
+        -layer_ins + math.sqrt(layer_ins**2 + 4.0e00 * a_turn)
+    ) / 2 - 2.0e0 * dx_tf_turn_insulation
+
+    # Total number of turns per TF coil (not required to be an integer)
+    n_tf_coil_turns = awptf / a_turn
+
+    # Area of inter-turn insulation: single turn [m2]
+    a_tf_turn_insulation = a_turn - t_conductor**2
+
+    # Dimension of square cable space (ITER like turn) or diameter of circular
+    # cable space (REBCO turn) inside conduit [m]
+    t_cable = t_conductor - 2.0e0 * dx_tf_turn_steel
+
+    return t_conductor, n_tf_coil_turns, a_tf_turn_insulation, t_cable
+
+
+def _cable_critical_current(j_crit_sc, one_minus_fcu, fcond, acs, strand_copper=True):
+    """Critical current of a cable from the critical current density in the
+    superconductor.
+
+    :param j_crit_sc: critical current density in the superconductor (A/m2)
+    :type j_crit_sc: float
+    :param one_minus_fcu: fraction of conductor that is not copper
+    :type one_minus_fcu: float
+    :param fcond: fraction of cable space containing conductor
+    :type fcond: float
+    :param acs: cable space - inside area (m2)
+    :type acs: float
+    :param strand_copper: whether the strand critical current density excludes
+        the copper fraction (False where the tape model already accounts for it)
+    :type strand_copper: bool
+    :return: critical current density in the cable (A/m2), critical current in
+        the cable (A) and strand critical current density (A/m2)
+    :rtype: tuple[float, float, float]
+    """
+    # Critical current density in the non-copper part of the conductor
+    j_crit_noncu = j_crit_sc * one_minus_fcu
+    # j_crit_cable = j_crit_sc * non-copper fraction of conductor * conductor fraction of cable
+    j_crit_cable = j_crit_noncu * fcond
+    j_crit_str = j_crit_noncu if strand_copper else j_crit_sc
+    return j_crit_cable, j_crit_cable * acs, j_crit_str
+
+
+def clamp_strain(strain, limit):
+    """Limit the superconductor strain magnitude, reporting when it is clipped.
+
+    :param strain: superconductor strain
+    :type strain: float
+    :param limit: largest strain magnitude the critical surface model allows
+    :type limit: float
+    :return: strain with magnitude at most limit
+    :rtype: float
+    """
+    if abs(strain) > limit:
+        error_handling.fdiags[0] = strain
+        error_handling.report_error(261)
+        return math.copysign(limit, strain)
+    return strain
+
+
+def secant_root(func, x0, x1, args=(), tol=1.48e-8, rtol=0.0, maxiter=50):
+    """Find a root of func by the secant method.
+
+    Follows the secant branch of scipy.optimize.newton step for step, so
+    returns the same root and fails in the same way, without its result
+    bookkeeping.
+
+    :param func: function whose root is sought, called as func(x, *args)
+    :type func: Callable
+    :param x0: first estimate of the root
+    :type x0: float
+    :param x1: second estimate of the root
+    :type x1: float
+    :param args: extra arguments passed to func
+    :type args: tuple
+    :param tol: absolute tolerance on the root
+    :type tol: float
+    :param rtol: relative tolerance on the root
+    :type rtol: float
+    :param maxiter: maximum number of iterations
+    :type maxiter: int
+    :raises ValueError: if x0 and x1 are equal
+    :raises RuntimeError: if the iteration stalls or does not converge
+    :return: the root
+    :rtype: float
+    """
+    if x1 == x0:
+        raise ValueError("x1 and x0 must be different")
+    p0 = 1.0 * x0
+    p1 = x1
+    q0 = func(p0, *args)
+    q1 = func(p1, *args)
+    if abs(q1) < abs(q0):
+        p0, p1, q0, q1 = p1, p0, q1, q0
+    for itr in range(maxiter):
+        if q1 == q0:
+            if p1 != p0:
+                raise RuntimeError(
+                    f"Tolerance of {p1 - p0} reached. Failed to converge after "
+                    f"{itr + 1} iterations, value is {p1}."
+                )
+            return (p1 + p0) / 2.0
+        if abs(q1) > abs(q0):
+            p = (-q0 / q1 * p1 + p0) / (1 - q0 / q1)
+        else:
+            p = (-q1 / q0 * p0 + p1) / (1 - q1 / q0)
+        if abs(p - p1) <= tol + rtol * abs(p1):
+            return p
+        p0, q0 = p1, q1
+        p1 = p
+        q1 = func(p1, *args)
+
+    raise RuntimeError(f"Failed to converge after {maxiter} iterations, value is {p}.")
+
+
+@numba.njit(cache=True, error_model="numpy")
+def _protect(aio, tfes, acs, aturn, tdump, fcond, fcu, tba, tmax):
+    """Protection-limited winding pack current density and dump voltage.
+
+    See SuperconductingTFCoil.protect for the arguments.
+
+    :return: winding pack current density from temperature rise protection
+        (A/m2) and discharge voltage imposed on a TF coil (V)
+    :rtype: tuple[float, float]
+    """
+    #  Dump voltage
+
+    vd = 2.0e0 * tfes / (tdump * aio)
+
+    #  Current density limited by temperature rise during quench
+
+    tav = 1.0e0 + (tmax - tba) / 20.0e0
+    n_o = int(tav)
+    n_p = n_o + 1
+    n_p = min(n_p, 11)
+
+    # Interpolate all three coefficient rows between the bracketing columns at once
+    p_o = _PROTECT_COEFFICIENTS[:, n_o - 1]
+    p_p = _PROTECT_COEFFICIENTS[:, n_p - 1]
+    ai1, ai2, ai3 = 1.0e16 * (p_o + (p_p - p_o) * (tav - n_o))
+
+    aa = vd * aio / tfes
+    bb = (1.0e0 - fcond) * fcond * fcu * ai1
+    cc = (fcu * fcond) ** 2 * ai2
+    dd = (1.0e0 - fcu) * fcu * fcond**2 * ai3
+    ajcp = np.sqrt(aa * (bb + cc + dd))
+    ajwpro = ajcp * (acs / aturn)
+
+    return ajwpro, vd
+
+
+@numba.njit(cache=True, error_model="numpy")
+def croco_conductor_geometry(t_conductor, dx_tf_turn_steel):
+    """Geometry of a square CroCo conductor.
+
+    :param t_conductor: width of square conductor (cable + steel jacket) (m)
+    :type t_conductor: float
+    :param dx_tf_turn_steel: steel jacket thickness (m)
+    :type dx_tf_turn_steel: float
+    :return: CroCo strand outer diameter (m), cable space area (m2), conductor
+        area (m2), jacket area (m2) and jacket fraction
+    :rtype: tuple[float, float, float, float, float]
+    """
+    # Allowing for scaling of croco_od
+    croco_od = t_conductor / 3.0e0 - dx_tf_turn_steel * (2.0e0 / 3.0e0)
+    conductor_acs = _NINE_PI_OVER_FOUR * croco_od * croco_od
+    conductor_area = t_conductor * t_conductor  # does this not assume it's a sqaure???
+    conductor_jacket_area = conductor_area - conductor_acs
+
+    return (
+        croco_od,
+        conductor_acs,
+        conductor_area,
+        conductor_jacket_area,
+        conductor_jacket_area / conductor_area,
+    )
+
+
+@numba.njit(cache=True, error_model="numpy")
+def _conductor_operating_point(iop, aturn, icrit, j_crit_sc):
+    """Operating point of a TF conductor relative to its critical current.
+
+    :param iop: operating current per turn (A)
+    :type iop: float
+    :param aturn: area per turn, including insulation (m2)
+    :type aturn: float
+    :param icrit: critical current of conductor (A)
+    :type icrit: float
+    :param j_crit_sc: critical current density in superconductor (A/m2)
+    :type j_crit_sc: float
+    :return: critical winding pack current density (A/m2), ratio of operating
+        to critical current, operating winding pack current density (A/m2) and
+        actual current density in superconductor (A/m2)
+    :rtype: tuple[float, float, float, float]
+    """
+    iooic = iop / icrit
+    return icrit / aturn, iooic, iop / aturn, iooic * j_crit_sc
+
+
+@numba.njit(cache=True, error_model="numpy")
+def _coil_energy_and_turn_area(
+    e_tf_magnetic_stored_total, n_tf_coils, c_tf_total, j_tf_wp, n_tf_coil_turns
+):
+    """Stored energy per TF coil and cross-sectional area per turn.
+
+    :param e_tf_magnetic_stored_total: total stored energy in the TF coils (J)
+    :type e_tf_magnetic_stored_total: float
+    :param n_tf_coils: number of TF coils
+    :type n_tf_coils: float
+    :param c_tf_total: total current in all TF coils (A)
+    :type c_tf_total: float
+    :param j_tf_wp: winding pack current density (A/m2)
+    :type j_tf_wp: float
+    :param n_tf_coil_turns: number of turns per TF coil
+    :type n_tf_coil_turns: float
+    :return: energy stored in one TF coil (J) and area per turn (m2)
+    :rtype: tuple[float, float]
+    """
+    return (
+        e_tf_magnetic_stored_total / n_tf_coils,
+        c_tf_total / (j_tf_wp * n_tf_coils * n_tf_coil_turns),
+    )
+
+
+@numba.njit(cache=True, error_model="numpy")
 def lambda_term(tau: float, omega: float) -> float:
     """
     The lambda function used inegral in inductance calcuation found
@@ -2334,7 +2354,7 @@ def lambda_term(tau: float, omega: float) -> float:
     return integral
 
 
-@staticmethod
+@numba.njit(cache=True, error_model="numpy")
 def _theta_factor_integral(
     ro_vv: float, ri_vv: float, rm_vv: float, h_vv: float, theta1_vv: float
 ) -> float:
@@ -2359,33 +2379,35 @@ def _theta_factor_integral(
     kappa = h_vv / a
     iota = (1.0 + delta) / kappa
 
-    denom = np.cos(theta1_vv) + np.sin(theta1_vv) - 1.0
+    cos_theta1 = np.cos(theta1_vv)
+    sin_theta1 = np.sin(theta1_vv)
+    cos_theta12 = np.cos(theta1_vv + theta2)
+
+    denom = cos_theta1 + sin_theta1 - 1.0
 
-    r1 = h_vv * ((np.cos(theta1_vv) + iota * (np.sin(theta1_vv) - 1.0)) / denom)
-    r2 = h_vv * ((np.cos(theta1_vv) - 1.0 + iota * np.sin(theta1_vv)) / denom)
+    r1 = h_vv * ((cos_theta1 + iota * (sin_theta1 - 1.0)) / denom)
+    r2 = h_vv * ((cos_theta1 - 1.0 + iota * sin_theta1) / denom)
     r3 = h_vv * (1 - delta) / kappa
 
     rc1 = (h_vv / kappa) * ((rbar / a) + 1.0) - r1
-    rc2 = rc1 + (r1 - r2) * np.cos(theta1_vv)
+    rc2 = rc1 + (r1 - r2) * cos_theta1
     rc3 = rc2
-    zc2 = (r1 - r2) * np.sin(theta1_vv)
+    zc2 = (r1 - r2) * sin_theta1
     zc3 = zc2 + r2 - r3
 
-    tau = np.array([
-        [np.cos(theta1_vv), np.cos(theta1_vv + theta2), -1.0],
-        [1.0, np.cos(theta1_vv), np.cos(theta1_vv + theta2)],
-    ])
-
-    omega = np.array([rc1 / r1, rc2 / r2, rc3 / r3])
-
-    # Assume up down symmetry and let Zc6 = - Zc3
-    chi1 = (zc3 + np.abs(-zc3)) / ri_vv
-    chi2 = 0.0
-
-    for k in range(len(omega)):
-        chi2 = chi2 + np.abs(
-            lambda_term(tau[1, k], omega[k]) - lambda_term(tau[0, k], omega[k])
-        )
+    # Sum over the three arcs with tau = ((cos_theta1, cos_theta12, -1),
+    # (1, cos_theta1, cos_theta12))
+    omega0 = rc1 / r1
+    omega1 = rc2 / r2
+    omega2 = rc3 / r3
+
+    # Assume up down symmetry and let Zc6 = - Zc3, so the term is 2*max(Zc3, 0)
+    chi1 = (zc3 + abs(zc3)) / ri_vv
+    chi2 = (
+        abs(lambda_term(1.0, omega0) - lambda_term(cos_theta1, omega0))
+        + abs(lambda_term(cos_theta1, omega1) - lambda_term(cos_theta12, omega1))
+        + abs(lambda_term(cos_theta12, omega2) - lambda_term(-1.0, omega2))
+    )
 
     return (chi1 + 2.0 * chi2) / (2.0 * np.pi)
 
@@ -2481,14 +2503,12 @@ def vv_stress_on_quench(
 
     # relevant self-inductances in henry (H)
     coil_structure_self_inductance = (
-        (constants.rmu0 / np.pi)
+        _MU0_OVER_PI
         * H_coil
         * _inductance_factor(H_coil, ri_coil, ro_coil, rm_coil, theta1_coil)
     )
     vv_self_inductance = (
-        (constants.rmu0 / np.pi)
-        * H_vv
-        * _inductance_factor(H_vv, ri_vv, ro_vv, rm_vv, theta1_vv)
+        _MU0_OVER_PI * H_vv * _inductance_factor(H_vv, ri_vv, ro_vv, rm_vv, theta1_vv)
     )
 
     # s^-1
@@ -2496,20 +2516,28 @@ def vv_stress_on_quench(
     lambda1 = (plr_coil) / coil_structure_self_inductance
     lambda2 = (plr_vv) / vv_self_inductance
 
-    # approximate time at which the maximum force (and stress) will occur on the VV
-    tmaxforce = np.log((lambda0 + lambda1) / (2 * lambda0)) / (lambda1 - lambda0)
-
-    i0 = i_op * np.exp(-lambda0 * tmaxforce)
-    i1 = (
-        lambda0
-        * n_tf_coils
-        * n_tf_coil_turns
-        * i_op
-        * (
-            (np.exp(-lambda1 * tmaxforce) - np.exp(-lambda0 * tmaxforce))
-            / (lambda0 - lambda1)
-        )
-    )
+    # approximate time at which the maximum force (and stress) will occur on the VV,
+    # ln((lambda0 + lambda1) / (2 lambda0)) / (lambda1 - lambda0), and the factor
+    # (exp(-lambda1 t) - exp(-lambda0 t)) / (lambda0 - lambda1) of the induced
+    # structure current at that time. Both are written with log1p/expm1 so they stay
+    # accurate as lambda1 approaches lambda0, and take their limits 1/(2 lambda0)
+    # and t exp(-lambda0 t) when the rates are equal.
+    lambda_diff = lambda1 - lambda0
+    if lambda_diff == 0.0:
+        tmaxforce = 0.5 / lambda0
+    else:
+        tmaxforce = np.log1p(lambda_diff / (2 * lambda0)) / lambda_diff
+
+    # decay of the TF coil current at tmaxforce
+    decay0 = np.exp(-lambda0 * tmaxforce)
+
+    if lambda_diff == 0.0:
+        decay1 = tmaxforce * decay0
+    else:
+        decay1 = decay0 * (np.expm1(-lambda_diff * tmaxforce) / -lambda_diff)
+
+    i0 = i_op * decay0
+    i1 = lambda0 * n_tf_coils * n_tf_coil_turns * i_op * decay1
     i2 = (lambda1 / lambda2) * i1
 
     a_vv = (ro_vv + ri_vv) / (ro_vv - ri_vv)
@@ -2523,6 +2551,7 @@ def vv_stress_on_quench(
     return zeta * b_vvi * j_vvi * ri_vv
 
 
+@numba.njit(cache=True, error_model="numpy")
 def _inductance_factor(
     H: float, ri: float, ro: float, rm: float, theta1: float
 ) -> float:
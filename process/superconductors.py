@@ -1,5 +1,6 @@
 import logging
 
+import numba
 import numpy as np
 from scipy import optimize
 
@@ -100,19 +101,15 @@ def current_sharing_rebco(bfield, j):
 
     estimate = 10.0
     another_estimate = 20.0
-    current_sharing_t, root_result = optimize.newton(
+    return optimize.newton(
         deltaj_rebco,
         estimate,
         tol=1e-6,
         rtol=1e-6,
         maxiter=50,
         x1=another_estimate,
-        full_output=True,
-        disp=True,
     )
 
-    return current_sharing_t
-
 
 def itersc(
     temp_conductor: float,
@@ -193,6 +190,7 @@ def itersc(
     return j_critical, b_critical, temp_critical
 
 
+@numba.njit(cache=True, error_model="numpy")
 def jcrit_nbti(
     temp_conductor: float,
     b_conductor: float,
@@ -325,6 +323,7 @@ def bi2212(b_conductor, jstrand, temp_conductor, f_strain):
     return j_critical, temp_margin
 
 
+@numba.njit(cache=True, error_model="numpy")
 def gl_nbti(
     temp_conductor: float,
     b_conductor: float,
@@ -421,6 +420,7 @@ def gl_nbti(
     return j_critical, b_critical, t_critical
 
 
+@numba.njit(cache=True, error_model="numpy")
 def gl_rebco(
     temp_conductor: float,
     b_conductor: float,
@@ -518,6 +518,7 @@ def gl_rebco(
     return j_critical, b_critical, temp_critical
 
 
+@numba.njit(cache=True, error_model="numpy")
 def hijc_rebco(
     temp_conductor: float,
     b_conductor: float,
@@ -948,7 +949,7 @@ def current_density_margin(ttest, isumat, jsc, bmax, strain, bc20m, tc0m, c0=Non
         jcrit, _, _ = itersc(ttest, bmax, strain, bc20m, tc0m)
     elif isumat == 3:
         jcrit, _ = jcrit_nbti(ttest, bmax, c0, bc20m, tc0m)
-    if isumat == 4:
+    elif isumat == 4:
         jcrit, _, _ = itersc(ttest, bmax, strain, bc20m, tc0m)
     elif isumat == 5:
         jcrit, _, _ = western_superconducting_nb3sn(ttest, bmax, strain, bc20m, tc0m)
@@ -1,5 +1,6 @@
 import copy
 import json
+from typing import NamedTuple
 
 import numba
 import numpy as np
@@ -7,7 +8,6 @@ import numpy as np
 from process import fortran as ft
 from process import process_output as po
 from process.build import Build
-from process.exceptions import ProcessValueError
 from process.fortran import (
     build_variables,
     constants,
@@ -33,6 +33,47 @@ from process.utilities.f2py_string_patch import (
 RMU0 = constants.rmu0
 
 
+class StressResult(NamedTuple):
+    """Midplane stress analysis of the inboard TF coil legs, as returned by
+    TFCoil.stresscl and written out by TFCoil.out_stress
+    """
+
+    sig_tf_r_max: np.ndarray
+    sig_tf_t_max: np.ndarray
+    sig_tf_z_max: np.ndarray
+    sig_tf_vmises_max: np.ndarray
+    s_shear_tf_peak: np.ndarray
+    deflect: np.ndarray
+    eyoung_axial: np.ndarray
+    eyoung_trans: np.ndarray
+    eyoung_wp_axial: float
+    eyoung_wp_trans: float
+    poisson_wp_trans: float
+    radial_array: np.ndarray
+    s_shear_cea_tf_cond: np.ndarray
+    poisson_wp_axial: float
+    sig_tf_r: np.ndarray
+    sig_tf_smeared_r: np.ndarray
+    sig_tf_smeared_t: np.ndarray
+    sig_tf_smeared_z: np.ndarray
+    sig_tf_t: np.ndarray
+    s_shear_tf: np.ndarray
+    sig_tf_vmises: np.ndarray
+    sig_tf_z: np.ndarray
+    str_tf_r: np.ndarray
+    str_tf_t: np.ndarray
+    str_tf_z: np.ndarray
+    n_radial_array: int
+    n_tf_bucking: int
+    sig_tf_wp: float
+    sig_tf_case: float
+    sig_tf_cs_bucked: float
+    str_wp: float
+    casestr: float
+    insstrain: float
+    sig_tf_wp_av_z: np.ndarray
+
+
 class TFCoil:
     """Calculates the parameters of a resistive TF coil system for a fusion power plant"""
 
@@ -137,176 +178,90 @@ class TFCoil:
         if output:
             tfcoil_variables.n_rad_per_layer = 500
 
-        try:
-            (
-                sig_tf_r_max,
-                sig_tf_t_max,
-                sig_tf_z_max,
-                sig_tf_vmises_max,
-                s_shear_tf_peak,
-                deflect,
-                eyoung_axial,
-                eyoung_trans,
-                eyoung_wp_axial,
-                eyoung_wp_trans,
-                poisson_wp_trans,
-                radial_array,
-                s_shear_cea_tf_cond,
-                poisson_wp_axial,
-                sig_tf_r,
-                sig_tf_smeared_r,
-                sig_tf_smeared_t,
-                sig_tf_smeared_z,
-                sig_tf_t,
-                s_shear_tf,
-                sig_tf_vmises,
-                sig_tf_z,
-                str_tf_r,
-                str_tf_t,
-                str_tf_z,
-                n_radial_array,
-                n_tf_bucking,
-                tfcoil_variables.sig_tf_wp,
-                sig_tf_case,
-                sig_tf_cs_bucked,
-                str_wp,
-                casestr,
-                insstrain,
-                sig_tf_wp_av_z,
-            ) = self.stresscl(
-                int(tfcoil_variables.n_tf_stress_layers),
-                int(tfcoil_variables.n_rad_per_layer),
-                int(tfcoil_variables.n_tf_wp_layers),
-                int(tfcoil_variables.i_tf_bucking),
-                float(build_variables.r_tf_inboard_in),
-                build_variables.dr_bore,
-                build_variables.z_tf_inside_half,
-                pfcoil_variables.f_z_cs_tf_internal,
-                build_variables.dr_cs,
-                build_variables.i_tf_inside_cs,
-                build_variables.dr_tf_inboard,
-                build_variables.dr_cs_tf_gap,
-                pfcoil_variables.i_pf_conductor,
-                pfcoil_variables.j_cs_flat_top_end,
-                pfcoil_variables.j_cs_pulse_start,
-                pfcoil_variables.c_pf_coil_turn_peak_input,
-                pfcoil_variables.n_pf_coils_in_group,
-                pfcoil_variables.ld_ratio_cst,
-                pfcoil_variables.r_out_cst,
-                pfcoil_variables.f_a_cs_steel,
-                tfcoil_variables.eyoung_steel,
-                tfcoil_variables.poisson_steel,
-                tfcoil_variables.eyoung_cond_axial,
-                tfcoil_variables.poisson_cond_axial,
-                tfcoil_variables.eyoung_cond_trans,
-                tfcoil_variables.poisson_cond_trans,
-                tfcoil_variables.eyoung_ins,
-                tfcoil_variables.poisson_ins,
-                tfcoil_variables.dx_tf_turn_insulation,
-                tfcoil_variables.eyoung_copper,
-                tfcoil_variables.poisson_copper,
-                tfcoil_variables.i_tf_sup,
-                tfcoil_variables.eyoung_res_tf_buck,
-                sctfcoil_module.r_wp_inner,
-                sctfcoil_module.tan_theta_coil,
-                sctfcoil_module.rad_tf_coil_toroidal,
-                sctfcoil_module.r_wp_outer,
-                sctfcoil_module.a_tf_steel,
-                sctfcoil_module.a_case_front,
-                sctfcoil_module.a_case_nose,
-                tfcoil_variables.tfinsgap,
-                tfcoil_variables.tinstf,
-                tfcoil_variables.n_tf_coil_turns,
-                int(tfcoil_variables.i_tf_turns_integer),
-                sctfcoil_module.t_cable,
-                sctfcoil_module.dr_tf_turn_cable_space,
-                tfcoil_variables.dia_tf_turn_coolant_channel,
-                tfcoil_variables.fcutfsu,
-                tfcoil_variables.dx_tf_turn_steel,
-                sctfcoil_module.t_lat_case_av,
-                sctfcoil_module.t_wp_toroidal_av,
-                sctfcoil_module.a_tf_ins,
-                tfcoil_variables.aswp,
-                tfcoil_variables.acond,
-                sctfcoil_module.awpc,
-                tfcoil_variables.eyoung_al,
-                tfcoil_variables.poisson_al,
-                tfcoil_variables.fcoolcp,
-                tfcoil_variables.n_tf_graded_layers,
-                tfcoil_variables.c_tf_total,
-                tfcoil_variables.dr_tf_plasma_case,
-                tfcoil_variables.i_tf_stress_model,
-                sctfcoil_module.vforce_inboard_tot,
-                tfcoil_variables.i_tf_tresca,
-                tfcoil_variables.acasetf,
-                tfcoil_variables.vforce,
-                tfcoil_variables.a_tf_turn_steel,
-            )
-
-            tfcoil_variables.sig_tf_case = (
-                tfcoil_variables.sig_tf_case
-                if tfcoil_variables.sig_tf_case is None
-                else sig_tf_case
-            )
-
-            tfcoil_variables.sig_tf_cs_bucked = (
-                tfcoil_variables.sig_tf_cs_bucked
-                if tfcoil_variables.sig_tf_cs_bucked is None
-                else sig_tf_cs_bucked
-            )
-
-            tfcoil_variables.str_wp = (
-                tfcoil_variables.str_wp if tfcoil_variables.str_wp is None else str_wp
-            )
-
-            tfcoil_variables.casestr = (
-                tfcoil_variables.casestr
-                if tfcoil_variables.casestr is None
-                else casestr
-            )
+        stress = self.stresscl(
+            int(tfcoil_variables.n_tf_stress_layers),
+            int(tfcoil_variables.n_rad_per_layer),
+            int(tfcoil_variables.n_tf_wp_layers),
+            int(tfcoil_variables.i_tf_bucking),
+            float(build_variables.r_tf_inboard_in),
+            build_variables.dr_bore,
+            build_variables.z_tf_inside_half,
+            pfcoil_variables.f_z_cs_tf_internal,
+            build_variables.dr_cs,
+            build_variables.i_tf_inside_cs,
+            build_variables.dr_tf_inboard,
+            build_variables.dr_cs_tf_gap,
+            pfcoil_variables.i_pf_conductor,
+            pfcoil_variables.j_cs_flat_top_end,
+            pfcoil_variables.j_cs_pulse_start,
+            pfcoil_variables.c_pf_coil_turn_peak_input,
+            pfcoil_variables.n_pf_coils_in_group,
+            pfcoil_variables.ld_ratio_cst,
+            pfcoil_variables.r_out_cst,
+            pfcoil_variables.f_a_cs_steel,
+            tfcoil_variables.eyoung_steel,
+            tfcoil_variables.poisson_steel,
+            tfcoil_variables.eyoung_cond_axial,
+            tfcoil_variables.poisson_cond_axial,
+            tfcoil_variables.eyoung_cond_trans,
+            tfcoil_variables.poisson_cond_trans,
+            tfcoil_variables.eyoung_ins,
+            tfcoil_variables.poisson_ins,
+            tfcoil_variables.dx_tf_turn_insulation,
+            tfcoil_variables.eyoung_copper,
+            tfcoil_variables.poisson_copper,
+            tfcoil_variables.i_tf_sup,
+            tfcoil_variables.eyoung_res_tf_buck,
+            sctfcoil_module.r_wp_inner,
+            sctfcoil_module.tan_theta_coil,
+            sctfcoil_module.rad_tf_coil_toroidal,
+            sctfcoil_module.r_wp_outer,
+            sctfcoil_module.a_tf_steel,
+            sctfcoil_module.a_case_front,
+            sctfcoil_module.a_case_nose,
+            tfcoil_variables.tfinsgap,
+            tfcoil_variables.tinstf,
+            tfcoil_variables.n_tf_coil_turns,
+            int(tfcoil_variables.i_tf_turns_integer),
+            sctfcoil_module.t_cable,
+            sctfcoil_module.dr_tf_turn_cable_space,
+            tfcoil_variables.dia_tf_turn_coolant_channel,
+            tfcoil_variables.fcutfsu,
+            tfcoil_variables.dx_tf_turn_steel,
+            sctfcoil_module.t_lat_case_av,
+            sctfcoil_module.t_wp_toroidal_av,
+            sctfcoil_module.a_tf_ins,
+            tfcoil_variables.aswp,
+            tfcoil_variables.acond,
+            sctfcoil_module.awpc,
+            tfcoil_variables.eyoung_al,
+            tfcoil_variables.poisson_al,
+            tfcoil_variables.fcoolcp,
+            tfcoil_variables.n_tf_graded_layers,
+            tfcoil_variables.c_tf_total,
+            tfcoil_variables.dr_tf_plasma_case,
+            tfcoil_variables.i_tf_stress_model,
+            sctfcoil_module.vforce_inboard_tot,
+            tfcoil_variables.i_tf_tresca,
+            tfcoil_variables.acasetf,
+            tfcoil_variables.vforce,
+            tfcoil_variables.a_tf_turn_steel,
+        )
 
-            tfcoil_variables.insstrain = (
-                tfcoil_variables.insstrain
-                if tfcoil_variables.insstrain is None
-                else insstrain
-            )
+        if stress is None:
+            error_handling.report_error(245)
+            tfcoil_variables.sig_tf_case = 0.0e0
+            tfcoil_variables.sig_tf_wp = 0.0e0
+        else:
+            tfcoil_variables.sig_tf_wp = stress.sig_tf_wp
+            tfcoil_variables.sig_tf_case = stress.sig_tf_case
+            tfcoil_variables.sig_tf_cs_bucked = stress.sig_tf_cs_bucked
+            tfcoil_variables.str_wp = stress.str_wp
+            tfcoil_variables.casestr = stress.casestr
+            tfcoil_variables.insstrain = stress.insstrain
 
             if output:
-                self.out_stress(
-                    sig_tf_r_max,
-                    sig_tf_t_max,
-                    sig_tf_z_max,
-                    sig_tf_vmises_max,
-                    s_shear_tf_peak,
-                    deflect,
-                    eyoung_axial,
-                    eyoung_trans,
-                    eyoung_wp_axial,
-                    eyoung_wp_trans,
-                    poisson_wp_trans,
-                    radial_array,
-                    s_shear_cea_tf_cond,
-                    poisson_wp_axial,
-                    sig_tf_r,
-                    sig_tf_smeared_r,
-                    sig_tf_smeared_t,
-                    sig_tf_smeared_z,
-                    sig_tf_t,
-                    s_shear_tf,
-                    sig_tf_vmises,
-                    sig_tf_z,
-                    str_tf_r,
-                    str_tf_t,
-                    str_tf_z,
-                    n_radial_array,
-                    n_tf_bucking,
-                    sig_tf_wp_av_z,
-                )
-        except ValueError as e:
-            if e.args[1] == 245 and e.args[2] == 0:
-                error_handling.report_error(245)
-                tfcoil_variables.sig_tf_case = 0.0e0
-                tfcoil_variables.sig_tf_wp = 0.0e0
+                self.out_stress(stress)
 
     def output(self):
         """Run main tfcoil subroutine and write output."""
@@ -3252,6 +3207,9 @@ class TFCoil:
         This subroutine sets up the stress calculations for the
         TF coil set.
         PROCESS Superconducting TF Coil Model, J. Morris, CCFE, 1st May 2014
+
+        Returns None when r_tf_inboard_in ~= 0, which only the extended
+        plane strain model (i_tf_stress_model = 2) can handle.
         """
         jeff = np.zeros((n_tf_layer,))
         # Effective current density [A/m2]
@@ -3344,7 +3302,8 @@ class TFCoil:
             abs(r_tf_inboard_in) < np.finfo(float(r_tf_inboard_in)).eps
             and i_tf_stress_model != 2
         ):
-            raise ProcessValueError("r_tf_inboard_in is ~= 0", 245)
+            # r_tf_inboard_in is ~= 0: the caller reports error 245
+            return None
 
         # TODO: following is no longer used/needed?
         # if tfcoil_variables.a_tf_turn_cable_space >= 0.0e0:
@@ -4024,7 +3983,7 @@ class TFCoil:
             sig_tf_cs_bucked = s_shear_tf_peak[0]
         # ----------------
 
-        return (
+        return StressResult(
             sig_tf_r_max,
             sig_tf_t_max,
             sig_tf_z_max,
@@ -4061,37 +4020,7 @@ class TFCoil:
             sig_tf_wp_av_z,
         )
 
-    def out_stress(
-        self,
-        sig_tf_r_max,
-        sig_tf_t_max,
-        sig_tf_z_max,
-        sig_tf_vmises_max,
-        s_shear_tf_peak,
-        deflect,
-        eyoung_axial,
-        eyoung_trans,
-        eyoung_wp_axial,
-        eyoung_wp_trans,
-        poisson_wp_trans,
-        radial_array,
-        s_shear_cea_tf_cond,
-        poisson_wp_axial,
-        sig_tf_r,
-        sig_tf_smeared_r,
-        sig_tf_smeared_t,
-        sig_tf_smeared_z,
-        sig_tf_t,
-        s_shear_tf,
-        sig_tf_vmises,
-        sig_tf_z,
-        str_tf_r,
-        str_tf_t,
-        str_tf_z,
-        n_radial_array,
-        n_tf_bucking,
-        sig_tf_wp_av_z,
-    ):
+    def out_stress(self, stress: StressResult):
         """Subroutine showing the writing the TF midplane stress analysis
         in the output file and the stress distribution in the SIG_TF.json
         file used to plot stress distributions
@@ -4190,142 +4119,142 @@ class TFCoil:
 
         po.write(
             self.outfile,
-            f"  Radial stress \t\t\t (MPa) \t\t {table_format_arrays(sig_tf_r_max, 1e-6)}",
+            f"  Radial stress \t\t\t (MPa) \t\t {table_format_arrays(stress.sig_tf_r_max, 1e-6)}",
         )
         po.write(
             self.outfile,
-            f"  Toroidal stress \t\t\t (MPa) \t\t {table_format_arrays(sig_tf_t_max, 1e-6)}",
+            f"  Toroidal stress \t\t\t (MPa) \t\t {table_format_arrays(stress.sig_tf_t_max, 1e-6)}",
         )
         po.write(
             self.outfile,
-            f"  Vertical stress \t\t\t (MPa) \t\t {table_format_arrays(sig_tf_z_max, 1e-6)}",
+            f"  Vertical stress \t\t\t (MPa) \t\t {table_format_arrays(stress.sig_tf_z_max, 1e-6)}",
         )
         po.write(
             self.outfile,
-            f"  Von-Mises stress \t\t\t (MPa) \t\t {table_format_arrays(sig_tf_vmises_max, 1e-6)}",
+            f"  Von-Mises stress \t\t\t (MPa) \t\t {table_format_arrays(stress.sig_tf_vmises_max, 1e-6)}",
         )
 
         if tfcoil_variables.i_tf_tresca == 1 and tfcoil_variables.i_tf_sup == 1:
             po.write(
                 self.outfile,
-                f"  Shear (CEA Tresca) \t\t\t (MPa) \t\t {table_format_arrays(s_shear_tf_peak, 1e-6)}",
+                f"  Shear (CEA Tresca) \t\t\t (MPa) \t\t {table_format_arrays(stress.s_shear_tf_peak, 1e-6)}",
             )
         else:
             po.write(
                 self.outfile,
-                f"  Shear (Tresca) \t\t\t (MPa) \t\t {table_format_arrays(s_shear_tf_peak, 1e-6)}",
+                f"  Shear (Tresca) \t\t\t (MPa) \t\t {table_format_arrays(stress.s_shear_tf_peak, 1e-6)}",
             )
 
         po.write(self.outfile, "")
         po.write(
             self.outfile,
-            f"  Toroidal modulus \t\t\t (GPa) \t\t {table_format_arrays(eyoung_trans, 1e-9)}",
+            f"  Toroidal modulus \t\t\t (GPa) \t\t {table_format_arrays(stress.eyoung_trans, 1e-9)}",
         )
         po.write(
             self.outfile,
-            f"  Vertical modulus \t\t\t (GPa) \t\t {table_format_arrays(eyoung_axial, 1e-9)}",
+            f"  Vertical modulus \t\t\t (GPa) \t\t {table_format_arrays(stress.eyoung_axial, 1e-9)}",
         )
         po.write(self.outfile, "")
         po.ovarre(
             self.outfile,
             "WP transverse modulus (GPa)",
             "(eyoung_wp_trans*1.0d-9)",
-            eyoung_wp_trans * 1.0e-9,
+            stress.eyoung_wp_trans * 1.0e-9,
             "OP ",
         )
         po.ovarre(
             self.outfile,
             "WP vertical modulus (GPa)",
             "(eyoung_wp_axial*1.0d-9)",
-            eyoung_wp_axial * 1.0e-9,
+            stress.eyoung_wp_axial * 1.0e-9,
             "OP ",
         )
         po.ovarre(
             self.outfile,
             "WP transverse Poissons ratio",
             "(poisson_wp_trans)",
-            poisson_wp_trans,
+            stress.poisson_wp_trans,
             "OP ",
         )
         po.ovarre(
             self.outfile,
             "WP vertical-transverse Pois. rat.",
             "(poisson_wp_axial)",
-            poisson_wp_axial,
+            stress.poisson_wp_axial,
             "OP ",
         )
 
         # MFILE.DAT data
-        for ii in range(n_tf_bucking + 2):
+        for ii in range(stress.n_tf_bucking + 2):
             po.ovarre(
                 constants.mfile,
                 f"Radial    stress at maximum shear of layer {ii + 1} (Pa)",
                 f"(sig_tf_r_max({ii + 1}))",
-                sig_tf_r_max[ii],
+                stress.sig_tf_r_max[ii],
             )
             po.ovarre(
                 constants.mfile,
                 f"toroidal  stress at maximum shear of layer {ii + 1} (Pa)",
                 f"(sig_tf_t_max({ii + 1}))",
-                sig_tf_t_max[ii],
+                stress.sig_tf_t_max[ii],
             )
             po.ovarre(
                 constants.mfile,
                 f"Vertical  stress at maximum shear of layer {ii + 1} (Pa)",
                 f"(sig_tf_z_max({ii + 1}))",
-                sig_tf_z_max[ii],
+                stress.sig_tf_z_max[ii],
             )
             po.ovarre(
                 constants.mfile,
                 f"Von-Mises stress at maximum shear of layer {ii + 1} (Pa)",
                 f"(sig_tf_vmises_max({ii + 1}))",
-                sig_tf_vmises_max[ii],
+                stress.sig_tf_vmises_max[ii],
             )
             if tfcoil_variables.i_tf_tresca == 1 and tfcoil_variables.i_tf_sup == 1:
                 po.ovarre(
                     constants.mfile,
                     f"Maximum shear stress for CEA Tresca yield criterion {ii + 1} (Pa)",
                     f"(s_shear_tf_peak({ii + 1}))",
-                    s_shear_tf_peak[ii],
+                    stress.s_shear_tf_peak[ii],
                 )
             else:
                 po.ovarre(
                     constants.mfile,
                     f"Maximum shear stress for the Tresca yield criterion {ii + 1} (Pa)",
                     f"(s_shear_tf_peak({ii + 1}))",
-                    s_shear_tf_peak[ii],
+                    stress.s_shear_tf_peak[ii],
                 )
 
         # SIG_TF.json storage
         sig_file_data = {
-            "Points per layers": n_radial_array,
-            "Radius (m)": radial_array,
-            "Radial stress (MPa)": sig_tf_r * 1e-6,
-            "Toroidal stress (MPa)": sig_tf_t * 1e-6,
-            "Vertical stress (MPa)": sig_tf_z * 1e-6,
-            "Radial smear stress (MPa)": sig_tf_smeared_r * 1e-6,
-            "Toroidal smear stress (MPa)": sig_tf_smeared_t * 1e-6,
-            "Vertical smear stress (MPa)": sig_tf_smeared_z * 1e-6,
-            "Von-Mises stress (MPa)": sig_tf_vmises * 1e-6,
+            "Points per layers": stress.n_radial_array,
+            "Radius (m)": stress.radial_array,
+            "Radial stress (MPa)": stress.sig_tf_r * 1e-6,
+            "Toroidal stress (MPa)": stress.sig_tf_t * 1e-6,
+            "Vertical stress (MPa)": stress.sig_tf_z * 1e-6,
+            "Radial smear stress (MPa)": stress.sig_tf_smeared_r * 1e-6,
+            "Toroidal smear stress (MPa)": stress.sig_tf_smeared_t * 1e-6,
+            "Vertical smear stress (MPa)": stress.sig_tf_smeared_z * 1e-6,
+            "Von-Mises stress (MPa)": stress.sig_tf_vmises * 1e-6,
             "CEA Tresca stress (MPa)": (
-                s_shear_cea_tf_cond * 1e-6
+                stress.s_shear_cea_tf_cond * 1e-6
                 if tfcoil_variables.i_tf_sup == 1
-                else s_shear_tf * 1e-6
+                else stress.s_shear_tf * 1e-6
             ),
-            "rad. displacement (mm)": deflect * 1e3,
+            "rad. displacement (mm)": stress.deflect * 1e3,
         }
         if tfcoil_variables.i_tf_stress_model != 1:
             sig_file_data = {
                 **sig_file_data,
-                "Radial strain": str_tf_r,
-                "Toroidal strain": str_tf_t,
-                "Vertical strain": str_tf_z,
+                "Radial strain": stress.str_tf_r,
+                "Toroidal strain": stress.str_tf_t,
+                "Vertical strain": stress.str_tf_z,
             }
 
         if tfcoil_variables.i_tf_sup == 1:
             sig_file_data = {
                 **sig_file_data,
-                "WP smeared stress (MPa)": sig_tf_wp_av_z * 1.0e-6,
+                "WP smeared stress (MPa)": stress.sig_tf_wp_av_z * 1.0e-6,
             }
 
         sig_file_data = {
@@ -4351,7 +4280,7 @@ class TFCoil:
                 self.outfile,
                 "Maximum radial deflection at midplane (m)",
                 "(deflect)",
-                deflect[n_radial_array - 1],
+                stress.deflect[stress.n_radial_array - 1],
                 "OP ",
             )
             po.ovarre(
@@ -15,7 +15,7 @@ import pytest
 from process.evaluators import Evaluators
 from process.fortran import error_handling
 from process.init import init_all_module_vars
-from process.solver import get_solver
+from process.solver import VmconPortfolio, get_solver
 
 # Debug-level terminal output logging
 logger = logging.getLogger(__name__)
@@ -653,6 +653,77 @@ def test_vmcon(case, solver_name):
         raise
 
 
+@pytest.mark.parametrize("fork", [True, False])
+@pytest.mark.parametrize("case_fn", [get_case1, get_case2])
+def test_vmcon_portfolio(case_fn, fork, monkeypatch):
+    """Check the multi-start portfolio recovers the single-start solution, and
+    leaves the functions evaluated there.
+
+    Without fork, the starts are run one after another in this process.
+
+    :param case_fn: function creating the Vmcon scenario to run
+    :type case_fn: Callable[[], test_vmcon.Case]
+    :param fork: whether the fork start method is available
+    :type fork: bool
+    :param monkeypatch: pytest fixture
+    :type monkeypatch: MonkeyPatch
+    """
+    if not fork:
+        monkeypatch.setattr(
+            "process.solver.multiprocessing.get_all_start_methods", lambda: ["spawn"]
+        )
+
+    case = case_fn()
+
+    # Record the points the functions are evaluated at in this process
+    points = []
+    fcnvmc1 = case.evaluator.fcnvmc1
+
+    def record_fcnvmc1(n, m, xv, ifail):
+        points.append(np.copy(xv))
+        return fcnvmc1(n, m, xv, ifail)
+
+    monkeypatch.setattr(case.evaluator, "fcnvmc1", record_fcnvmc1)
+
+    solver = VmconPortfolio(starts=3)
+    solver.set_evaluators(case.evaluator)
+    solver.set_opt_params(case.solver_args.x)
+    solver.set_bounds(
+        case.solver_args.bndl,
+        case.solver_args.bndu,
+        ilower=case.solver_args.ilower,
+        iupper=case.solver_args.iupper,
+    )
+    solver.set_constraints(case.solver_args.m, case.solver_args.meq)
+    solver.set_tolerance(case.solver_args.tolerance)
+
+    assert solver.solve() == case.exp.ifail
+    assert solver.objf == pytest.approx(case.exp.objf)
+    assert solver.x == pytest.approx(case.exp.x)
+
+    # The models are left evaluated at the kept solution
+    np.testing.assert_array_equal(points[-1], solver.x)
+
+
+def test_vmcon_stalled_objective():
+    """Check a feasible point with a stalled objective is accepted early."""
+    case = get_case2()
+
+    solver = get_solver("vmcon")
+    solver.stall_rtol = 0.1
+    solver.stall_iterations = 1
+    solver.set_evaluators(case.evaluator)
+    solver.set_opt_params(case.solver_args.x)
+    solver.set_bounds(case.solver_args.bndl, case.solver_args.bndu)
+    solver.set_constraints(case.solver_args.m, case.solver_args.meq)
+    solver.set_tolerance(case.solver_args.tolerance)
+
+    assert solver.solve() == 1
+    # Feasible, but short of the optimum found without the stall criterion
+    assert np.all(solver.conf[case.solver_args.meq :] >= 0.0)
+    assert solver.objf > case.exp.objf
+
+
 def log_failure(case):
     """Write extra logs in the case of a test case failure.
 
@@ -0,0 +1,173 @@
+"""Unit tests for evaluators.py."""
+
+import numpy as np
+import pytest
+
+from process.evaluators import Evaluators
+from process.fortran import numerics
+
+EPSFCN = 1.0e-3
+XV = np.array([1.5, -0.7, 0.3])
+N = XV.shape[0]
+M = 3
+
+
+class StubCaller:
+    """Stand-in for Caller that evaluates an analytic problem.
+
+    Records every point the models are evaluated at.
+    """
+
+    def __init__(self):
+        self.points = []
+
+    @staticmethod
+    def functions(x):
+        """Objective and constraint functions of the stub problem.
+
+        :param x: optimisation parameters
+        :type x: np.ndarray
+        :return: objective function and constraints
+        :rtype: tuple[float, np.ndarray]
+        """
+        objf = x[0] ** 2 + 3.0 * x[0] * x[1] + np.sin(x[2])
+        conf = np.array([x[0] - x[1] * x[2], x[1] ** 3, np.exp(x[2]) - x[0]])
+        return objf, conf
+
+    def call_models(self, xc, m):
+        """Evaluate the stub problem at xc.
+
+        :param xc: optimisation parameters
+        :type xc: np.ndarray
+        :param m: number of constraints
+        :type m: int
+        :return: objective function and constraints
+        :rtype: tuple[float, np.ndarray]
+        """
+        self.points.append(np.array(xc, copy=True))
+        objf, conf = self.functions(xc)
+        return objf, conf[:m]
+
+
+@pytest.fixture
+def evaluators(monkeypatch):
+    """Provides Evaluators calling the stub problem instead of the models.
+
+    :param monkeypatch: pytest fixture
+    :type monkeypatch: MonkeyPatch
+    :returns: evaluators whose caller is a StubCaller
+    :rtype: process.evaluators.Evaluators
+    """
+    monkeypatch.setattr(numerics, "epsfcn", EPSFCN)
+
+    evaluators = Evaluators(None, XV)
+    evaluators.caller = StubCaller()
+    return evaluators
+
+
+def test_fcnvmc2(evaluators):
+    """Check the gradients are the central differences about xv.
+
+    Each variable is perturbed in turn, then the models are evaluated at xv.
+    """
+    fgrd, cnorm = evaluators.fcnvmc2(N, M, XV, N)
+
+    exp_fgrd = np.zeros(N)
+    exp_cnorm = np.zeros((N, M))
+    for i in range(N):
+        xfor = XV.copy()
+        xbac = XV.copy()
+        xfor[i] = XV[i] * (1.0 + EPSFCN)
+        xbac[i] = XV[i] * (1.0 - EPSFCN)
+        ffor, cfor = StubCaller.functions(xfor)
+        fbac, cbac = StubCaller.functions(xbac)
+        exp_fgrd[i] = (ffor - fbac) / (xfor[i] - xbac[i])
+        exp_cnorm[i, :] = (cfor - cbac) / (xfor[i] - xbac[i])
+
+    assert fgrd == pytest.approx(exp_fgrd)
+    assert cnorm == pytest.approx(exp_cnorm)
+    assert cnorm.flags.f_contiguous
+
+    # Only the ith variable is perturbed, in a forward then backward step each
+    points = evaluators.caller.points
+    assert len(points) == 2 * N + 1
+    np.testing.assert_array_equal(points[-1], XV)
+    for i in range(N):
+        for point, factor in zip(
+            points[2 * i : 2 * i + 2], (1.0 + EPSFCN, 1.0 - EPSFCN), strict=True
+        ):
+            exp_point = XV.copy()
+            exp_point[i] = XV[i] * factor
+            np.testing.assert_array_equal(point, exp_point)
+
+    # xv itself is left unchanged
+    np.testing.assert_array_equal(XV, [1.5, -0.7, 0.3])
+
+
+def test_fcnvmc_fused(evaluators):
+    """Check the fused evaluator matches fcnvmc1 and fcnvmc2 called separately.
+
+    It makes one fewer model evaluation, the last of which is at xv.
+    """
+    objf, conf = evaluators.fcnvmc1(N, M, XV, 0)
+    fgrd, cnorm = evaluators.fcnvmc2(N, M, XV, N)
+    assert len(evaluators.caller.points) == 2 * N + 2
+
+    evaluators.caller.points.clear()
+    fused_objf, fused_conf, fused_fgrd, fused_cnorm = evaluators.fcnvmc_fused(
+        N, M, XV, N
+    )
+
+    assert fused_objf == objf
+    np.testing.assert_array_equal(fused_conf, conf)
+    np.testing.assert_array_equal(fused_fgrd, fgrd)
+    np.testing.assert_array_equal(fused_cnorm, cnorm)
+
+    points = evaluators.caller.points
+    assert len(points) == 2 * N + 1
+    np.testing.assert_array_equal(points[-1], XV)
+
+
+class OverridingEvaluators(Evaluators):
+    """Evaluators with an overridden fcnvmc1 that counts its calls."""
+
+    def __init__(self, models, x):
+        super().__init__(models, x)
+        self.fcnvmc1_calls = 0
+
+    def fcnvmc1(self, n, m, xv, ifail):
+        """Count the call, then evaluate as Evaluators does.
+
+        :param n: number of variables
+        :type n: int
+        :param m: number of constraints
+        :type m: int
+        :param xv: scaled variable values, length n
+        :type xv: numpy.array
+        :param ifail: ifail error flag
+        :type ifail: int
+        :return: objective function and constraints
+        :rtype: tuple
+        """
+        self.fcnvmc1_calls += 1
+        return super().fcnvmc1(n, m, xv, ifail)
+
+
+def test_fcnvmc_fused_overridden(monkeypatch):
+    """Check overridden evaluators are called rather than fused."""
+    monkeypatch.setattr(numerics, "epsfcn", EPSFCN)
+
+    evaluators = OverridingEvaluators(None, XV)
+    evaluators.caller = StubCaller()
+
+    objf, _, _, cnorm = evaluators.fcnvmc_fused(N, M, XV, N)
+
+    assert evaluators.fcnvmc1_calls == 1
+
+    # fcnvmc1, the finite differences, then fcnvmc2's restore at xv
+    points = evaluators.caller.points
+    assert len(points) == 2 * N + 2
+    np.testing.assert_array_equal(points[0], XV)
+    np.testing.assert_array_equal(points[-1], XV)
+    assert objf == StubCaller.functions(XV)[0]
+    assert cnorm.flags.f_contiguous
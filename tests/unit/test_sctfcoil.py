@@ -1,6 +1,8 @@
 from typing import Any, NamedTuple
 
+import numpy as np
 import pytest
+from scipy import optimize
 
 from process import superconducting_tf_coil as sctf
 from process.fortran import (
@@ -11,6 +13,7 @@ from process.fortran import (
     tfcoil_variables,
 )
 from process.superconducting_tf_coil import SuperconductingTFCoil
+from process.utilities.f2py_string_patch import string_to_f2py_compatible
 
 
 @pytest.fixture
@@ -386,6 +389,130 @@ def test_supercon(superconparam, monkeypatch, sctfcoil):
     assert tmarg == pytest.approx(superconparam.expected_tmarg)
 
 
+class SuperconSecantStartParam(NamedTuple):
+    isumat: Any = None
+
+    tmargmin_tf: Any = None
+
+    bmax: Any = None
+
+    expected_t_guesses: Any = None
+
+    expected_temp_margin: Any = None
+
+
+@pytest.mark.parametrize(
+    "superconsecantstartparam",
+    (
+        SuperconSecantStartParam(
+            isumat=7,
+            tmargmin_tf=1.5,
+            bmax=6.0,
+            expected_t_guesses=(6.25, 7.75),
+            expected_temp_margin=1.42293766,
+        ),
+        SuperconSecantStartParam(
+            isumat=7,
+            tmargmin_tf=1.5,
+            bmax=12.48976756562082,
+            expected_t_guesses=(6.25, 7.75),
+            expected_temp_margin=-2.47089639,
+        ),
+        SuperconSecantStartParam(
+            isumat=5,
+            tmargmin_tf=0.0,
+            bmax=12.48976756562082,
+            expected_t_guesses=(4.75, 9.5),
+            expected_temp_margin=2.34312129,
+        ),
+    ),
+)
+def test_supercon_secant_start(superconsecantstartparam, monkeypatch, sctfcoil):
+    """
+    Tests where supercon starts the temperature margin secant iteration.
+
+    The iteration starts at thelium + tmargmin_tf when a minimum margin is set,
+    and at thelium and 2 * thelium otherwise. At 12.5 T the Nb-Ti coil is
+    overloaded, and converges to a negative margin from the new starting points
+    where the old ones diverged to nan.
+
+    :param superconsecantstartparam: the data used to mock and assert in this test.
+    :type superconsecantstartparam: superconsecantstartparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+
+    :param sctfcoil: initialised SuperconductingTFCoil object
+    :type sctfcoil: process.sctfcoil.SuperconductingTFCoil
+    """
+    # Record the starting points of each secant iteration
+    t_guesses = []
+    original_secant_root = sctf.secant_root
+
+    def secant_root(func, x0, x1, *args, **kwargs):
+        t_guesses.append((x0, x1))
+        return original_secant_root(func, x0, x1, *args, **kwargs)
+
+    monkeypatch.setattr(sctf, "secant_root", secant_root)
+
+    monkeypatch.setattr(
+        tfcoil_variables, "tmargmin_tf", superconsecantstartparam.tmargmin_tf
+    )
+
+    monkeypatch.setattr(tfcoil_variables, "n_tf_coils", 16)
+
+    monkeypatch.setattr(tfcoil_variables, "temp_margin", 0)
+
+    monkeypatch.setattr(tfcoil_variables, "jwdgpro", 0)
+
+    monkeypatch.setattr(
+        tfcoil_variables, "dia_tf_turn_coolant_channel", 0.010000000000000002
+    )
+
+    monkeypatch.setattr(tfcoil_variables, "c_tf_turn", 74026.751437500003)
+
+    monkeypatch.setattr(tfcoil_variables, "bmaxtfrp", superconsecantstartparam.bmax)
+
+    monkeypatch.setattr(tfcoil_variables, "str_tf_con_res", -0.0050000000000000001)
+
+    monkeypatch.setattr(tfcoil_variables, "b_crit_upper_nbti", 14.859999999999999)
+
+    monkeypatch.setattr(tfcoil_variables, "i_str_wp", 1)
+
+    monkeypatch.setattr(tfcoil_variables, "str_wp", 0.0015619754370069119)
+
+    monkeypatch.setattr(tfcoil_variables, "t_crit_nbti", 9.0399999999999991)
+
+    monkeypatch.setattr(global_variables, "run_tests", 0)
+
+    sctfcoil.supercon(
+        isumat=superconsecantstartparam.isumat,
+        acs=0.001293323051622732,
+        aturn=0.0032012300777680192,
+        bmax=superconsecantstartparam.bmax,
+        fcu=0.80884,
+        fhe=0.30000000000000004,
+        fhts=0.5,
+        iop=74026.751437500003,
+        jwp=23124470.793774806,
+        tdmptf=25.829000000000001,
+        tfes=9548964780.4287167,
+        thelium=4.75,
+        tmax=150,
+        bcritsc=24,
+        tcritsc=16,
+        output=False,
+    )
+
+    assert t_guesses == [superconsecantstartparam.expected_t_guesses]
+
+    assert np.isfinite(tfcoil_variables.temp_margin)
+
+    assert tfcoil_variables.temp_margin == pytest.approx(
+        superconsecantstartparam.expected_temp_margin
+    )
+
+
 class PeakTfWithRippleParam(NamedTuple):
     tf_fit_t: Any = None
 
@@ -1517,6 +1644,209 @@ def test_tf_wp_currents(tfwpcurrentsparam, monkeypatch, sctfcoil):
     assert tfcoil_variables.j_tf_wp == pytest.approx(tfwpcurrentsparam.expected_j_tf_wp)
 
 
+class CrocoVoltageParam(NamedTuple):
+    quench_model: Any = None
+
+    time_constant: Any = None
+
+    expected_voltage: Any = None
+
+
+@pytest.mark.parametrize(
+    "crocovoltageparam",
+    (
+        CrocoVoltageParam(
+            quench_model="linear", time_constant="time2", expected_voltage=2.5e3
+        ),
+        CrocoVoltageParam(
+            quench_model="exponential", time_constant="tau2", expected_voltage=2.5e3
+        ),
+        CrocoVoltageParam(
+            quench_model="other", time_constant=None, expected_voltage=0.0
+        ),
+    ),
+)
+def test_croco_voltage(crocovoltageparam, monkeypatch, sctfcoil):
+    """
+    Tests croco_voltage for each quench model. The dump time is stored in the
+    sctfcoil_module variable named by time_constant, if any.
+
+    :param crocovoltageparam: the data used to mock and assert in this test.
+    :type crocovoltageparam: crocovoltageparam
+
+    :param monkeypatch: pytest fixture used to mock module/class variables
+    :type monkeypatch: _pytest.monkeypatch.monkeypatch
+    """
+    monkeypatch.setattr(
+        tfcoil_variables,
+        "quench_model",
+        string_to_f2py_compatible(
+            tfcoil_variables.quench_model, crocovoltageparam.quench_model
+        ),
+    )
+    monkeypatch.setattr(tfcoil_variables, "tdmptf", 20.0)
+    monkeypatch.setattr(tfcoil_variables, "n_tf_coils", 16.0)
+    monkeypatch.setattr(tfcoil_variables, "c_tf_turn", 80.0e3)
+    monkeypatch.setattr(sctfcoil_module, "e_tf_magnetic_stored_total", 32.0e9)
+    monkeypatch.setattr(sctfcoil_module, "time2", 0.0)
+    monkeypatch.setattr(sctfcoil_module, "tau2", 0.0)
+
+    assert sctfcoil.croco_voltage() == pytest.approx(crocovoltageparam.expected_voltage)
+
+    if crocovoltageparam.time_constant is not None:
+        assert getattr(
+            sctfcoil_module, crocovoltageparam.time_constant
+        ) == pytest.approx(20.0)
+
+
+class CrocoConductorGeometryParam(NamedTuple):
+    t_conductor: Any = None
+
+    dx_tf_turn_steel: Any = None
+
+    expected_croco_od: Any = None
+
+    expected_conductor_acs: Any = None
+
+    expected_conductor_area: Any = None
+
+    expected_conductor_jacket_area: Any = None
+
+    expected_conductor_jacket_fraction: Any = None
+
+
+@pytest.mark.parametrize(
+    "crococonductorgeometryparam",
+    (
+        CrocoConductorGeometryParam(
+            t_conductor=0.06,
+            dx_tf_turn_steel=0.008,
+            expected_croco_od=0.014666666666666668,
+            expected_conductor_acs=0.0015205308443374602,
+            expected_conductor_area=0.0036,
+            expected_conductor_jacket_area=0.0020794691556625397,
+            expected_conductor_jacket_fraction=0.5776303210173722,
+        ),
+    ),
+)
+def test_croco_conductor_geometry(crococonductorgeometryparam):
+    """
+    Tests the CroCo conductor geometry for a 6 cm conductor.
+
+    :param crococonductorgeometryparam: the data used to assert in this test.
+    :type crococonductorgeometryparam: crococonductorgeometryparam
+    """
+    (
+        croco_od,
+        conductor_acs,
+        conductor_area,
+        conductor_jacket_area,
+        conductor_jacket_fraction,
+    ) = sctf.croco_conductor_geometry(
+        crococonductorgeometryparam.t_conductor,
+        crococonductorgeometryparam.dx_tf_turn_steel,
+    )
+
+    assert croco_od == pytest.approx(crococonductorgeometryparam.expected_croco_od)
+
+    assert conductor_acs == pytest.approx(
+        crococonductorgeometryparam.expected_conductor_acs
+    )
+
+    assert conductor_area == pytest.approx(
+        crococonductorgeometryparam.expected_conductor_area
+    )
+
+    assert conductor_jacket_area == pytest.approx(
+        crococonductorgeometryparam.expected_conductor_jacket_area
+    )
+
+    assert conductor_jacket_fraction == pytest.approx(
+        crococonductorgeometryparam.expected_conductor_jacket_fraction
+    )
+
+
+class ClampStrainParam(NamedTuple):
+    strain: Any = None
+
+    limit: Any = None
+
+    expected_strain: Any = None
+
+
+@pytest.mark.parametrize(
+    "clampstrainparam",
+    (
+        ClampStrainParam(strain=-0.01, limit=0.5e-2, expected_strain=-0.5e-2),
+        ClampStrainParam(strain=0.008, limit=0.7e-2, expected_strain=0.7e-2),
+        ClampStrainParam(strain=0.003, limit=0.5e-2, expected_strain=0.003),
+    ),
+)
+def test_clamp_strain(clampstrainparam):
+    """
+    Tests the strain is limited in magnitude while keeping its sign.
+
+    :param clampstrainparam: the data used to assert in this test.
+    :type clampstrainparam: clampstrainparam
+    """
+    assert (
+        sctf.clamp_strain(clampstrainparam.strain, clampstrainparam.limit)
+        == clampstrainparam.expected_strain
+    )
+
+
+def test_secant_root():
+    """Tests the secant solver matches scipy's secant method."""
+
+    def func(x, a):
+        return x**3 - a
+
+    expected = optimize.newton(func, 2.0, args=(10.0,), x1=4.0, tol=1e-6, rtol=1e-6)
+    assert sctf.secant_root(func, 2.0, 4.0, (10.0,), tol=1e-6, rtol=1e-6) == expected
+
+    with pytest.raises(RuntimeError):
+        sctf.secant_root(func, 2.0, 4.0, (10.0,), maxiter=2)
+
+    # Equal estimates are rejected, as by scipy
+    with pytest.raises(ValueError, match="x1 and x0 must be different"):
+        sctf.secant_root(func, 2.0, 2.0, (10.0,))
+
+    # A flat function stalls the iteration
+    with pytest.raises(RuntimeError, match="Tolerance of"):
+        sctf.secant_root(lambda _x: 1.0, 2.0, 4.0)
+
+
+class LambdaTermParam(NamedTuple):
+    tau: Any = None
+
+    omega: Any = None
+
+    expected_lambda_term: Any = None
+
+
+@pytest.mark.parametrize(
+    "lambdatermparam",
+    (
+        LambdaTermParam(tau=0.5, omega=0.3, expected_lambda_term=-0.22133442239500353),
+        LambdaTermParam(tau=1.0, omega=0.5, expected_lambda_term=0.8003774225686292),
+        LambdaTermParam(tau=0.5, omega=1.6, expected_lambda_term=0.8244172384857674),
+        LambdaTermParam(tau=-1.0, omega=2.0, expected_lambda_term=-0.906899682117109),
+    ),
+)
+def test_lambda_term(lambdatermparam):
+    """
+    Tests the lambda term of the VV theta factor integral (Itoh et al, appendix
+    A) on both branches: the logarithm for omega below 1 and the arcsin for
+    omega above 1.
+
+    :param lambdatermparam: the data used to assert in this test.
+    :type lambdatermparam: lambdatermparam
+    """
+    assert sctf.lambda_term(
+        lambdatermparam.tau, lambdatermparam.omega
+    ) == pytest.approx(lambdatermparam.expected_lambda_term)
+
+
 def test_vv_stress_on_quench():
     """Tests the VV stress on TF quench model presented in Itoh et al using the
     values they use to test the model for JA DEMO concept.
@@ -1552,6 +1882,46 @@ def test_vv_stress_on_quench():
     )
 
 
+def test_vv_stress_on_quench_equal_decay_rates():
+    """Tests the VV stress stays finite and continuous when the TF coil discharge
+    rate (1/taud) equals the decay rate of the coil structure current, using the
+    JA DEMO values of test_vv_stress_on_quench with taud = 5.045717246295409,
+    where the two rates agree to rounding.
+    """
+    taud = 5.045717246295409
+    stresses = []
+    for _ in range(7):
+        stresses.append(
+            sctf.vv_stress_on_quench(
+                # TF shape
+                H_coil=9.5,
+                ri_coil=3.55,
+                ro_coil=15.62,
+                rm_coil=7.66,
+                ccl_length_coil=51.1,
+                theta1_coil=48,
+                # VV shape
+                H_vv=7.9,
+                ri_vv=4.45,
+                ro_vv=13.09,
+                rm_vv=7.88,
+                theta1_vv=1,
+                # TF properties
+                n_tf_coils=18,
+                n_tf_coil_turns=192,
+                s_rp=0.55,
+                s_cc=0.94,
+                taud=taud,
+                i_op=83200,
+                # VV properties
+                d_vv=0.12,
+            )
+        )
+        taud = np.nextafter(taud, np.inf)
+
+    assert stresses == pytest.approx([159581907.8053985] * 7, rel=1e-12)
+
+
 def test_vv_stress_on_quench_integration(sctfcoil, monkeypatch):
     """Tests the VV stress on TF quench model presented in Itoh et al using the
     values they use to test the model for JA DEMO concept. Includes the assumptions
@@ -0,0 +1,118 @@
+"""Unit tests for solver.py."""
+
+import numpy as np
+import pytest
+
+from process.solver import VmconProblem
+
+
+class CountingEvaluator:
+    """Fake evaluator that counts its evaluations.
+
+    Each evaluation returns fresh arrays filled with the evaluation count.
+    """
+
+    def __init__(self):
+        self.evaluations = 0
+
+    def fcnvmc_fused(self, n, m, _xv, lcnorm):
+        """Return the objective, constraints and their gradients.
+
+        :param n: number of variables
+        :type n: int
+        :param m: number of constraints
+        :type m: int
+        :param _xv: scaled variable values, length n
+        :type _xv: numpy.array
+        :param lcnorm: number of columns in cnorm
+        :type lcnorm: int
+        :return: objf, conf(m), fgrd(n) and column-major cnorm(lcnorm, m)
+        :rtype: tuple
+        """
+        self.evaluations += 1
+        count = float(self.evaluations)
+        return (
+            count,
+            np.full(m, count),
+            np.full(n, count),
+            np.full((lcnorm, m), count, order="F"),
+        )
+
+
+@pytest.fixture
+def evaluator():
+    """Provides a CountingEvaluator.
+
+    :returns: fake evaluator
+    :rtype: CountingEvaluator
+    """
+    return CountingEvaluator()
+
+
+@pytest.fixture
+def problem(evaluator):
+    """Provides a VmconProblem with 1 equality and 2 inequality constraints.
+
+    :param evaluator: fake evaluator
+    :type evaluator: CountingEvaluator
+    :returns: problem evaluated by the fake evaluator
+    :rtype: process.solver.VmconProblem
+    """
+    return VmconProblem(evaluator, 1, 2)
+
+
+def test_vmcon_problem_cache(problem, evaluator):
+    """Check evaluations are cached on the exact bytes of x."""
+    x = np.array([1.0, 2.0])
+    result = problem(x)
+    assert evaluator.evaluations == 1
+
+    # Same bytes, different array: cache hit
+    assert problem(x.copy()) is result
+    assert evaluator.evaluations == 1
+
+    # Different x: cache miss
+    assert problem(np.array([1.0, 2.0 + 1e-15])) is not result
+    assert evaluator.evaluations == 2
+
+
+def test_vmcon_problem_eviction(problem, evaluator):
+    """Check the oldest evaluation is evicted after cache_size entries."""
+    points = [np.array([float(i), 0.0]) for i in range(problem.cache_size + 1)]
+    for x in points:
+        problem(x)
+    assert evaluator.evaluations == problem.cache_size + 1
+
+    # The most recent points are still cached...
+    problem(points[-1])
+    problem(points[1])
+    assert evaluator.evaluations == problem.cache_size + 1
+
+    # ...but the first has been evicted
+    problem(points[0])
+    assert evaluator.evaluations == problem.cache_size + 2
+
+
+def test_vmcon_problem_invalidate(problem, evaluator):
+    """Check invalidate() forces the next call to re-evaluate."""
+    x = np.array([1.0, 2.0])
+    problem(x)
+    problem.invalidate()
+    assert problem(x).f == 2.0
+    assert evaluator.evaluations == 2
+
+
+def test_vmcon_problem_result(problem):
+    """Check the shapes and layout of the Result returned to pyvmcon."""
+    result = problem(np.array([1.0, 2.0]))
+
+    assert result.f == 1.0
+    assert result.df.shape == (2,)
+    assert result.eq.shape == (1,)
+    assert result.ie.shape == (2,)
+    assert result.deq.shape == (1, 2)
+    assert result.die.shape == (2, 2)
+    assert result.deq.flags.c_contiguous
+    assert result.die.flags.c_contiguous
+    assert problem.num_equality == 1
+    assert problem.num_inequality == 2